@@ -0,0 +1,255 @@
+"""
+Local web fixtures for benchmarks: development and operator sites, news
+pages and a SerpAPI stand-in, all served by one HTTP server.
+
+Sites are routed by Host header (*.localhost names resolve to loopback in
+Chromium), so crawls spread over many "domains" as they do in production:
+
+  http://{development-slug}.localhost:{port}/       development's own site
+  http://{operator-slug}.localhost:{port}/{slug}    operator's page for it
+  http://news{n}.localhost:{port}/articles/{i}      news article (discover)
+  http://127.0.0.1:{port}/search.json               SerpAPI organic results
+
+Pages are rendered from a SyntheticDataset. With `recorded_dir`, a file at
+{recorded_dir}/{host}/{path}.html (index.html for "/") is served instead,
+so real recorded pages can be mixed in.
+
+fixture_reply() answers Claude prompts for these pages (for the Anthropic
+stub): it reads the facts sentence every page carries, like a model would.
+"""
+
+import json
+import random
+import re
+import threading
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from synthetic import PageFacts, SyntheticDataset, facts_sentence, new_development_facts, street_for
+
+NEWS_HOSTS = 8
+DEVELOPMENTS_PER_ARTICLE = 3
+
+_FILLER = [
+    "Residents enjoy a concierge, co-working lounge, gym and roof terrace with views across the city.",
+    "Every apartment is professionally managed, with flexible tenancies and pet-friendly homes.",
+    "The scheme sits a short walk from the station, with cycle storage and EV charging on site.",
+    "Homes range from studios to three-bedroom apartments, all with fibre broadband included.",
+    "A programme of resident events runs throughout the year, from supper clubs to fitness classes.",
+    "Landscaped courtyards and a residents' garden provide green space at the heart of the building.",
+]
+
+# synthetic.facts_sentence(), which every page carries
+_FACTS_SENTENCE = re.compile(
+    r"(?P<name>[A-Z][^.\n]*?) is a build to rent scheme in (?P<area>[^.\n,]+?) with "
+    r"(?P<units>\d+) homes, operated by (?P<operator>[^.\n]+?)\. "
+    r"Status: (?P<status>[^.\n]+?)\. Postcode: (?P<postcode>[A-Z0-9 ]+?)\."
+)
+
+
+def _page(title: str, site_name: str, body: str) -> str:
+    """A page with the navigation, cookie banner and footer real sites repeat."""
+    return f"""<!doctype html>
+<html><head><title>{escape(title)}</title></head>
+<body>
+<nav><a href="/">Home</a> <a href="/apartments">Apartments</a> <a href="/neighbourhood">Neighbourhood</a>
+<a href="/contact">Contact</a> <a href="/book-a-viewing">Book a viewing</a></nav>
+<div class="cookies"><p>We use cookies to give you the best experience on our website.
+<a href="/cookies">Accept all</a> <a href="/cookies#manage">Manage preferences</a></p></div>
+<main>
+{body}
+</main>
+<footer><p>&copy; 2026 {escape(site_name)}. All rights reserved.</p>
+<p><a href="/privacy">Privacy policy</a> | <a href="/terms">Terms</a> | <a href="/careers">Careers</a></p>
+<p>Registered in England and Wales.</p></footer>
+</body></html>"""
+
+
+def development_page(facts: PageFacts, site_name: str) -> str:
+    rng = random.Random(facts.name)
+    filler = "\n".join(f"<p>{escape(line)}</p>" for line in rng.sample(_FILLER, 4))
+    body = f"""<h1>{escape(facts.name)}</h1>
+<p>{escape(facts_sentence(facts))}</p>
+{filler}
+<h2>Find us</h2>
+<p>{escape(facts.name)}, {escape(street_for(facts))}, {escape(facts.area)} {escape(facts.postcode)}</p>"""
+    return _page(f"{facts.name} | {site_name}", site_name, body)
+
+
+def article_page(index: int, mentions: list[PageFacts]) -> str:
+    rng = random.Random(index)
+    paragraphs = []
+    for facts in mentions:
+        paragraphs.append(f"<h2>{escape(facts.name)}</h2>")
+        paragraphs.append(f"<p>{escape(facts_sentence(facts))}</p>")
+        paragraphs.append(f"<p>{escape(rng.choice(_FILLER))}</p>")
+    body = f"<h1>Build to rent round-up #{index}</h1>\n" + "\n".join(paragraphs)
+    return _page(f"BTR news #{index}", f"News {index % NEWS_HOSTS + 1}", body)
+
+
+def fixture_reply(prompt: str) -> str:
+    """Reply to a verify or discover prompt from the facts sentences in it."""
+    found = [m.groupdict() for m in _FACTS_SENTENCE.finditer(prompt)]
+    if '"developments"' in prompt:
+        return json.dumps({"developments": [
+            {
+                "name": f["name"], "area": f["area"], "number_of_units": int(f["units"]),
+                "operator_name": f["operator"], "status": f["status"], "postcode": f["postcode"],
+            }
+            for f in found
+        ]})
+    if not found:
+        return "{}"
+    f = found[0]
+    reply = {
+        "name": f["name"], "area": f["area"], "number_of_units": int(f["units"]),
+        "operator_name": f["operator"], "status": f["status"], "postcode": f["postcode"],
+    }
+    reply.update({f"{key}_confidence": "HIGH" for key in list(reply)})
+    return json.dumps(reply)
+
+
+class FixtureSite:
+    """Routes fixture requests to pages (thread-safe, pages rendered on demand)."""
+
+    def __init__(self, recorded_dir: Optional[Path] = None):
+        self.recorded_dir = Path(recorded_dir) if recorded_dir else None
+        self.lock = threading.Lock()
+        self.port = 0
+        self.load(SyntheticDataset())
+
+        # Counters
+        self.pages_served = 0
+        self.not_found = 0
+        self.searches = 0
+
+    def load(self, dataset: SyntheticDataset, article_count: int = 0) -> None:
+        """Serve `dataset` (generated for this server's port) and `article_count` news articles."""
+        with self.lock:
+            self.dataset = dataset
+            self.article_count = article_count
+            self._rows = dataset.developments
+            self._by_slug = {row["slug"]: row for row in dataset.developments}
+            self._new_names: set[str] = {facts.name for facts in dataset.facts.values()}
+            self._articles: dict[int, list[PageFacts]] = {}
+
+    def article_urls(self) -> list[str]:
+        return [
+            f"http://news{i % NEWS_HOSTS + 1}.localhost:{self.port}/articles/{i}"
+            for i in range(self.article_count)
+        ]
+
+    def news_hosts(self) -> list[str]:
+        return [f"news{i + 1}.localhost:{self.port}" for i in range(NEWS_HOSTS)]
+
+    def _article_mentions(self, index: int) -> list[PageFacts]:
+        """Two developments from the database and one that's new, stable per article."""
+        with self.lock:
+            if index not in self._articles:
+                rng = random.Random(index)
+                mentions = []
+                for row in rng.sample(self._rows, min(DEVELOPMENTS_PER_ARTICLE - 1, len(self._rows))):
+                    mentions.append(self.dataset.facts[row["id"]])
+                mentions.append(new_development_facts(rng, self._new_names))
+                self._articles[index] = mentions
+            return self._articles[index]
+
+    def search_results(self) -> dict:
+        with self.lock:
+            self.searches += 1
+        return {"organic_results": [
+            {"title": f"BTR news #{i}", "link": url, "snippet": "Build to rent schemes announced this month."}
+            for i, url in enumerate(self.article_urls())
+        ]}
+
+    def _recorded(self, host: str, path: str) -> Optional[str]:
+        if self.recorded_dir is None:
+            return None
+        name = path.strip("/") or "index"
+        candidate = (self.recorded_dir / host.split(":")[0] / f"{name}.html").resolve()
+        if self.recorded_dir.resolve() in candidate.parents and candidate.is_file():
+            return candidate.read_text(encoding="utf-8", errors="replace")
+        return None
+
+    def page(self, host: str, path: str) -> Optional[str]:
+        """HTML for host+path, or None for a 404."""
+        recorded = self._recorded(host, path)
+        if recorded is not None:
+            return recorded
+
+        label = host.split(":")[0].removesuffix(".localhost")
+        dataset = self.dataset
+        if label in dataset.site_hosts and path.strip("/") == "":
+            facts = dataset.facts[dataset.site_hosts[label]]
+            return None if facts.dead else development_page(facts, facts.name)
+
+        if label in dataset.operator_hosts:
+            row = self._by_slug.get(path.strip("/"))
+            if row is None or row["operator_id"] != dataset.operator_hosts[label]["id"]:
+                return None
+            facts = dataset.facts[row["id"]]
+            return None if facts.dead else development_page(facts, dataset.operator_hosts[label]["name"])
+
+        match = re.fullmatch(r"news\d+", label)
+        article = re.fullmatch(r"/articles/(\d+)/?", path)
+        if match and article and int(article.group(1)) < self.article_count:
+            index = int(article.group(1))
+            return article_page(index, self._article_mentions(index))
+        return None
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    site: FixtureSite  # set on the server class by create_fixture_server
+
+    def log_message(self, format, *args):  # noqa: A002 - silence default access log
+        pass
+
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        site = self.site
+        parsed = urlparse(self.path)
+        if parsed.path == "/search.json":
+            if not parse_qs(parsed.query).get("api_key"):
+                self._send(401, json.dumps({"error": "Invalid API key"}), "application/json")
+                return
+            self._send(200, json.dumps(site.search_results()), "application/json")
+            return
+
+        html = site.page(self.headers.get("Host", ""), parsed.path)
+        with site.lock:
+            if html is None:
+                site.not_found += 1
+            else:
+                site.pages_served += 1
+        if html is None:
+            self._send(404, "<html><body><h1>Page not found</h1></body></html>", "text/html; charset=utf-8")
+        else:
+            self._send(200, html, "text/html; charset=utf-8")
+
+
+def start_fixture_server(
+    recorded_dir: Optional[Path] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> tuple[ThreadingHTTPServer, FixtureSite]:
+    """
+    Start the fixture server on a background thread. It serves nothing until
+    site.load() is given a dataset generated for site.port.
+    """
+    site = FixtureSite(recorded_dir)
+    handler = type("BoundFixtureHandler", (FixtureHandler,), {"site": site})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    site.port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, site
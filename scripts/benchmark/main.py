@@ -0,0 +1,283 @@
+"""
+Offline end-to-end benchmark: runs the real verify and discover pipelines
+against local stand-ins and reports listings/min, stage latencies and peak
+RSS at each dataset size.
+
+Stand-ins (all on 127.0.0.1, started in this process):
+  - fixture_server: development/operator/news pages and SerpAPI results
+  - stub_postcodes_server: postcodes.io single and bulk lookups
+  - verify/stub_anthropic_server: Messages/Batches API with configurable
+    latency and 429 rate
+  - stub_postgrest_server: Supabase PostgREST over SQLite, seeded with
+    synthetic developments
+
+Each tool runs as a subprocess with BTR_ENV_FILE pointing at a generated
+.env, so nothing touches scripts/.env, the real output directory or any
+paid API. Crawls still go through crawl4ai's Chromium (pages are served
+from *.localhost hosts, which Chromium resolves to loopback).
+
+Usage:
+  python scripts/benchmark/main.py                              # 100, 1k, 10k listings
+  python scripts/benchmark/main.py --sizes 100 --tools verify
+  python scripts/benchmark/main.py --llm-latency 1.5 --rate-limit-rate 0.05
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCHMARK_DIR.parent
+sys.path.insert(0, str(SCRIPTS_DIR / "verify"))
+
+from fixture_server import fixture_reply, start_fixture_server
+from stub_anthropic_server import start_stub_server
+from stub_postcodes_server import start_postcodes_server
+from stub_postgrest_server import STUB_SERVICE_KEY, PostgrestStandIn, start_postgrest_server
+from synthetic import generate_dataset
+
+TOOLS = ("verify", "discover")
+DISCOVERY_QUERY = "build to rent"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline end-to-end throughput benchmark")
+    parser.add_argument("--sizes", type=str, default="100,1000,10000",
+                        help="Comma-separated listing counts (default: 100,1000,10000)")
+    parser.add_argument("--tools", type=str, default="verify,discover",
+                        help="Comma-separated tools to run (default: verify,discover)")
+    parser.add_argument("--no-llm", action="store_true", help="Run the tools with --no-llm")
+    parser.add_argument("--llm-batch", action="store_true", help="Run the tools with --llm-batch")
+    parser.add_argument("--llm-latency", type=float, default=0.5,
+                        help="Seconds the Anthropic stand-in waits per reply (default: 0.5)")
+    parser.add_argument("--llm-jitter", type=float, default=0.5,
+                        help="Extra random LLM delay of up to this many seconds (default: 0.5)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of Messages calls answered with 429 (default: 0)")
+    parser.add_argument("--postcode-latency", type=float, default=0.05,
+                        help="Seconds the postcodes.io stand-in waits per request (default: 0.05)")
+    parser.add_argument("--db-latency", type=float, default=0.02,
+                        help="Seconds the PostgREST stand-in waits per request (default: 0.02)")
+    parser.add_argument("--crawl-delay", type=float, default=0.0,
+                        help="CRAWL_DELAY_SECONDS for the tools (default: 0)")
+    parser.add_argument("--discover-max-urls", type=int, default=None,
+                        help="Cap discover's crawl (default: one article per 10 listings)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0)")
+    parser.add_argument("--recorded-dir", type=str,
+                        help="Serve recorded pages from {dir}/{host}/{path}.html where present")
+    parser.add_argument("--keep-output", action="store_true",
+                        help="Keep each run's working directory (reports, logs, timings)")
+    parser.add_argument("--output", type=str,
+                        help="Results JSON path (default: scripts/output/benchmark_{date}.json)")
+    return parser.parse_args()
+
+
+def write_env_file(path: Path, settings: dict[str, str]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for key, value in settings.items():
+            f.write(f"{key}={value}\n")
+
+
+def peak_rss_mb(ru_maxrss: int) -> float:
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(ru_maxrss / divisor, 1)
+
+
+def run_tool(tool: str, tool_args: list[str], settings: dict[str, str], env_file: Path, log_path: Path) -> dict:
+    """Run one tool to completion; wall time, exit code and the child's peak RSS."""
+    # The tools load BTR_ENV_FILE with override=True; the same settings go in
+    # the environment so they apply however dotenv resolves the file
+    env = dict(os.environ, **settings, BTR_ENV_FILE=str(env_file), PYTHONUNBUFFERED="1")
+    command = [sys.executable, str(SCRIPTS_DIR / tool / "main.py"), *tool_args]
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        process = subprocess.Popen(command, cwd=SCRIPTS_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    return {
+        "command": command[1:],
+        "exit_code": process.returncode,
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        "peak_rss_mb": peak_rss_mb(usage.ru_maxrss),
+        "log": str(log_path),
+    }
+
+
+def read_timings(output_dir: Path, prefix: str) -> Optional[dict]:
+    """The stage timings JSON the tool wrote (newest, if several)."""
+    paths = sorted(output_dir.glob(f"{prefix}_timings_*.json"), key=lambda p: p.stat().st_mtime)
+    if not paths:
+        return None
+    with open(paths[-1], encoding="utf-8") as f:
+        return json.load(f)
+
+
+def benchmark_size(size: int, tools: list[str], args) -> list[dict]:
+    """Seed the stand-ins with `size` listings and run each tool once."""
+    work_dir = Path(tempfile.mkdtemp(prefix=f"btr-benchmark-{size}-"))
+    output_dir = work_dir / "output"
+    output_dir.mkdir()
+
+    fixture_server, site = start_fixture_server(args.recorded_dir)
+    dataset = generate_dataset(size, seed=args.seed, port=site.port)
+    max_urls = args.discover_max_urls or max(1, size // 10)
+    site.load(dataset, article_count=max_urls)
+
+    db = PostgrestStandIn(work_dir / "postgrest.sqlite", latency=args.db_latency)
+    db.seed(dataset)
+    postgrest_server, supabase_url = start_postgrest_server(db)
+    postcodes_server, postcodes, postcodes_url = start_postcodes_server(latency=args.postcode_latency)
+    anthropic_server, anthropic_url = start_stub_server(
+        batch_seconds=2.0,
+        latency=args.llm_latency,
+        latency_jitter=args.llm_jitter,
+        rate_limit_rate=args.rate_limit_rate,
+        reply_fn=fixture_reply,
+        seed=args.seed,
+    )
+    llm = anthropic_server.RequestHandlerClass.state
+
+    settings = {
+        "SUPABASE_URL": supabase_url,
+        "SUPABASE_SERVICE_ROLE_KEY": STUB_SERVICE_KEY,
+        "ANTHROPIC_API_KEY": "stub",
+        "ANTHROPIC_BASE_URL": anthropic_url,
+        "POSTCODES_IO_URL": postcodes_url,
+        "SERPAPI_KEY": "stub",
+        "SERPAPI_URL": f"http://127.0.0.1:{site.port}/search.json",
+        "OUTPUT_DIR": str(output_dir),
+        "CRAWL_DELAY_SECONDS": str(args.crawl_delay),
+        "CRAWL_DOMAIN_DELAYS": ",".join(f"{host}={args.crawl_delay}" for host in site.news_hosts()),
+        "LLM_BATCH_POLL_SECONDS": "1",
+    }
+    env_file = work_dir / ".env"
+    write_env_file(env_file, settings)
+
+    shared = ["--cache-mode", "bypass", "--llm-cache-mode", "bypass", "--postcode-cache-mode", "bypass"]
+    if args.no_llm:
+        shared.append("--no-llm")
+    if args.llm_batch:
+        shared.append("--llm-batch")
+    tool_args = {
+        "verify": ["--all", *shared],
+        "discover": ["--query", DISCOVERY_QUERY, "--max-urls", str(max_urls), *shared],
+    }
+
+    results = []
+    try:
+        for tool in tools:
+            counters_before = (site.pages_served, llm.messages_served, llm.rate_limited,
+                               postcodes.postcodes_looked_up, db.requests)
+            print(f"  {tool} @ {size:,} listings ...", flush=True)
+            run = run_tool(tool, tool_args[tool], settings, env_file, work_dir / f"{tool}.log")
+
+            prefix = "verification" if tool == "verify" else "discovery"
+            timings = read_timings(output_dir, prefix)
+            # Verify processes every listing; discover every crawled article
+            items = size if tool == "verify" else max_urls
+            minutes = run["wall_seconds"] / 60
+            counters_after = (site.pages_served, llm.messages_served, llm.rate_limited,
+                              postcodes.postcodes_looked_up, db.requests)
+            served = [after - before for before, after in zip(counters_before, counters_after)]
+
+            result = {
+                "tool": tool,
+                "listings": size,
+                "items": items,
+                **run,
+                "items_per_minute": round(items / minutes, 1) if minutes else None,
+                "stages": (timings or {}).get("stages", {}),
+                "stand_ins": {
+                    "pages_served": served[0],
+                    "llm_messages": served[1],
+                    "llm_rate_limited": served[2],
+                    "postcodes_looked_up": served[3],
+                    "postgrest_requests": served[4],
+                },
+            }
+            results.append(result)
+            status = "ok" if run["exit_code"] == 0 else f"exit {run['exit_code']}, see {run['log']}"
+            print(f"    {result['items_per_minute']} {'listings' if tool == 'verify' else 'pages'}/min, "
+                  f"{run['wall_seconds']:.1f}s, peak RSS {run['peak_rss_mb']} MB ({status})")
+    finally:
+        for server in (fixture_server, postgrest_server, postcodes_server, anthropic_server):
+            server.shutdown()
+            server.server_close()
+        if not args.keep_output:
+            for result in results:
+                result["log"] = None
+            shutil.rmtree(work_dir, ignore_errors=True)
+        else:
+            print(f"  Kept {work_dir}")
+    return results
+
+
+def print_report(results: list[dict]) -> None:
+    print(f"\n{'=' * 78}")
+    print("BENCHMARK RESULTS")
+    print(f"{'=' * 78}")
+    print(f"  {'Tool':<9} {'Listings':>9} {'Items':>7} {'Items/min':>10} {'Wall (s)':>9} {'RSS (MB)':>9}  Exit")
+    for r in results:
+        rate = f"{r['items_per_minute']:.1f}" if r["items_per_minute"] is not None else "-"
+        print(f"  {r['tool']:<9} {r['listings']:>9,} {r['items']:>7,} {rate:>10} "
+              f"{r['wall_seconds']:>9.1f} {r['peak_rss_mb']:>9.1f}  {r['exit_code']}")
+
+    print("\n  Stage latencies (p50 / p95 / p99 seconds):")
+    for r in results:
+        if not r["stages"]:
+            continue
+        print(f"  {r['tool']} @ {r['listings']:,}:")
+        for stage, h in r["stages"].items():
+            print(f"    {stage:<12} {h['p50']:>7.3f} / {h['p95']:>7.3f} / {h['p99']:>7.3f}  ({h['count']} samples)")
+
+
+def main():
+    args = parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    tools = [t.strip() for t in args.tools.split(",") if t.strip()]
+    unknown = [t for t in tools if t not in TOOLS]
+    if unknown:
+        print(f"Unknown tool(s): {', '.join(unknown)} (choose from {', '.join(TOOLS)})")
+        sys.exit(1)
+
+    print(f"{'=' * 78}")
+    print("BTR OFFLINE BENCHMARK")
+    print(f"{'=' * 78}")
+    print(f"  Sizes: {', '.join(f'{s:,}' for s in sizes)}")
+    print(f"  Tools: {', '.join(tools)}")
+    print(f"  LLM: {'off' if args.no_llm else f'{args.llm_latency}s + up to {args.llm_jitter}s jitter'}"
+          f"{f', {args.rate_limit_rate:.0%} rate-limited' if args.rate_limit_rate else ''}")
+    print()
+
+    results = []
+    for size in sizes:
+        results.extend(benchmark_size(size, tools, args))
+
+    print_report(results)
+
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    output_path = Path(args.output) if args.output else SCRIPTS_DIR / "output" / f"benchmark_{date_str}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "generated_at": datetime.now().isoformat(),
+            "settings": {key: value for key, value in vars(args).items() if key != "output"},
+            "results": results,
+        }, f, indent=2)
+    print(f"\n  Results: {output_path}")
+
+    if any(r["exit_code"] != 0 for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+Microbenchmarks for the pure-Python hot paths of verify and discover.
+
+Times each function over synthetic inputs at 10^2-10^5 items and writes
+JSON results (with the git revision) so runs can be compared release to
+release:
+
+  compare_listing           verify/comparator.py
+  detect_rebranding         verify/crawler.py
+  postcode_to_region        verify/postcode.py
+  verify_writers            verify CSV + SQL + summary writers
+  deduplicate_developments  discover/deduplicator.py
+  check_against_database    discover/db_check.py
+  discover_writers          discover CSV + SQL writers
+
+Inputs are built before timing, fresh for every repeat (some functions
+mutate their input). The reported time is the best of --repeat runs.
+
+Usage:
+  python scripts/benchmark/microbench.py
+  python scripts/benchmark/microbench.py --scales 100,1000 --only compare_listing
+  python scripts/benchmark/microbench.py --duplicate-rate 0.6 --typo-rate 0.1
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCHMARK_DIR.parent
+
+from synthetic import (
+    crawl_results_for,
+    existing_names,
+    generate_dataset,
+    llm_extraction_for,
+    postcode_result,
+    postcode_samples,
+    raw_mentions,
+)
+
+DEFAULT_SCALES = "100,1000,10000,100000"
+
+_loaded_tool = None
+
+
+def import_tool(tool: str, *names: str) -> list:
+    """
+    Import modules from scripts/{tool}. verify and discover share module
+    names (models, output_csv, ...), so when switching tools the other
+    tool's same-named modules are dropped from sys.modules first. discover
+    also sees verify's shared modules, as discover/main.py arranges.
+    """
+    global _loaded_tool
+    verify_dir, discover_dir = SCRIPTS_DIR / "verify", SCRIPTS_DIR / "discover"
+    if tool != _loaded_tool:
+        shared = {p.stem for p in verify_dir.glob("*.py")} & {p.stem for p in discover_dir.glob("*.py")}
+        for name in shared:
+            sys.modules.pop(name, None)
+        _loaded_tool = tool
+    paths = [str(SCRIPTS_DIR / tool)] + ([str(verify_dir)] if tool == "discover" else [])
+    sys.path[:0] = paths
+    try:
+        return [importlib.import_module(name) for name in names]
+    finally:
+        del sys.path[:len(paths)]
+
+
+@dataclass
+class Options:
+    seed: int
+    duplicate_rate: float
+    typo_rate: float
+    work_dir: Path
+
+
+# --- Benchmarks: each setup(n, options) returns the callable to time ---
+
+def _verify_inputs(n: int, options: Options) -> list[tuple]:
+    """(listing, crawl_results, llm_analysis, postcode_data) per listing."""
+    models, postcode = import_tool("verify", "models", "postcode")
+    dataset = generate_dataset(n, seed=options.seed)
+    inputs = []
+    for row in dataset.developments:
+        crawls = [models.CrawlResult(**fields) for fields in crawl_results_for(dataset, row)]
+        analysis = llm_extraction_for(dataset, row, typo_rate=options.typo_rate)
+        located = postcode_result(dataset.facts[row["id"]].postcode)
+        lookup = postcode.PostcodeLookup(
+            postcode=located["postcode"],
+            latitude=located["latitude"],
+            longitude=located["longitude"],
+            region=postcode.map_ons_to_btr_region(located["region"], located["country"]),
+            admin_district=located["admin_district"],
+            valid=True,
+        ) if located else None
+        inputs.append((row, crawls, analysis, lookup))
+    return inputs
+
+
+def setup_compare_listing(n: int, options: Options) -> Callable[[], None]:
+    (comparator,) = import_tool("verify", "comparator")
+    inputs = _verify_inputs(n, options)
+
+    def run():
+        for listing, crawls, analysis, lookup in inputs:
+            comparator.compare_listing(listing, crawls, analysis, lookup)
+    return run
+
+
+def setup_detect_rebranding(n: int, options: Options) -> Callable[[], None]:
+    (crawler,) = import_tool("verify", "crawler")
+    pages = []
+    for listing, crawls, _, _ in _verify_inputs(n, options):
+        for result in crawls:
+            if result.success:
+                pages.append((result.title, result.content, listing["name"], result.url == listing.get("website_url")))
+                break
+        else:
+            pages.append((listing["name"], "", listing["name"], True))
+
+    def run():
+        for title, content, name, dedicated in pages:
+            crawler.detect_rebranding(title, content, name, is_dedicated_page=dedicated)
+    return run
+
+
+def setup_postcode_to_region(n: int, options: Options) -> Callable[[], None]:
+    (postcode,) = import_tool("verify", "postcode")
+    samples = postcode_samples(n, seed=options.seed)
+
+    def run():
+        for sample in samples:
+            postcode.postcode_to_region(sample)
+    return run
+
+
+def setup_verify_writers(n: int, options: Options) -> Callable[[], None]:
+    comparator, enrichment, output_csv, output_sql, output_summary = import_tool(
+        "verify", "comparator", "enrichment", "output_csv", "output_sql", "output_summary",
+    )
+    results = []
+    for listing, crawls, analysis, lookup in _verify_inputs(n, options):
+        verification = comparator.compare_listing(listing, crawls, analysis, lookup)
+        verification.field_comparisons.extend(enrichment.suggest_enrichments(listing, analysis, lookup))
+        results.append(verification)
+    output_dir = options.work_dir / "verify"
+    output_dir.mkdir(exist_ok=True)
+
+    def run():
+        output_csv.generate_csv_report(results, "bench", output_dir)
+        output_sql.generate_sql_updates(results, "bench", output_dir)
+        output_summary.generate_summary(results, "bench", output_dir, mode="BENCHMARK")
+    return run
+
+
+def _discover_mentions(n: int, options: Options) -> tuple:
+    dataset = generate_dataset(n, seed=options.seed)
+    mentions = raw_mentions(
+        dataset, n, seed=options.seed,
+        duplicate_rate=options.duplicate_rate, typo_rate=options.typo_rate,
+    )
+    return dataset, mentions
+
+
+def setup_deduplicate_developments(n: int, options: Options) -> Callable[[], None]:
+    (deduplicator,) = import_tool("discover", "deduplicator")
+    _, mentions = _discover_mentions(n, options)
+
+    def run():
+        deduplicator.deduplicate_developments(mentions)
+    return run
+
+
+def setup_check_against_database(n: int, options: Options) -> Callable[[], None]:
+    deduplicator, db_check = import_tool("discover", "deduplicator", "db_check")
+    dataset, mentions = _discover_mentions(n, options)
+    developments = deduplicator.deduplicate_developments(mentions)
+    existing = existing_names(dataset)
+
+    def run():
+        db_check.check_against_database(developments, existing)
+    return run
+
+
+def setup_discover_writers(n: int, options: Options) -> Callable[[], None]:
+    deduplicator, db_check, output_csv, output_sql = import_tool(
+        "discover", "deduplicator", "db_check", "output_csv", "output_sql",
+    )
+    dataset, mentions = _discover_mentions(n, options)
+    developments = deduplicator.deduplicate_developments(mentions)
+    db_check.check_against_database(developments, existing_names(dataset))
+    output_dir = options.work_dir / "discover"
+    output_dir.mkdir(exist_ok=True)
+
+    def run():
+        output_csv.generate_csv_report(developments, "bench", output_dir)
+        output_sql.generate_sql_inserts(developments, "bench", output_dir)
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[int, Options], Callable[[], None]]] = {
+    "compare_listing": setup_compare_listing,
+    "detect_rebranding": setup_detect_rebranding,
+    "postcode_to_region": setup_postcode_to_region,
+    "verify_writers": setup_verify_writers,
+    "deduplicate_developments": setup_deduplicate_developments,
+    "check_against_database": setup_check_against_database,
+    "discover_writers": setup_discover_writers,
+}
+
+
+def time_benchmark(name: str, n: int, repeat: int, options: Options) -> dict:
+    timings, setup_seconds = [], 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run = BENCHMARKS[name](n, options)
+        setup_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        "benchmark": name,
+        "n": n,
+        "repeat": repeat,
+        "best_seconds": round(best, 6),
+        "median_seconds": round(statistics.median(timings), 6),
+        "per_item_us": round(best / n * 1e6, 3),
+        "items_per_second": round(n / best) if best else None,
+        "setup_seconds": round(setup_seconds / repeat, 3),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SCRIPTS_DIR, capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Microbenchmarks for verify/discover hot paths")
+    parser.add_argument("--scales", type=str, default=DEFAULT_SCALES,
+                        help=f"Comma-separated input sizes (default: {DEFAULT_SCALES})")
+    parser.add_argument("--only", type=str,
+                        help=f"Comma-separated benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark and size; best is reported")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0)")
+    parser.add_argument("--duplicate-rate", type=float, default=0.4,
+                        help="Share of discovery mentions repeating an earlier development (default: 0.4)")
+    parser.add_argument("--typo-rate", type=float, default=0.05,
+                        help="Share of extracted names with a typo (default: 0.05)")
+    parser.add_argument("--output", type=str,
+                        help="Results JSON path (default: scripts/output/microbench_{date}.json)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmark(s): {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+        sys.exit(1)
+
+    print(f"{'=' * 78}")
+    print("BTR MICROBENCHMARKS")
+    print(f"{'=' * 78}")
+    print(f"  {'Benchmark':<26} {'N':>8} {'Best (s)':>10} {'Median (s)':>11} {'us/item':>9} {'items/s':>10}")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="btr-microbench-") as work_dir:
+        options = Options(args.seed, args.duplicate_rate, args.typo_rate, Path(work_dir))
+        for name in names:
+            for n in scales:
+                r = time_benchmark(name, n, max(1, args.repeat), options)
+                results.append(r)
+                print(f"  {name:<26} {n:>8,} {r['best_seconds']:>10.4f} {r['median_seconds']:>11.4f} "
+                      f"{r['per_item_us']:>9.2f} {r['items_per_second'] or 0:>10,}")
+
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    output_path = Path(args.output) if args.output else SCRIPTS_DIR / "output" / f"microbench_{date_str}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "generated_at": datetime.now().isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {
+                "scales": scales, "repeat": args.repeat, "seed": args.seed,
+                "duplicate_rate": args.duplicate_rate, "typo_rate": args.typo_rate,
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\n  Results: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Local stand-in for postcodes.io: GET /postcodes/{postcode} and bulk
+POST /postcodes (up to 100 per request, as the real API allows).
+
+Any postcode in one of synthetic.REGIONS' outward areas resolves to a
+stable location in that region; anything else is "Invalid postcode".
+Point the tools at it with POSTCODES_IO_URL=http://127.0.0.1:{port}.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+from synthetic import postcode_result
+
+BULK_LIMIT = 100
+
+
+class PostcodesState:
+    def __init__(self, latency: float = 0.0):
+        self.latency = max(0.0, latency)
+        self.lock = threading.Lock()
+
+        # Counters
+        self.single_requests = 0
+        self.bulk_requests = 0
+        self.postcodes_looked_up = 0
+
+
+class PostcodesHandler(BaseHTTPRequestHandler):
+    state: PostcodesState  # set on the server class by start_postcodes_server
+
+    def log_message(self, format, *args):  # noqa: A002 - silence default access log
+        pass
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?")[0].rstrip("/")
+        if not path.startswith("/postcodes/"):
+            self._send_json(404, {"status": 404, "error": "Resource not found"})
+            return
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        with self.state.lock:
+            self.state.single_requests += 1
+            self.state.postcodes_looked_up += 1
+        result = postcode_result(unquote(path[len("/postcodes/"):]))
+        if result is None:
+            self._send_json(404, {"status": 404, "error": "Invalid postcode"})
+        else:
+            self._send_json(200, {"status": 200, "result": result})
+
+    def do_POST(self):
+        if self.path.split("?")[0].rstrip("/") != "/postcodes":
+            self._send_json(404, {"status": 404, "error": "Resource not found"})
+            return
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        try:
+            postcodes = json.loads(self.rfile.read(length) or b"{}").get("postcodes")
+        except ValueError:
+            postcodes = None
+        if not isinstance(postcodes, list):
+            self._send_json(400, {"status": 400, "error": "Invalid JSON query submitted"})
+            return
+        if len(postcodes) > BULK_LIMIT:
+            self._send_json(400, {"status": 400, "error": f"Too many postcodes submitted. Up to {BULK_LIMIT}"})
+            return
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        with self.state.lock:
+            self.state.bulk_requests += 1
+            self.state.postcodes_looked_up += len(postcodes)
+        self._send_json(200, {"status": 200, "result": [
+            {"query": postcode, "result": postcode_result(str(postcode))} for postcode in postcodes
+        ]})
+
+
+def start_postcodes_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency: float = 0.0,
+) -> tuple[ThreadingHTTPServer, PostcodesState, str]:
+    """Start the stand-in on a background thread. Returns (server, state, base_url)."""
+    state = PostcodesState(latency)
+    handler = type("BoundPostcodesHandler", (PostcodesHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://{host}:{server.server_address[1]}"
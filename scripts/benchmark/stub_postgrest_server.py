@@ -0,0 +1,355 @@
+"""
+SQLite-backed stand-in for Supabase's PostgREST API, enough for the
+queries verify and discover make:
+
+  GET /rest/v1/{table}?select=...&col=op.value&or=(...)&order=...&limit=N
+
+Supports column lists with embedded to-one resources
+(`operator:operators(id,name)`, joined on `operator_id`), the eq, neq,
+lt, lte, gt, gte, like, ilike, in and is operators (with `not.`), nested
+or()/and() groups, multi-column order and limit/offset. Point the tools at
+it with SUPABASE_URL=http://127.0.0.1:{port} and any JWT-shaped key.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import parse_qsl, urlparse
+
+from synthetic import SyntheticDataset
+
+# A key supabase-py accepts (it only checks the JWT shape)
+STUB_SERVICE_KEY = "stub.stub.stub"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operators (
+    id TEXT PRIMARY KEY, name TEXT, slug TEXT, website TEXT
+);
+CREATE TABLE IF NOT EXISTS asset_owners (
+    id TEXT PRIMARY KEY, name TEXT, slug TEXT, website TEXT
+);
+CREATE TABLE IF NOT EXISTS developments (
+    id TEXT PRIMARY KEY, name TEXT, slug TEXT, number_of_units INTEGER, status TEXT,
+    development_type TEXT, region TEXT, area TEXT, postcode TEXT, website_url TEXT,
+    description TEXT, completion_date TEXT, year_completed INTEGER, latitude REAL, longitude REAL,
+    created_at TEXT, updated_at TEXT, verified_at TEXT, is_published BOOLEAN,
+    studio_units INTEGER, one_bed_units INTEGER, two_bed_units INTEGER, three_bed_plus_units INTEGER,
+    operator_id TEXT REFERENCES operators(id), asset_owner_id TEXT REFERENCES asset_owners(id)
+);
+CREATE INDEX IF NOT EXISTS developments_keyset ON developments (created_at DESC, id DESC);
+"""
+
+_OPERATORS = {
+    "eq": "=", "neq": "<>", "lt": "<", "lte": "<=", "gt": ">", "gte": ">=",
+    "like": "LIKE", "ilike": "LIKE",
+}
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class PostgrestError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+# --- Query parsing ---
+
+def _split_top_level(text: str, sep: str = ",") -> list[str]:
+    """Split on `sep` outside parentheses and double quotes."""
+    parts, depth, quoted, current = [], 0, False, []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and quoted and i + 1 < len(text):
+            current.append(text[i : i + 2])
+            i += 2
+            continue
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        if ch == sep and depth == 0 and not quoted:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def _typed(value: str) -> Union[str, int, None]:
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return 1 if lowered == "true" else 0
+    if lowered == "null":
+        return None
+    return value
+
+
+def parse_select(select: str) -> list[tuple[str, Optional[str], Optional[list]]]:
+    """[(name or alias, embedded table or None, embedded columns)] for a select parameter."""
+    items = []
+    for part in _split_top_level(re.sub(r"\s+", "", select or "*")):
+        match = re.fullmatch(r"(?:(\w+):)?(\w+)\((.*)\)", part)
+        if match:
+            alias, table, inner = match.groups()
+            items.append((alias or table, table, parse_select(inner)))
+        else:
+            items.append((part, None, None))
+    return items
+
+
+class QueryBuilder:
+    """Turns PostgREST filters into a SQL WHERE clause for one table."""
+
+    def __init__(self, columns: set[str]):
+        self.columns = columns
+        self.params: list[Any] = []
+
+    def column(self, name: str) -> str:
+        if name not in self.columns or not _IDENTIFIER.match(name):
+            raise PostgrestError(400, "42703", f"column {name} does not exist")
+        return f'"{name}"'
+
+    def condition(self, column: str, expression: str) -> str:
+        """SQL for `column` with a PostgREST `op.value` expression."""
+        negate = expression.startswith("not.")
+        if negate:
+            expression = expression[4:]
+        op, _, raw = expression.partition(".")
+        col = self.column(column)
+
+        if op == "in":
+            values = [_typed(_unquote(v)) for v in _split_top_level(raw.strip("()"))]
+            self.params.extend(values)
+            sql = f"{col} IN ({', '.join('?' for _ in values)})" if values else "0"
+        elif op == "is":
+            target = raw.lower()
+            if target not in ("null", "true", "false"):
+                raise PostgrestError(400, "PGRST100", f"invalid is value: {raw}")
+            sql = f"{col} IS NULL" if target == "null" else f"{col} = {1 if target == 'true' else 0}"
+        elif op in _OPERATORS:
+            value = _unquote(raw)
+            if op in ("like", "ilike"):
+                value = value.replace("*", "%")
+                # SQLite LIKE is case-insensitive for ASCII; make `like` exact
+                sql = f"lower({col}) LIKE lower(?)" if op == "ilike" else f"{col} GLOB ?"
+                if op == "like":
+                    value = value.replace("%", "*").replace("_", "?")
+                self.params.append(value)
+            else:
+                sql = f"{col} {_OPERATORS[op]} ?"
+                self.params.append(_typed(value))
+        else:
+            raise PostgrestError(400, "PGRST100", f"unknown operator: {op}")
+        return f"NOT ({sql})" if negate else sql
+
+    def logic(self, operator: str, group: str) -> str:
+        """SQL for an or=(...)/and=(...) group, recursively."""
+        inner = group.strip()
+        if not (inner.startswith("(") and inner.endswith(")")):
+            raise PostgrestError(400, "PGRST100", f"invalid logic tree: {group}")
+        clauses = []
+        for part in _split_top_level(inner[1:-1]):
+            nested = re.fullmatch(r"(not\.)?(and|or)(\(.*\))", part)
+            if nested:
+                clause = self.logic(nested.group(2), nested.group(3))
+                clauses.append(f"NOT {clause}" if nested.group(1) else clause)
+            else:
+                column, _, expression = part.partition(".")
+                clauses.append(self.condition(column, expression))
+        joiner = " OR " if operator == "or" else " AND "
+        return f"({joiner.join(clauses) or '1'})"
+
+
+class PostgrestStandIn:
+    """The SQLite database behind the stand-in (thread-safe)."""
+
+    def __init__(self, path: Union[str, Path] = ":memory:", latency: float = 0.0):
+        self.latency = max(0.0, latency)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self._columns = {
+            table: {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            for table in ("operators", "asset_owners", "developments")
+        }
+        self._booleans = {
+            table: {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})") if row[2] == "BOOLEAN"}
+            for table in self._columns
+        }
+
+        # Counters
+        self.requests = 0
+        self.rows_returned = 0
+
+    def seed(self, dataset: SyntheticDataset) -> None:
+        """Load a synthetic dataset (embedded operator/asset_owner objects are dropped)."""
+        with self.lock:
+            for table, rows in (
+                ("operators", dataset.operators),
+                ("asset_owners", dataset.asset_owners),
+                ("developments", dataset.developments),
+            ):
+                columns = [c for c in rows[0] if c in self._columns[table]] if rows else []
+                if not columns:
+                    continue
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})",
+                    [[row.get(c) for c in columns] for row in rows],
+                )
+            self.conn.commit()
+
+    def _row_dict(self, table: str, row: sqlite3.Row, names: list[str]) -> dict:
+        booleans = self._booleans[table]
+        return {name: (bool(row[name]) if name in booleans and row[name] is not None else row[name]) for name in names}
+
+    def select(self, table: str, params: list[tuple[str, str]]) -> list[dict]:
+        if table not in self._columns:
+            raise PostgrestError(404, "42P01", f'relation "public.{table}" does not exist')
+        columns = self._columns[table]
+        builder = QueryBuilder(columns)
+
+        select, where, order, limit, offset = "*", [], [], None, None
+        for key, value in params:
+            if key == "select":
+                select = value
+            elif key == "order":
+                order.extend(_split_top_level(value))
+            elif key == "limit":
+                limit = int(value)
+            elif key == "offset":
+                offset = int(value)
+            elif key in ("or", "and"):
+                where.append(builder.logic(key, value))
+            elif key.startswith("not.") and key[4:] in ("or", "and"):
+                where.append(f"NOT {builder.logic(key[4:], value)}")
+            else:
+                where.append(builder.condition(key, value))
+
+        items = parse_select(select)
+        plain = []
+        for name, embedded, _ in items:
+            if embedded is None:
+                plain.extend(sorted(columns) if name == "*" else [name])
+        for name in plain:
+            builder.column(name)
+
+        order_sql = []
+        for term in order:
+            column, *modifiers = term.split(".")
+            sql = builder.column(column)
+            sql += " DESC" if "desc" in modifiers else " ASC"
+            if "nullsfirst" in modifiers:
+                sql += " NULLS FIRST"
+            elif "nullslast" in modifiers:
+                sql += " NULLS LAST"
+            order_sql.append(sql)
+
+        sql = f"SELECT * FROM {table}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if order_sql:
+            sql += " ORDER BY " + ", ".join(order_sql)
+        if limit is not None or offset is not None:
+            sql += f" LIMIT {limit if limit is not None else -1} OFFSET {offset or 0}"
+
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.requests += 1
+            rows = self.conn.execute(sql, builder.params).fetchall()
+            results = [self._row_dict(table, row, plain) for row in rows]
+            for name, embedded, inner in items:
+                if embedded is not None:
+                    self._embed(table, rows, results, name, embedded, inner)
+            self.rows_returned += len(results)
+        return results
+
+    def _embed(self, table: str, rows: list, results: list[dict], name: str, embedded: str, inner: list) -> None:
+        """Attach a to-one embedded resource, joined on {embedded minus 's'}_id."""
+        if embedded not in self._columns:
+            raise PostgrestError(400, "PGRST200", f"Could not find a relationship between '{table}' and '{embedded}'")
+        fk = f"{embedded.rstrip('s')}_id"
+        if fk not in self._columns[table]:
+            raise PostgrestError(400, "PGRST200", f"Could not find a relationship between '{table}' and '{embedded}'")
+        names = []
+        for inner_name, nested, _ in inner:
+            if nested is not None:
+                raise PostgrestError(400, "PGRST100", "nested embedding is not supported by the stand-in")
+            names.extend(sorted(self._columns[embedded]) if inner_name == "*" else [inner_name])
+        checker = QueryBuilder(self._columns[embedded])
+        for inner_name in names:
+            checker.column(inner_name)
+
+        ids = sorted({row[fk] for row in rows if row[fk] is not None})
+        related: dict[str, dict] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            for row in self.conn.execute(
+                f"SELECT * FROM {embedded} WHERE id IN ({', '.join('?' for _ in chunk)})", chunk,
+            ):
+                related[row["id"]] = self._row_dict(embedded, row, names)
+        for row, result in zip(rows, results):
+            result[name] = related.get(row[fk])
+
+
+class PostgrestHandler(BaseHTTPRequestHandler):
+    db: PostgrestStandIn  # set on the server class by start_postgrest_server
+
+    def log_message(self, format, *args):  # noqa: A002 - silence default access log
+        pass
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        match = re.fullmatch(r"/rest/v1/(\w+)/?", parsed.path)
+        if not match:
+            self._send_json(404, {"code": "PGRST125", "message": f"Invalid path: {parsed.path}"})
+            return
+        try:
+            rows = self.db.select(match.group(1), parse_qsl(parsed.query, keep_blank_values=True))
+        except PostgrestError as e:
+            self._send_json(e.status, {"code": e.code, "message": str(e), "details": None, "hint": None})
+            return
+        except (ValueError, sqlite3.Error) as e:
+            self._send_json(400, {"code": "PGRST100", "message": str(e), "details": None, "hint": None})
+            return
+        self._send_json(200, rows)
+
+
+def start_postgrest_server(
+    db: PostgrestStandIn,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> tuple[ThreadingHTTPServer, str]:
+    """Start the stand-in on a background thread. Returns (server, SUPABASE_URL)."""
+    handler = type("BoundPostgrestHandler", (PostgrestHandler,), {"db": db})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
@@ -0,0 +1,474 @@
+"""
+Synthetic BTR directory data for benchmarks.
+
+Everything is derived from a seed, so a benchmark at a given size always
+sees the same developments, pages and postcodes. Developments are rows
+shaped like db.SELECT_FIELDS (operator/asset_owner embedded), and each has
+the facts its web pages state; a share of those facts deliberately differ
+from the database so comparisons find discrepancies, gaps and rebrands.
+
+The second half builds in-memory inputs for microbenchmarks: crawl results,
+verify LLM extractions and raw discovery mentions, with controllable
+duplicate and typo rates.
+"""
+
+import hashlib
+import random
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+# Outward-code areas per region, with a rough centre and typical towns.
+# ONS region names are what postcodes.io returns ("Yorkshire and the Humber");
+# Scotland/Wales have no ONS region, only a country.
+REGIONS: dict[str, dict] = {
+    "London": {"areas": ["E", "N", "SE", "SW", "W", "NW", "EC"], "centre": (51.507, -0.128),
+               "towns": ["London", "Stratford", "Wembley", "Croydon"], "ons": "London", "country": "England"},
+    "North West": {"areas": ["M", "L", "WA", "PR", "BL"], "centre": (53.480, -2.242),
+                   "towns": ["Manchester", "Liverpool", "Salford", "Warrington"], "ons": "North West",
+                   "country": "England"},
+    "Yorkshire and The Humber": {"areas": ["LS", "S", "BD", "HU", "YO"], "centre": (53.800, -1.549),
+                                 "towns": ["Leeds", "Sheffield", "Bradford", "York"],
+                                 "ons": "Yorkshire and the Humber", "country": "England"},
+    "West Midlands": {"areas": ["B", "CV", "WV"], "centre": (52.486, -1.890),
+                      "towns": ["Birmingham", "Coventry", "Wolverhampton"], "ons": "West Midlands",
+                      "country": "England"},
+    "East Midlands": {"areas": ["NG", "LE", "DE"], "centre": (52.954, -1.158),
+                      "towns": ["Nottingham", "Leicester", "Derby"], "ons": "East Midlands", "country": "England"},
+    "South West": {"areas": ["BS", "EX", "PL"], "centre": (51.455, -2.588),
+                   "towns": ["Bristol", "Exeter", "Plymouth"], "ons": "South West", "country": "England"},
+    "South East": {"areas": ["RG", "OX", "BN", "GU"], "centre": (51.454, -0.978),
+                   "towns": ["Reading", "Oxford", "Brighton", "Guildford"], "ons": "South East",
+                   "country": "England"},
+    "East of England": {"areas": ["CB", "NR", "IP"], "centre": (52.205, 0.122),
+                        "towns": ["Cambridge", "Norwich", "Ipswich"], "ons": "East of England",
+                        "country": "England"},
+    "North East": {"areas": ["NE", "SR", "DH"], "centre": (54.978, -1.618),
+                   "towns": ["Newcastle", "Sunderland", "Durham"], "ons": "North East", "country": "England"},
+    "Scotland": {"areas": ["G", "EH", "AB"], "centre": (55.953, -3.188),
+                 "towns": ["Glasgow", "Edinburgh", "Aberdeen"], "ons": None, "country": "Scotland"},
+    "Wales": {"areas": ["CF", "SA"], "centre": (51.481, -3.179),
+              "towns": ["Cardiff", "Swansea"], "ons": None, "country": "Wales"},
+}
+
+AREA_TO_REGION = {area: region for region, info in REGIONS.items() for area in info["areas"]}
+
+STATUSES = ["In Planning", "Under Construction", "Operational"]
+
+_NAME_FIRST = [
+    "Alder", "Birch", "Cedar", "Copper", "Canal", "Crown", "Elm", "Forge", "Granary", "Harbour",
+    "Ivy", "Juniper", "Kings", "Linden", "Maple", "Mill", "Oak", "Quay", "Rowan", "Silk",
+    "Slate", "Tannery", "Union", "Victoria", "Willow", "Yarn", "Foundry", "Printworks", "Lock", "Vault",
+]
+_NAME_SECOND = [
+    "Quarters", "Wharf", "Yard", "Works", "Gardens", "Point", "House", "Residences", "Place",
+    "Square", "Exchange", "Court", "Lofts", "Heights", "Village", "Green",
+]
+_OPERATOR_WORDS = [
+    "Grainger", "Placefirst", "Moda", "Allsop", "Fizzy", "Quintain", "Get Living", "Way of Life",
+    "Native", "Sage", "Leaf", "Hollis", "Arbor", "Vertus", "Orbit", "Civitas", "Dandara", "Platform",
+]
+_OWNER_WORDS = ["Capital", "Partners", "Investments", "Pension Fund", "REIT", "Real Estate"]
+_STREETS = ["High Street", "Mill Lane", "Station Road", "Canal Street", "Church Road", "Victoria Street"]
+
+PLACEHOLDERS = ["TBC", "N/A", "-", "unknown"]
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def _stable_fraction(text: str) -> float:
+    """Deterministic value in [0, 1) from a string (used to place postcodes)."""
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big") / 2 ** 64
+
+
+_INWARD_LETTERS = "ABDEFGHJLNPQRSTUWXYZ"
+
+
+def make_postcode(rng: random.Random, region: str) -> str:
+    area = rng.choice(REGIONS[region]["areas"])
+    inward = f"{rng.randint(1, 9)}{rng.choice(_INWARD_LETTERS)}{rng.choice(_INWARD_LETTERS)}"
+    return f"{area}{rng.randint(1, 20)} {inward}"
+
+
+def postcode_result(postcode: str) -> Optional[dict]:
+    """
+    postcodes.io-style result for a synthetic postcode (None if its outward
+    area isn't one of ours). Coordinates are a stable offset from the
+    region's centre.
+    """
+    compact = postcode.strip().upper().replace(" ", "")
+    match = re.fullmatch(r"([A-Z]{1,2})(\d[A-Z\d]?)(\d[A-Z]{2})", compact)
+    if not match or match.group(1) not in AREA_TO_REGION:
+        return None
+    region = AREA_TO_REGION[match.group(1)]
+    info = REGIONS[region]
+    lat, lng = info["centre"]
+    return {
+        "postcode": f"{compact[:-3]} {compact[-3:]}",
+        "latitude": round(lat + (_stable_fraction(compact) - 0.5) * 0.2, 6),
+        "longitude": round(lng + (_stable_fraction(compact[::-1]) - 0.5) * 0.3, 6),
+        "region": info["ons"],
+        "country": info["country"],
+        "admin_district": info["towns"][0],
+    }
+
+
+@dataclass
+class PageFacts:
+    """What a development's web pages say about it."""
+    name: str
+    area: str
+    units: int
+    status: str
+    postcode: str
+    operator_name: str
+    dead: bool = False  # pages return 404
+
+
+@dataclass
+class SyntheticDataset:
+    operators: list[dict] = field(default_factory=list)
+    asset_owners: list[dict] = field(default_factory=list)
+    developments: list[dict] = field(default_factory=list)  # DB rows, operator/asset_owner embedded
+    facts: dict[str, PageFacts] = field(default_factory=dict)  # development id -> page facts
+    site_hosts: dict[str, str] = field(default_factory=dict)  # host label -> development id
+    operator_hosts: dict[str, dict] = field(default_factory=dict)  # host label -> operator row
+
+
+def _development_name(rng: random.Random, used: set[str]) -> str:
+    while True:
+        name = f"{rng.choice(_NAME_FIRST)} {rng.choice(_NAME_SECOND)}"
+        if rng.random() < 0.3:
+            name = f"The {name}"
+        if name not in used:
+            used.add(name)
+            return name
+        # Common pairs repeat at scale: qualify with a number like real phases
+        name = f"{name} {rng.randint(2, 999)}"
+        if name not in used:
+            used.add(name)
+            return name
+
+
+def generate_dataset(
+    count: int,
+    seed: int = 0,
+    port: int = 80,
+    perturbation_rate: float = 0.15,
+    operator_count: Optional[int] = None,
+) -> SyntheticDataset:
+    """
+    `count` published developments across roughly count/40 operators (at
+    least 5). Websites live on *.localhost hosts at `port` (Chromium resolves
+    any *.localhost name to loopback): a development's own site at
+    http://{slug}.localhost:{port}/ and its operator page at
+    http://{operator}.localhost:{port}/{slug}.
+
+    About `perturbation_rate` of developments have pages that disagree with
+    the database (unit count, status or name), 3% are dead links, and a
+    share of rows have missing or placeholder fields to be gap-filled.
+    """
+    rng = random.Random(seed)
+    data = SyntheticDataset()
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    operator_total = operator_count or max(5, count // 40)
+    for i in range(operator_total):
+        name = f"{_OPERATOR_WORDS[i % len(_OPERATOR_WORDS)]} Living"
+        if i >= len(_OPERATOR_WORDS):
+            name = f"{name} {i // len(_OPERATOR_WORDS) + 1}"
+        slug = slugify(name)
+        operator = {"id": f"op-{i:05d}", "name": name, "slug": slug, "website": f"http://{slug}.localhost:{port}"}
+        data.operators.append(operator)
+        data.operator_hosts[slug] = operator
+
+    for i in range(max(3, operator_total // 2)):
+        name = f"{rng.choice(_OPERATOR_WORDS)} {rng.choice(_OWNER_WORDS)} {i + 1}"
+        data.asset_owners.append({"id": f"ao-{i:05d}", "name": name, "slug": slugify(name), "website": None})
+
+    used: set[str] = set()
+    for i in range(count):
+        region = rng.choice(list(REGIONS))
+        area = rng.choice(REGIONS[region]["towns"])
+        name = _development_name(rng, used)
+        slug = slugify(f"{name} {area}")
+        operator = rng.choice(data.operators)
+        owner = rng.choice(data.asset_owners) if rng.random() < 0.7 else None
+        units = rng.randint(40, 900)
+        status = rng.choice(STATUSES)
+        postcode = make_postcode(rng, region)
+        located = postcode_result(postcode)
+        created = now - timedelta(days=rng.randint(0, 900), seconds=i)
+        has_site = rng.random() < 0.7
+
+        dev_id = f"dev-{i:06d}"
+        row = {
+            "id": dev_id,
+            "name": name,
+            "slug": slug,
+            "number_of_units": units,
+            "status": status,
+            "development_type": "Multifamily" if rng.random() < 0.9 else "Single Family",
+            "region": region,
+            "area": area,
+            "postcode": postcode,
+            "website_url": f"http://{slug}.localhost:{port}/" if has_site else None,
+            "description": f"{name} is a build to rent development in {area}.",
+            "completion_date": f"{rng.randint(2018, 2029)}-{rng.randint(1, 12):02d}-01",
+            "year_completed": None,
+            "latitude": located["latitude"] if located else None,
+            "longitude": located["longitude"] if located else None,
+            "created_at": created.isoformat(),
+            "updated_at": (created + timedelta(days=rng.randint(0, 60))).isoformat(),
+            "verified_at": None,
+            "is_published": True,
+            "operator_id": operator["id"],
+            "asset_owner_id": owner["id"] if owner else None,
+            "operator": {k: operator[k] for k in ("id", "name", "slug", "website")},
+            "asset_owner": {k: owner[k] for k in ("id", "name", "slug", "website")} if owner else None,
+        }
+
+        facts = PageFacts(
+            name=name, area=area, units=units, status=status, postcode=postcode,
+            operator_name=operator["name"], dead=rng.random() < 0.03,
+        )
+        roll = rng.random()
+        if roll < perturbation_rate / 3:
+            facts.units = max(10, units + rng.choice([-1, 1]) * rng.randint(5, 120))
+        elif roll < perturbation_rate * 2 / 3:
+            facts.status = rng.choice([s for s in STATUSES if s != status])
+        elif roll < perturbation_rate:
+            facts.name = _development_name(rng, used)
+
+        # Gaps and placeholders for enrichment to fill
+        gap = rng.random()
+        if gap < 0.10:
+            row["postcode"] = None
+            row["latitude"] = row["longitude"] = None
+        elif gap < 0.15:
+            row["number_of_units"] = None
+        elif gap < 0.18:
+            row["region"] = rng.choice(PLACEHOLDERS)
+
+        row.update(unit_mix(dev_id, row["number_of_units"]))
+
+        data.developments.append(row)
+        data.facts[dev_id] = facts
+        if has_site:
+            data.site_hosts[slug] = dev_id
+
+    return data
+
+
+def unit_mix(dev_id: str, units: Optional[int]) -> dict:
+    """
+    studio/one/two/three-bed unit counts for about 40% of developments,
+    summing to `units` except for a few data-entry slips. Drawn from a
+    per-development generator so the rest of the dataset doesn't shift.
+    """
+    rng = random.Random(f"mix-{dev_id}")
+    mix = dict.fromkeys(("studio_units", "one_bed_units", "two_bed_units", "three_bed_plus_units"))
+    if units is None or rng.random() >= 0.4:
+        return mix
+    shares = [rng.random() for _ in mix]
+    counts = [int(units * share / sum(shares)) for share in shares]
+    counts[1] += units - sum(counts)
+    if rng.random() < 0.05:
+        counts[rng.randrange(4)] += rng.randint(1, 30)
+    return dict(zip(mix, counts))
+
+
+def new_development_facts(rng: random.Random, used: set[str]) -> PageFacts:
+    """Facts for a development that isn't in the database (for discovery pages)."""
+    region = rng.choice(list(REGIONS))
+    return PageFacts(
+        name=_development_name(rng, used),
+        area=rng.choice(REGIONS[region]["towns"]),
+        units=rng.randint(40, 900),
+        status=rng.choice(STATUSES),
+        postcode=make_postcode(rng, region),
+        operator_name=f"{rng.choice(_OPERATOR_WORDS)} Living",
+    )
+
+
+def street_for(facts: PageFacts) -> str:
+    return f"{int(_stable_fraction(facts.name) * 200) + 1} {_STREETS[int(_stable_fraction(facts.area) * len(_STREETS))]}"
+
+
+def facts_sentence(facts: PageFacts) -> str:
+    """The sentence every synthetic page carries (and fixture_reply() reads back)."""
+    return (
+        f"{facts.name} is a build to rent scheme in {facts.area} with {facts.units} homes, "
+        f"operated by {facts.operator_name}. Status: {facts.status}. Postcode: {facts.postcode}."
+    )
+
+
+# --- In-memory inputs for microbenchmarks (no servers involved) ---
+
+_KEYBOARD_NEIGHBOURS = "qwertyuiopasdfghjklzxcvbnm"
+
+
+def add_typo(rng: random.Random, text: str) -> str:
+    """One realistic slip in a letter of `text`: swap, drop, double or substitute."""
+    positions = [i for i, ch in enumerate(text) if ch.isalpha()]
+    if len(positions) < 4:
+        return text
+    i = rng.choice(positions[1:-1])
+    kind = rng.randrange(4)
+    if kind == 0 and text[i + 1].isalpha():
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    if kind == 1:
+        return text[:i] + text[i + 1:]
+    if kind == 2:
+        return text[:i] + text[i] + text[i:]
+    replacement = rng.choice(_KEYBOARD_NEIGHBOURS)
+    return text[:i] + (replacement.upper() if text[i].isupper() else replacement) + text[i + 1:]
+
+
+def page_markdown(facts: PageFacts, rebrand: bool = False) -> str:
+    """Markdown shaped like crawl4ai's output for a development page."""
+    lines = [
+        "[Home](/) [Apartments](/apartments) [Contact](/contact) [Book a viewing](/book-a-viewing)",
+        f"# {facts.name}",
+        facts_sentence(facts),
+        "Residents enjoy a concierge, co-working lounge, gym and roof terrace with views across the city.",
+        "Every apartment is professionally managed, with flexible tenancies and pet-friendly homes.",
+        f"## Find us\n{facts.name}, {street_for(facts)}, {facts.area} {facts.postcode}",
+        "© 2026 All rights reserved. [Privacy policy](/privacy) | [Terms](/terms)",
+    ]
+    if rebrand:
+        lines.insert(2, f"{facts.name} (formerly known as {facts.area} Quarter) welcomes its first residents.")
+    return "\n\n".join(lines)
+
+
+def crawl_results_for(dataset: SyntheticDataset, row: dict, rebrand_rate: float = 0.02) -> list[dict]:
+    """
+    CrawlResult fields (url, success, status_code, content, title, ...) for
+    a development's own site and operator page, as verify's crawler returns them.
+    """
+    facts = dataset.facts[row["id"]]
+    rng = random.Random(row["id"])
+    urls = [row["website_url"]] if row.get("website_url") else []
+    operator = row.get("operator") or {}
+    if operator.get("website"):
+        urls.append(f"{operator['website']}/{row['slug']}")
+
+    results = []
+    for url in urls:
+        if facts.dead:
+            results.append({
+                "url": url, "success": False, "status_code": 404, "content": "", "title": "",
+                "error": "HTTP 404", "is_dead_link": True,
+            })
+        else:
+            results.append({
+                "url": url, "success": True, "status_code": 200,
+                "content": page_markdown(facts, rebrand=rng.random() < rebrand_rate),
+                "title": f"{facts.name} | {operator.get('name') or facts.name}",
+            })
+    return results
+
+
+def llm_extraction_for(
+    dataset: SyntheticDataset,
+    row: dict,
+    typo_rate: float = 0.05,
+) -> Optional[dict]:
+    """
+    What verify's analyzer would extract from a development's pages: the
+    page facts with confidences, with the odd typo in names. None for dead pages.
+    """
+    facts = dataset.facts[row["id"]]
+    if facts.dead:
+        return None
+    rng = random.Random(f"llm-{row['id']}")
+    extraction = {
+        "name": add_typo(rng, facts.name) if rng.random() < typo_rate else facts.name,
+        "operator_name": (
+            add_typo(rng, facts.operator_name) if rng.random() < typo_rate else facts.operator_name
+        ),
+        "number_of_units": facts.units,
+        "status": facts.status,
+        "development_type": row.get("development_type"),
+        "area": facts.area,
+        "region": AREA_TO_REGION.get(re.match(r"[A-Z]+", facts.postcode).group(0)),
+        "postcode": facts.postcode,
+        "website_url": row.get("website_url"),
+        "completion_date": row.get("completion_date"),
+    }
+    extraction.update({f"{key}_confidence": "HIGH" for key in list(extraction)})
+    if rng.random() < 0.2:
+        extraction["number_of_units_confidence"] = "MEDIUM"
+    return extraction
+
+
+def raw_mentions(
+    dataset: SyntheticDataset,
+    count: int,
+    seed: int = 0,
+    duplicate_rate: float = 0.4,
+    typo_rate: float = 0.05,
+    new_rate: float = 0.3,
+) -> list[dict]:
+    """
+    `count` raw discovery extractions (dicts with _source_url, as discover's
+    analyzer returns them). About `duplicate_rate` repeat an earlier
+    development from another article, `typo_rate` have a misspelt name, and
+    `new_rate` of first mentions are developments missing from `dataset`.
+    """
+    rng = random.Random(seed)
+    used = {facts.name for facts in dataset.facts.values()}
+    rows = dataset.developments
+    seen: list[PageFacts] = []
+    mentions = []
+    for i in range(count):
+        if seen and rng.random() < duplicate_rate:
+            facts = rng.choice(seen)
+        elif not rows or rng.random() < new_rate:
+            facts = new_development_facts(rng, used)
+            seen.append(facts)
+        else:
+            facts = dataset.facts[rng.choice(rows)["id"]]
+            seen.append(facts)
+
+        region = AREA_TO_REGION.get(re.match(r"[A-Z]+", facts.postcode).group(0))
+        mention = {
+            "name": add_typo(rng, facts.name) if rng.random() < typo_rate else facts.name,
+            "operator_name": facts.operator_name if rng.random() < 0.8 else None,
+            "area": facts.area,
+            "region": region if rng.random() < 0.7 else None,
+            "postcode": facts.postcode if rng.random() < 0.5 else None,
+            "number_of_units": facts.units if rng.random() < 0.7 else None,
+            "status": facts.status if rng.random() < 0.6 else None,
+            "development_type": "Multifamily",
+            "_source_url": f"http://news{i % 8 + 1}.localhost/articles/{i // 3}",
+        }
+        mentions.append(mention)
+    return mentions
+
+
+def existing_names(dataset: SyntheticDataset) -> dict[str, str]:
+    """Lowercase name -> slug for the dataset, as fetch_existing_developments returns."""
+    return {row["name"].lower(): row["slug"] for row in dataset.developments}
+
+
+def postcode_samples(count: int, seed: int = 0, invalid_rate: float = 0.05) -> list[str]:
+    """Postcodes as they appear in listings: mixed case and spacing, a few invalid."""
+    rng = random.Random(seed)
+    regions = list(REGIONS)
+    samples = []
+    for _ in range(count):
+        if rng.random() < invalid_rate:
+            samples.append(rng.choice(["TBC", "", "12345", "N/A", "QQ1 1QQ"]))
+            continue
+        postcode = make_postcode(rng, rng.choice(regions))
+        style = rng.random()
+        if style < 0.2:
+            postcode = postcode.lower()
+        elif style < 0.3:
+            postcode = postcode.replace(" ", "")
+        samples.append(postcode)
+    return samples
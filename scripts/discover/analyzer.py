@@ -1,11 +1,23 @@
+import asyncio
 import json
 import re
 from typing import Optional
 
 import anthropic
 
+from llm_batch import MessageBatchRunner, run_cached_batch
+from llm_cache import LLMCache, LLMCallResult
+from llm_metrics import LLMMetrics, asend_tracked, send_tracked
+from boilerplate import BoilerplateStripper
+from content_selector import build_query, select_relevant
 from models import VALID_REGIONS, VALID_STATUSES, VALID_DEVELOPMENT_TYPES
 
+# Bump whenever DISCOVERY_PROMPT changes so cached results are not reused
+PROMPT_VERSION = "2"
+
+# Page content sent per prompt (the most relevant sections, see content_selector.py)
+DISCOVERY_CONTENT_TOKENS = 3000
+
 
 DISCOVERY_PROMPT = """Analyze this webpage content and extract ALL Build to Rent (BTR) developments mentioned.
 
@@ -47,60 +59,180 @@ Webpage content:
 
 
 class DiscoveryAnalyzer:
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-20250514",
+        cache: Optional[LLMCache] = None,
+        content_tokens: int = DISCOVERY_CONTENT_TOKENS,
+    ):
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
+        self.cache = cache
+        self.content_tokens = content_tokens
+        self.boilerplate = BoilerplateStripper()
+        self.metrics = LLMMetrics(model)
 
     def extract_developments(self, content: str, source_url: str) -> list[dict]:
         """Extract ALL BTR developments mentioned in crawled content."""
-        if not content or len(content.strip()) < 100:
+        prepared = self.build_prompt(content, source_url)
+        if prepared is None:
             return []
+        prompt, key = prepared
+
+        if self.cache is None:
+            parsed = self._call_claude(prompt, source_url)[0]
+        else:
+            parsed = self.cache.call(key, lambda: self._call_claude(prompt, source_url))
+        return _clean_developments(parsed, source_url)
+
+    def build_prompt(self, content: str, source_url: str) -> Optional[tuple[str, str]]:
+        """Return (prompt, cache_key) for a page, or None if there is too little content."""
+        if not content or len(content.strip()) < 100:
+            return None
+
+        # Drop the site's template (observe all pages first for best results), then pick sections
+        self.boilerplate.observe(source_url, content)
+        cleaned = self.boilerplate.clean(source_url, content)
+        selected = select_relevant(cleaned, build_query(), self.content_tokens)
+        prompt = DISCOVERY_PROMPT.format(content=selected, source_url=source_url)
+        key = LLMCache.make_key(self.model, PROMPT_VERSION, selected, source_url)
+        return prompt, key
 
-        truncated = content[:12000]
-        prompt = DISCOVERY_PROMPT.format(content=truncated, source_url=source_url)
+    def _request(self, prompt: str) -> dict:
+        """Keyword arguments for messages.create()."""
+        return {
+            "model": self.model,
+            "max_tokens": 4000,
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
+    def _call_claude(self, prompt: str, label: str = "") -> LLMCallResult:
+        """Send the prompt and parse the reply. Returns (parsed, input_tokens, output_tokens)."""
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                messages=[{"role": "user", "content": prompt}],
-            )
-        except anthropic.RateLimitError:
-            print("    Claude API rate limited -- skipping this page")
-            return []
+            response = send_tracked(self.client, self.metrics, label, self._request(prompt))
         except Exception as e:
-            print(f"    Claude API error: {e}")
-            return []
+            return _api_error(e)
+        return _handle_response(response)
 
-        parsed = _parse_response(response.content[0].text)
-        if not parsed or "developments" not in parsed:
-            return []
 
-        developments = parsed["developments"]
-        if not isinstance(developments, list):
+class AsyncDiscoveryAnalyzer(DiscoveryAnalyzer):
+    """
+    Non-blocking variant built on AsyncAnthropic. At most `max_concurrency`
+    requests are in flight at once, so pages are analyzed in parallel
+    without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-20250514",
+        cache: Optional[LLMCache] = None,
+        max_concurrency: int = 4,
+        content_tokens: int = DISCOVERY_CONTENT_TOKENS,
+    ):
+        super().__init__(api_key, model, cache, content_tokens)
+        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def extract_developments(self, content: str, source_url: str) -> list[dict]:
+        """Async version of DiscoveryAnalyzer.extract_developments."""
+        prepared = self.build_prompt(content, source_url)
+        if prepared is None:
             return []
+        prompt, key = prepared
+
+        if self.cache is None:
+            parsed = (await self._call_claude(prompt, source_url))[0]
+        else:
+            parsed = await self.cache.acall(key, lambda: self._call_claude(prompt, source_url))
+        return _clean_developments(parsed, source_url)
+
+    async def extract_batch(
+        self,
+        runner: MessageBatchRunner,
+        pages: dict[str, tuple[str, str]],
+    ) -> dict[str, list[dict]]:
+        """
+        Batch version of extract_developments for --llm-batch runs.
+        `pages` maps custom_id -> (content, source_url); returns
+        custom_id -> cleaned developments list.
+        """
+        prepared = {}
+        for custom_id, (content, source_url) in pages.items():
+            built = self.build_prompt(content, source_url)
+            if built is not None:
+                prepared[custom_id] = built
+
+        parsed = await run_cached_batch(
+            runner, self.cache, prepared, self._request, _handle_response,
+            metrics=self.metrics, labels={custom_id: source_url for custom_id, (_, source_url) in pages.items()},
+        )
+        return {
+            custom_id: _clean_developments(parsed.get(custom_id), source_url)
+            for custom_id, (_, source_url) in pages.items()
+        }
+
+    async def _call_claude(self, prompt: str, label: str = "") -> LLMCallResult:
+        async with self._semaphore:
+            try:
+                response = await asend_tracked(self.client, self.metrics, label, self._request(prompt))
+            except Exception as e:
+                return _api_error(e)
+        return _handle_response(response)
+
+
+def _api_error(error: Exception) -> LLMCallResult:
+    if isinstance(error, anthropic.RateLimitError):
+        print("    Claude API rate limited -- skipping this page")
+    else:
+        print(f"    Claude API error: {error}")
+    return None, 0, 0
+
+
+def _handle_response(response) -> LLMCallResult:
+    usage = getattr(response, "usage", None)
+    input_tokens = getattr(usage, "input_tokens", 0) or 0
+    output_tokens = getattr(usage, "output_tokens", 0) or 0
+    # An empty or non-text reply (e.g. refusal, tool use) degrades to no developments
+    content = getattr(response, "content", None) or []
+    text = getattr(content[0], "text", None) if content else None
+    if not isinstance(text, str):
+        print("    Claude returned no text -- skipping this page")
+        return None, input_tokens, output_tokens
+    return _parse_response(text), input_tokens, output_tokens
+
+
+def _clean_developments(parsed: Optional[dict], source_url: str) -> list[dict]:
+    """Validate and clean the developments array from a parsed reply."""
+    if not parsed or "developments" not in parsed:
+        return []
+
+    developments = parsed["developments"]
+    if not isinstance(developments, list):
+        return []
+
+    # Validate and clean each development
+    cleaned = []
+    for dev in developments:
+        if not isinstance(dev, dict):
+            continue
+        name = dev.get("name", "").strip()
+        if not name or len(name) < 3:
+            continue
+
+        # Validate constrained fields
+        if dev.get("region") and dev["region"] not in VALID_REGIONS:
+            dev["region"] = None
+        if dev.get("status") and dev["status"] not in VALID_STATUSES:
+            dev["status"] = None
+        if dev.get("development_type") and dev["development_type"] not in VALID_DEVELOPMENT_TYPES:
+            dev["development_type"] = "Multifamily"
+
+        dev["_source_url"] = source_url
+        cleaned.append(dev)
 
-        # Validate and clean each development
-        cleaned = []
-        for dev in developments:
-            if not isinstance(dev, dict):
-                continue
-            name = dev.get("name", "").strip()
-            if not name or len(name) < 3:
-                continue
-
-            # Validate constrained fields
-            if dev.get("region") and dev["region"] not in VALID_REGIONS:
-                dev["region"] = None
-            if dev.get("status") and dev["status"] not in VALID_STATUSES:
-                dev["status"] = None
-            if dev.get("development_type") and dev["development_type"] not in VALID_DEVELOPMENT_TYPES:
-                dev["development_type"] = "Multifamily"
-
-            dev["_source_url"] = source_url
-            cleaned.append(dev)
-
-        return cleaned
+    return cleaned
 
 
 def _parse_response(text: str) -> Optional[dict]:
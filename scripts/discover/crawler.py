@@ -1,48 +1,79 @@
 import asyncio
-import logging
-
-from crawl4ai import AsyncWebCrawler
+from typing import Optional
 
+from browser_pool import BrowserPool
+from crawl_cache import CrawlCache
+from domain_classifier import host_of
+from rate_limiter import DomainRateLimiter
 from models import CrawlResult
+from timing import StageTimer, span
+
+
+async def crawl_url(
+    url: str,
+    pool: BrowserPool,
+    limiter: DomainRateLimiter,
+    cache: Optional[CrawlCache] = None,
+) -> CrawlResult:
+    """
+    Crawl one URL in a pooled tab, waiting for its domain's rate limit first.
+    With a cache, fresh or revalidated pages are served without rendering.
+    """
+    try:
+        if cache is not None:
+            result = await cache.fetch(url, host_of(url), pool, limiter)
+        else:
+            await limiter.acquire(host_of(url))
+            result = await pool.arun(url)
+        content = result.markdown if hasattr(result, "markdown") else ""
+        title = ""
+        if hasattr(result, "metadata") and result.metadata:
+            title = result.metadata.get("title", "")
 
-# Suppress Crawl4AI's noisy logging
-logging.getLogger("crawl4ai").setLevel(logging.WARNING)
+        success = result.success if hasattr(result, "success") else bool(content)
 
+        return CrawlResult(
+            url=url,
+            success=success,
+            content=content,
+            title=title,
+        )
+    except Exception as e:
+        return CrawlResult(
+            url=url,
+            success=False,
+            content="",
+            title="",
+            error=str(e),
+        )
 
-async def crawl_urls(urls: list[str], delay: float = 5.0) -> list[CrawlResult]:
+
+async def crawl_urls(
+    urls: list[str],
+    delay: float = 5.0,
+    pool: Optional[BrowserPool] = None,
+    limiter: Optional[DomainRateLimiter] = None,
+    cache: Optional[CrawlCache] = None,
+    timer: Optional[StageTimer] = None,
+) -> list[CrawlResult]:
     """
-    Crawl a list of URLs with Crawl4AI and return their markdown content.
-    Uses a single browser instance for efficiency. Rate limited between requests.
+    Crawl a list of URLs with Crawl4AI and return their markdown content
+    (in input order). Borrows tabs from a shared BrowserPool (opens its own
+    if none is given). Rate limited per domain: URLs on different hosts are
+    crawled in parallel, each host sees at least `delay` seconds between hits.
+    Pages in `cache` are served without a browser render. Each URL is timed
+    as a "crawl" span for its domain.
     """
-    results: list[CrawlResult] = []
-
-    async with AsyncWebCrawler(verbose=False) as crawler:
-        for i, url in enumerate(urls):
-            if i > 0:
-                await asyncio.sleep(delay)
-
-            try:
-                result = await crawler.arun(url=url)
-                content = result.markdown if hasattr(result, "markdown") else ""
-                title = ""
-                if hasattr(result, "metadata") and result.metadata:
-                    title = result.metadata.get("title", "")
-
-                success = result.success if hasattr(result, "success") else bool(content)
-
-                results.append(CrawlResult(
-                    url=url,
-                    success=success,
-                    content=content,
-                    title=title,
-                ))
-            except Exception as e:
-                results.append(CrawlResult(
-                    url=url,
-                    success=False,
-                    content="",
-                    title="",
-                    error=str(e),
-                ))
-
-    return results
+    if pool is None:
+        async with BrowserPool(max_tabs=1) as own_pool:
+            return await crawl_urls(urls, delay, own_pool, limiter, cache, timer)
+    if limiter is None:
+        limiter = DomainRateLimiter(delay)
+
+    pool.open_session()
+
+    async def timed_crawl(url: str) -> CrawlResult:
+        with span(timer, "crawl", host_of(url)):
+            return await crawl_url(url, pool, limiter, cache)
+
+    return list(await asyncio.gather(*(timed_crawl(url) for url in urls)))
@@ -1,4 +1,5 @@
 import re
+from typing import Optional
 
 from supabase import create_client
 
@@ -23,6 +24,115 @@ def fetch_existing_developments(supabase_url: str, supabase_key: str) -> dict[st
     return name_to_slug
 
 
+_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+
+# Names shorter than this (after normalization) never fuzzy-match
+MIN_FUZZY_LENGTH = 5
+NGRAM = 3
+
+
+def _normalize_name(name_lower: str) -> str:
+    return _NON_ALNUM.sub("", name_lower)
+
+
+class ExistingDevelopmentIndex:
+    """
+    Match index over the existing database developments, built once per run.
+
+    Implements check_against_database's rules without scanning every DB name
+    per discovery:
+      - exact slug: a set lookup
+      - discovered name contained in a DB name: trigram postings narrow the
+        candidates to DB names sharing the rarest trigram, in DB order
+      - DB name contained in the discovered name: one Aho-Corasick pass over
+        the discovered name finds every DB name occurring in it
+
+    When several DB names match, the earliest in `existing` order wins, as
+    with the original linear scan.
+    """
+
+    def __init__(self, existing: dict[str, str]):
+        self.slugs = set(existing.values())
+        # Eligible entries only, in `existing` order: (db_name, slug, normalized)
+        self.entries: list[tuple[str, str, str]] = []
+        for db_name, db_slug in existing.items():
+            normalized = _normalize_name(db_name)
+            if len(normalized) >= MIN_FUZZY_LENGTH:
+                self.entries.append((db_name, db_slug, normalized))
+
+        self._postings: dict[str, list[int]] = {}
+        for i, (_, _, normalized) in enumerate(self.entries):
+            for gram in {normalized[j : j + NGRAM] for j in range(len(normalized) - NGRAM + 1)}:
+                self._postings.setdefault(gram, []).append(i)
+
+        self._build_automaton()
+
+    def _build_automaton(self) -> None:
+        """Aho-Corasick automaton over the normalized DB names."""
+        self._goto: list[dict[str, int]] = [{}]
+        # Earliest entry index ending at each state (including via fail links)
+        self._first_match: list[float] = [float("inf")]
+        for i, (_, _, normalized) in enumerate(self.entries):
+            state = 0
+            for ch in normalized:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._first_match.append(float("inf"))
+                state = nxt
+            self._first_match[state] = min(self._first_match[state], i)
+
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:  # breadth-first: queue grows as we go
+            for ch, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._first_match[nxt] = min(self._first_match[nxt], self._first_match[self._fail[nxt]])
+                queue.append(nxt)
+
+    def _first_contained_in(self, text: str) -> float:
+        """Earliest entry whose normalized name occurs in `text`."""
+        best = float("inf")
+        state = 0
+        for ch in text:
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            best = min(best, self._first_match[state])
+        return best
+
+    def _first_containing(self, text: str) -> float:
+        """Earliest entry whose normalized name contains `text`."""
+        grams = {text[j : j + NGRAM] for j in range(len(text) - NGRAM + 1)}
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return float("inf")
+            postings.append(posting)
+        for i in min(postings, key=len):
+            if text in self.entries[i][2]:
+                return i
+        return float("inf")
+
+    def find_name_match(self, name: str) -> Optional[tuple[str, str]]:
+        """Return (db_name, db_slug) for the first fuzzy match of `name`, if any."""
+        normalized = _normalize_name(name.lower().strip())
+        if len(normalized) < MIN_FUZZY_LENGTH:
+            return None
+        best = min(self._first_containing(normalized), self._first_contained_in(normalized))
+        if best == float("inf"):
+            return None
+        db_name, db_slug, _ = self.entries[int(best)]
+        return db_name, db_slug
+
+
 def check_against_database(
     developments: list[DiscoveredDevelopment],
     existing: dict[str, str],
@@ -31,32 +141,20 @@ def check_against_database(
     Mark each development as NEW or EXISTING by checking against the database.
     Modifies developments in-place.
     """
-    existing_slugs = set(existing.values())
+    index = ExistingDevelopmentIndex(existing)
 
     for dev in developments:
         # Layer 1: Exact slug match
-        if dev.slug in existing_slugs:
+        if dev.slug in index.slugs:
             dev.is_new = False
             dev.notes.append(f"Slug '{dev.slug}' already in database")
             continue
 
         # Layer 2: Fuzzy name match (substring containment)
-        dev_name_lower = dev.name.lower().strip()
-        dev_name_normalized = re.sub(r"[^a-z0-9\s]", "", dev_name_lower)
-
-        matched = False
-        for db_name, db_slug in existing.items():
-            db_name_normalized = re.sub(r"[^a-z0-9\s]", "", db_name)
-
-            # Skip very short names to avoid false matches
-            if len(dev_name_normalized) < 5 or len(db_name_normalized) < 5:
-                continue
-
-            if dev_name_normalized in db_name_normalized or db_name_normalized in dev_name_normalized:
-                dev.is_new = False
-                dev.notes.append(f"Fuzzy match with existing: '{db_name}' ({db_slug})")
-                matched = True
-                break
-
-        if not matched:
+        match = index.find_name_match(dev.name)
+        if match:
+            db_name, db_slug = match
+            dev.is_new = False
+            dev.notes.append(f"Fuzzy match with existing: '{db_name}' ({db_slug})")
+        else:
             dev.is_new = True
@@ -1,6 +1,6 @@
 import re
-from urllib.parse import urlparse
 
+from domain_classifier import get_domain_classifier
 from models import (
     Confidence,
     DiscoveredDevelopment,
@@ -24,6 +24,7 @@ def deduplicate_developments(raw_developments: list[dict]) -> list[DiscoveredDev
     score confidence, and return a sorted list of DiscoveredDevelopment.
     """
     groups: dict[str, list[dict]] = {}
+    index = _GroupIndex()
 
     for dev in raw_developments:
         name = dev.get("name", "").strip()
@@ -34,11 +35,12 @@ def deduplicate_developments(raw_developments: list[dict]) -> list[DiscoveredDev
         if not slug:
             continue
 
-        match_key = _find_match_key(groups, slug, name)
+        match_key = index.find_match_key(slug, name)
         if match_key:
             groups[match_key].append(dev)
         else:
             groups[slug] = [dev]
+            index.add(slug, name)
 
     results = []
     for slug, group in groups.items():
@@ -56,27 +58,108 @@ def deduplicate_developments(raw_developments: list[dict]) -> list[DiscoveredDev
     return results
 
 
-def _find_match_key(groups: dict[str, list[dict]], candidate_slug: str, candidate_name: str) -> str | None:
-    """Fuzzy slug/name matching to group duplicate extractions."""
-    if candidate_slug in groups:
-        return candidate_slug
+def _normalize_for_match(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
 
-    normalized = re.sub(r"[^a-z0-9]", "", candidate_name.lower())
-    for key, group in groups.items():
-        existing_name = re.sub(r"[^a-z0-9]", "", group[0].get("name", "").lower())
 
-        # Substring containment
-        if len(normalized) > 5 and len(existing_name) > 5:
-            if normalized in existing_name or existing_name in normalized:
-                return key
+# Names/slugs must be longer than this to fuzzy-match
+MIN_MATCH_LENGTH = 5
+# Slugs matching by prefix may differ by at most this many characters
+MAX_SLUG_PREFIX_DIFF = 2
+NGRAM = 3
 
-        # Slug prefix match (differ by <=2 chars)
-        if len(candidate_slug) > 5 and len(key) > 5:
-            if candidate_slug.startswith(key) or key.startswith(candidate_slug):
-                if abs(len(candidate_slug) - len(key)) <= 2:
-                    return key
 
-    return None
+class _GroupIndex:
+    """
+    Blocking index over dedup groups for fuzzy slug/name matching.
+
+    A new mention matches a group (keyed by slug, named by its first
+    mention) when, with both sides long enough:
+      - one normalized name contains the other, or
+      - one slug is a prefix of the other and they differ by <= 2 chars.
+    The earliest matching group wins.
+
+    Rather than testing every group, candidates come from blocks:
+      - groups whose name contains the mention's name: postings of the
+        mention's rarest trigram
+      - groups whose name occurs in the mention's name: groups whose
+        first trigram occurs in the mention's name
+      - slug prefixes: exact lookups of the mention's slug and its
+        1-2 char shorter prefixes, plus each group slug's shorter prefixes
+    Normalized names are computed once per group.
+    """
+
+    def __init__(self):
+        self._order: dict[str, int] = {}  # group key -> creation order
+        self._keys: list[str] = []
+        self._names: list[str] = []  # normalized name of each group's first mention
+        self._postings: dict[str, list[int]] = {}  # trigram -> groups whose name has it
+        self._first_grams: dict[str, list[int]] = {}  # first trigram -> groups
+        self._prefixes: dict[str, list[int]] = {}  # slug minus 0-2 trailing chars -> groups
+
+    def add(self, key: str, name: str) -> None:
+        order = len(self._keys)
+        self._order[key] = order
+        self._keys.append(key)
+        normalized = _normalize_for_match(name)
+        self._names.append(normalized)
+
+        if len(normalized) > MIN_MATCH_LENGTH:
+            for gram in {normalized[i : i + NGRAM] for i in range(len(normalized) - NGRAM + 1)}:
+                self._postings.setdefault(gram, []).append(order)
+            self._first_grams.setdefault(normalized[:NGRAM], []).append(order)
+
+        if len(key) > MIN_MATCH_LENGTH:
+            for cut in range(MAX_SLUG_PREFIX_DIFF + 1):
+                self._prefixes.setdefault(key[: len(key) - cut], []).append(order)
+
+    def find_match_key(self, candidate_slug: str, candidate_name: str) -> str | None:
+        """Fuzzy slug/name matching to group duplicate extractions."""
+        if candidate_slug in self._order:
+            return candidate_slug
+
+        best = len(self._keys)
+        normalized = _normalize_for_match(candidate_name)
+        if len(normalized) > MIN_MATCH_LENGTH:
+            best = min(best, self._first_containing(normalized), self._first_contained_in(normalized))
+
+        if len(candidate_slug) > MIN_MATCH_LENGTH:
+            # Group slug is a prefix of the candidate (same length or up to 2 shorter)
+            for cut in range(MAX_SLUG_PREFIX_DIFF + 1):
+                order = self._order.get(candidate_slug[: len(candidate_slug) - cut])
+                if order is not None and len(self._keys[order]) > MIN_MATCH_LENGTH:
+                    best = min(best, order)
+            # Candidate is a prefix of the group slug (up to 2 longer)
+            for order in self._prefixes.get(candidate_slug, ()):
+                best = min(best, order)
+                break  # postings are in creation order
+
+        return self._keys[best] if best < len(self._keys) else None
+
+    def _first_containing(self, normalized: str) -> int:
+        """Earliest group whose name contains `normalized`."""
+        postings = []
+        for gram in {normalized[i : i + NGRAM] for i in range(len(normalized) - NGRAM + 1)}:
+            posting = self._postings.get(gram)
+            if not posting:
+                return len(self._keys)
+            postings.append(posting)
+        for order in min(postings, key=len):
+            if normalized in self._names[order]:
+                return order
+        return len(self._keys)
+
+    def _first_contained_in(self, normalized: str) -> int:
+        """Earliest group whose name occurs in `normalized`."""
+        best = len(self._keys)
+        for gram in {normalized[i : i + NGRAM] for i in range(len(normalized) - NGRAM + 1)}:
+            for order in self._first_grams.get(gram, ()):
+                if order >= best:
+                    break
+                if self._names[order] in normalized:
+                    best = order
+                    break
+        return best
 
 
 def _merge_group(slug: str, group: list[dict]) -> DiscoveredDevelopment:
@@ -184,33 +267,6 @@ def _score_confidence(dev: DiscoveredDevelopment) -> float:
     return min(score, 1.0)
 
 
-NEWS_SITES = [
-    "btrnews.co.uk", "reactnews.com", "propertyweek.com",
-    "egi.co.uk", "estatesgazette.com", "insidehousing.co.uk",
-    "placenorth.co.uk", "urbanliving.news",
-]
-
-PROPERTY_PORTALS = [
-    "rightmove.co.uk", "zoopla.co.uk", "onthemarket.com",
-    "openrent.com", "spareroom.co.uk",
-]
-
-PLANNING_SITES = [
-    "planningportal.co.uk", "planningresource.co.uk",
-]
-
-
 def _classify_source(url: str) -> str:
-    """Classify a URL by source type."""
-    try:
-        domain = urlparse(url).netloc.lower().replace("www.", "")
-    except Exception:
-        return "other"
-
-    if any(site in domain for site in NEWS_SITES):
-        return "news"
-    if any(site in domain for site in PROPERTY_PORTALS):
-        return "property_portal"
-    if any(site in domain for site in PLANNING_SITES):
-        return "planning"
-    return "other"
+    """Classify a URL by source type (see verify/source_domains.json)."""
+    return get_domain_classifier().source_type(url) or "other"
@@ -10,6 +10,8 @@ Usage:
   python scripts/discover/main.py --query "custom"    # Single custom query
   python scripts/discover/main.py --test --generate-sql
   python scripts/discover/main.py --test --no-llm     # Skip Claude, collect URLs only
+  python scripts/discover/main.py --test --cache-mode bypass
+  python scripts/discover/main.py --all --llm-batch
 """
 
 import argparse
@@ -24,26 +26,34 @@ if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
-# Add discover/ to path first (takes priority), verify/ appended for postcode lookups
+# Add discover/ to path first (takes priority); verify/ is appended for the shared modules
+# (browser pool, crawl cache, rate limiter, LLM cache/metrics/batches, boilerplate,
+# content selector, domain classifier, postcode lookups, timing)
 scripts_dir = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 sys.path.append(str(scripts_dir / "verify"))
 
 from dotenv import load_dotenv
 
-# Load env before any imports that need it
-env_path = scripts_dir / ".env"
+# Load env before any imports that need it (BTR_ENV_FILE points elsewhere, e.g. benchmarks)
+env_path = Path(os.getenv("BTR_ENV_FILE") or scripts_dir / ".env")
 if env_path.exists():
     load_dotenv(env_path, override=True)
 
 from search import build_discovery_queries, search_serpapi, cap_urls
 from crawler import crawl_urls
-from analyzer import DiscoveryAnalyzer
+from browser_pool import BrowserPool
+from rate_limiter import DomainRateLimiter, parse_domain_delays
+from crawl_cache import CACHE_MODES, CrawlCache
+from llm_batch import MessageBatchRunner
+from llm_cache import LLMCache
+from analyzer import DISCOVERY_CONTENT_TOKENS, AsyncDiscoveryAnalyzer
 from deduplicator import deduplicate_developments
 from db_check import fetch_existing_developments, check_against_database
 from output_csv import generate_csv_report
 from output_summary import generate_summary
 from output_sql import generate_sql_inserts
+from timing import StageTimer, span
 
 
 def parse_args() -> argparse.Namespace:
@@ -65,6 +75,20 @@ def parse_args() -> argparse.Namespace:
                         help="Skip Claude analysis (just collect URLs and titles)")
     parser.add_argument("--max-urls", type=int, default=50,
                         help="Max URLs to crawl (default: 50)")
+    parser.add_argument("--browser-tabs", type=int,
+                        default=int(os.getenv("BROWSER_TABS", "4")),
+                        help="Concurrent tabs in the shared browser (default: 4)")
+    parser.add_argument("--llm-workers", type=int,
+                        default=int(os.getenv("LLM_WORKERS", "4")),
+                        help="Concurrent Claude analysis calls (default: 4)")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default="use",
+                        help="Crawl cache: use (default), refresh (re-crawl and store), bypass")
+    parser.add_argument("--llm-batch", action="store_true",
+                        help="Send all extraction prompts via Message Batches (cheaper, slower)")
+    parser.add_argument("--llm-cache-mode", choices=CACHE_MODES, default="use",
+                        help="LLM result cache: use (default), refresh (re-analyze and store), bypass")
+    parser.add_argument("--postcode-cache-mode", choices=CACHE_MODES, default="use",
+                        help="Postcode result cache: use (default), refresh (re-query and store), bypass")
 
     return parser.parse_args()
 
@@ -121,9 +145,10 @@ async def main():
         mode_label = "TEST"
         max_urls = min(args.max_urls, 30)
 
-    output_dir = scripts_dir / "output"
-    output_dir.mkdir(exist_ok=True)
+    output_dir = Path(os.getenv("OUTPUT_DIR") or scripts_dir / "output")
+    output_dir.mkdir(parents=True, exist_ok=True)
     date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timer = StageTimer()
 
     print()
     print("=" * 60)
@@ -131,7 +156,12 @@ async def main():
     print("=" * 60)
     print(f"  Mode: {mode_label}")
     print(f"  LLM Analysis: {'Enabled (Claude)' if use_llm else 'Disabled (--no-llm)'}")
+    if use_llm and args.llm_batch:
+        print("  LLM Mode: Message Batches (--llm-batch)")
     print(f"  Max URLs: {max_urls}")
+    print(f"  Crawl cache: {args.cache_mode}")
+    print(f"  LLM cache: {args.llm_cache_mode}")
+    print(f"  Postcode cache: {args.postcode_cache_mode}")
     print(f"  Generate SQL: {'Yes' if args.generate_sql else 'No'}")
     print()
 
@@ -141,7 +171,8 @@ async def main():
         mode=mode,
         custom_query=args.query,
     )
-    search_results = await search_serpapi(queries)
+    with span(timer, "search"):
+        search_results = await search_serpapi(queries)
     print(f"  Total unique URLs found: {len(search_results)}")
 
     if not search_results:
@@ -155,12 +186,26 @@ async def main():
     # ---- Step 2: Crawl ----
     print("Step 2: Crawling URLs with Crawl4AI...")
     urls_to_crawl = [r.url for r in capped]
-    crawl_results = await crawl_urls(urls_to_crawl, delay=5.0)
+    limiter = DomainRateLimiter(
+        default_delay=5.0,
+        overrides=parse_domain_delays(os.getenv("CRAWL_DOMAIN_DELAYS", "")),
+    )
+    cache = CrawlCache(
+        cache_dir=Path(os.getenv("CRAWL_CACHE_DIR") or output_dir / "crawl_cache"),
+        mode=args.cache_mode,
+        ttl_hours=float(os.getenv("CRAWL_CACHE_TTL_HOURS", "24")),
+        max_bytes=int(os.getenv("CRAWL_CACHE_MAX_MB", "500")) * 1024 * 1024,
+    )
+    async with BrowserPool(max_tabs=args.browser_tabs) as pool, cache:
+        crawl_results = await crawl_urls(urls_to_crawl, pool=pool, limiter=limiter, cache=cache, timer=timer)
 
     successful = [r for r in crawl_results if r.success and r.content]
     failed = [r for r in crawl_results if not r.success]
     print(f"  Successfully crawled: {len(successful)}")
     print(f"  Failed: {len(failed)}")
+    print(f"  {pool.stats_line()}")
+    print(f"  {limiter.stats_line()}")
+    print(f"  {cache.stats_line()}")
     if failed:
         for r in failed[:5]:
             print(f"    - {r.url}: {r.error or 'unknown error'}")
@@ -170,22 +215,61 @@ async def main():
 
     # ---- Step 3: Extract developments ----
     all_raw_developments = []
+    llm_cache = None
+    analyzer = None
 
     if use_llm and successful:
         print("Step 3: Extracting developments with Claude...")
         anthropic_key = os.getenv("ANTHROPIC_API_KEY", "")
-        analyzer = DiscoveryAnalyzer(api_key=anthropic_key)
-
-        for i, crawl in enumerate(successful, 1):
-            print(f"  [{i}/{len(successful)}] Analyzing: {crawl.url[:80]}...")
-            developments = analyzer.extract_developments(crawl.content, crawl.url)
+        llm_cache = LLMCache(
+            Path(os.getenv("LLM_CACHE_DIR") or output_dir / "llm_cache"),
+            mode=args.llm_cache_mode,
+        )
+        analyzer = AsyncDiscoveryAnalyzer(
+            api_key=anthropic_key, cache=llm_cache, max_concurrency=args.llm_workers,
+            content_tokens=int(os.getenv("DISCOVER_CONTENT_TOKENS", str(DISCOVERY_CONTENT_TOKENS))),
+        )
+        # Learn each site's template from every crawled page before stripping it
+        for crawl in successful:
+            analyzer.boilerplate.observe(crawl.url, crawl.content)
+        done = 0
+        batch_runner = None
+
+        async def analyze(crawl) -> list[dict]:
+            nonlocal done
+            with span(timer, "llm"):
+                developments = await analyzer.extract_developments(crawl.content, crawl.url)
+            done += 1
+            print(f"  [{done}/{len(successful)}] Analyzed: {crawl.url[:80]}")
             if developments:
                 print(f"    Found {len(developments)} development(s)")
-                all_raw_developments.extend(developments)
             else:
                 print(f"    No developments found")
+            return developments
+
+        if args.llm_batch:
+            batch_runner = MessageBatchRunner(
+                analyzer.client,
+                poll_interval=float(os.getenv("LLM_BATCH_POLL_SECONDS", "30")),
+            )
+            with span(timer, "llm"):
+                by_page = await analyzer.extract_batch(
+                    batch_runner,
+                    {f"page-{i}": (c.content, c.url) for i, c in enumerate(successful)},
+                )
+            for i in range(len(successful)):
+                all_raw_developments.extend(by_page[f"page-{i}"])
+        else:
+            # Pages are analyzed concurrently; results are kept in crawl order
+            for developments in await asyncio.gather(*(analyze(c) for c in successful)):
+                all_raw_developments.extend(developments)
 
         print(f"  Total raw mentions: {len(all_raw_developments)}")
+        print(f"  {llm_cache.stats_line()}")
+        print(f"  {analyzer.boilerplate.stats_line()}")
+        print(f"  {analyzer.metrics.stats_line()}")
+        if batch_runner:
+            print(f"  {batch_runner.stats_line()}")
         print()
     elif not use_llm:
         print("Step 3: Skipped (--no-llm)")
@@ -196,20 +280,34 @@ async def main():
 
     # ---- Step 4: Deduplicate ----
     print("Step 4: Deduplicating discoveries...")
-    deduplicated = deduplicate_developments(all_raw_developments)
+    with span(timer, "dedupe"):
+        deduplicated = deduplicate_developments(all_raw_developments)
     print(f"  Unique developments after dedup: {len(deduplicated)}")
     print()
 
     # ---- Step 5: Enrich with postcodes.io ----
     # Import postcode lookup from verify tool
     try:
-        from postcode import lookup_postcode
+        from postcode import (
+            close_postcode_service,
+            configure_postcode_service,
+            get_postcode_service,
+            lookup_postcodes,
+        )
 
+        configure_postcode_service(
+            os.getenv("POSTCODE_INDEX") or output_dir / "postcode_index.bin",
+            cache_path=os.getenv("POSTCODE_CACHE") or output_dir / "postcode_cache.sqlite",
+            cache_mode=args.postcode_cache_mode,
+            cache_ttl_hours=float(os.getenv("POSTCODE_CACHE_TTL_HOURS", "720")),
+            cache_negative_ttl_hours=float(os.getenv("POSTCODE_CACHE_NEGATIVE_TTL_HOURS", "168")),
+        )
         postcode_devs = [d for d in deduplicated if d.postcode and not d.latitude]
         if postcode_devs:
             print("Step 5: Enriching postcodes via postcodes.io...")
-            for dev in postcode_devs:
-                pc_data = await lookup_postcode(dev.postcode)
+            with span(timer, "postcode"):
+                lookups = await lookup_postcodes([dev.postcode for dev in postcode_devs])
+            for dev, pc_data in zip(postcode_devs, lookups):
                 if pc_data and pc_data.valid:
                     if pc_data.latitude and not dev.latitude:
                         dev.latitude = pc_data.latitude
@@ -217,6 +315,11 @@ async def main():
                         dev.longitude = pc_data.longitude
                     if pc_data.region and not dev.region:
                         dev.region = pc_data.region
+            postcode_service = get_postcode_service()
+            print(f"  {postcode_service.stats_line()}")
+            if postcode_service.cache:
+                print(f"  {postcode_service.cache.stats_line()}")
+            await close_postcode_service()
             print(f"  Enriched {len(postcode_devs)} development(s)")
             print()
         else:
@@ -231,10 +334,11 @@ async def main():
     supabase_url = os.getenv("SUPABASE_URL", "")
     supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
 
-    existing = fetch_existing_developments(supabase_url, supabase_key)
-    print(f"  Existing developments in database: {len(existing)}")
+    with span(timer, "db_check"):
+        existing = fetch_existing_developments(supabase_url, supabase_key)
+        print(f"  Existing developments in database: {len(existing)}")
 
-    check_against_database(deduplicated, existing)
+        check_against_database(deduplicated, existing)
     new_count = sum(1 for d in deduplicated if d.is_new)
     existing_count = sum(1 for d in deduplicated if not d.is_new)
     print(f"  NEW (not in database): {new_count}")
@@ -244,9 +348,20 @@ async def main():
     # ---- Step 7: Generate outputs ----
     print("Step 7: Generating reports...")
 
-    csv_path = generate_csv_report(deduplicated, date_str, output_dir)
-    print(f"  CSV report:  {csv_path}")
+    with span(timer, "output"):
+        csv_path = generate_csv_report(deduplicated, date_str, output_dir)
+        print(f"  CSV report:  {csv_path}")
+
+        if args.generate_sql:
+            sql_path = generate_sql_inserts(deduplicated, date_str, output_dir)
+            print(f"  SQL inserts: {sql_path}")
 
+    extra_sections = []
+    if llm_cache:
+        extra_sections += [
+            llm_cache.summary_lines(), analyzer.metrics.summary_lines(), analyzer.boilerplate.summary_lines(),
+        ]
+    extra_sections.append(timer.summary_lines())
     summary_path = generate_summary(
         deduplicated, date_str, output_dir,
         mode=mode_label,
@@ -255,12 +370,15 @@ async def main():
         urls_crawled=len(successful),
         urls_failed=len(failed),
         raw_mentions=len(all_raw_developments),
+        extra_sections=extra_sections,
     )
     print(f"  Summary:     {summary_path}")
 
-    if args.generate_sql:
-        sql_path = generate_sql_inserts(deduplicated, date_str, output_dir)
-        print(f"  SQL inserts: {sql_path}")
+    if analyzer:
+        metrics_path = analyzer.metrics.write_json(output_dir / f"discovery_llm_metrics_{date_str}.json")
+        print(f"  LLM metrics: {metrics_path}")
+    timings_path = timer.write_json(output_dir / f"discovery_timings_{date_str}.json")
+    print(f"  Timings:     {timings_path}")
 
     # ---- Summary ----
     print()
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from models import Confidence, DiscoveredDevelopment
 
@@ -13,8 +14,12 @@ def generate_summary(
     urls_crawled: int = 0,
     urls_failed: int = 0,
     raw_mentions: int = 0,
+    extra_sections: Optional[list[list[str]]] = None,
 ) -> Path:
-    """Generate a human-readable text summary of the discovery run."""
+    """
+    Generate a human-readable text summary of the discovery run.
+    `extra_sections` are pre-formatted run statistics blocks (LLM cache etc.).
+    """
     filename = f"discovery_summary_{date_str}.txt"
     filepath = output_dir / filename
 
@@ -56,6 +61,10 @@ def generate_summary(
     lines.append(f"  LOW:    {len(low_new)}")
     lines.append("")
 
+    for section in extra_sections or []:
+        lines.extend(section)
+        lines.append("")
+
     if new_devs:
         lines.append("-" * 60)
         lines.append("TOP NEW DISCOVERIES:")
@@ -4,23 +4,10 @@ from urllib.parse import urlparse
 
 import httpx
 
+from domain_classifier import get_domain_classifier
 from models import SearchResult
 
 
-EXCLUDED_DOMAINS = {
-    # Social media
-    "youtube.com", "linkedin.com", "twitter.com", "x.com",
-    "facebook.com", "instagram.com", "tiktok.com",
-    "pinterest.com", "reddit.com",
-    # Government / reference
-    "companieshouse.gov.uk", "gov.uk", "wikipedia.org",
-    # Market overview sites (rarely name specific developments)
-    "savills.co.uk", "knightfrank.co.uk", "jll.co.uk",
-    "bpf.org.uk", "century21uk.com", "lrg.co.uk",
-    "cbre.co.uk", "cushmanwakefield.com",
-}
-
-
 def build_discovery_queries(mode: str = "test", custom_query: str = None) -> list[str]:
     """Build broad BTR discovery search queries."""
     if custom_query:
@@ -65,6 +52,7 @@ async def search_serpapi(queries: list[str], delay: float = 2.0) -> list[SearchR
 
     all_results: list[SearchResult] = []
     seen_urls: set[str] = set()
+    classifier = get_domain_classifier()
 
     async with httpx.AsyncClient(timeout=30.0) as client:
         for i, query in enumerate(queries):
@@ -75,7 +63,7 @@ async def search_serpapi(queries: list[str], delay: float = 2.0) -> list[SearchR
 
             try:
                 resp = await client.get(
-                    "https://serpapi.com/search.json",
+                    os.getenv("SERPAPI_URL") or "https://serpapi.com/search.json",
                     params={
                         "engine": "google",
                         "q": query,
@@ -100,9 +88,8 @@ async def search_serpapi(queries: list[str], delay: float = 2.0) -> list[SearchR
                 if not url:
                     continue
 
-                # Skip excluded domains
-                domain = _get_domain(url)
-                if any(excl in domain for excl in EXCLUDED_DOMAINS):
+                # Skip excluded domains (social media, gov.uk, market overviews)
+                if classifier.is_excluded(url):
                     continue
 
                 # Dedup by URL
@@ -129,13 +116,6 @@ def cap_urls(results: list[SearchResult], max_urls: int = 50) -> list[SearchResu
     return results[:max_urls]
 
 
-def _get_domain(url: str) -> str:
-    try:
-        return urlparse(url).netloc.lower().replace("www.", "")
-    except Exception:
-        return ""
-
-
 def _normalize_url(url: str) -> str:
     """Normalize URL for dedup (strip trailing slash, fragment, query params)."""
     try:
@@ -0,0 +1,57 @@
+import random
+import re
+import sys
+from pathlib import Path
+
+# As in main.py: discover/ first, verify/ appended for the shared modules
+sys.path.append(str(Path(__file__).resolve().parent.parent / "verify"))
+
+from db_check import check_against_database  # noqa: E402
+from models import DiscoveredDevelopment  # noqa: E402
+
+WORDS = ["the", "park", "parkside", "quay", "mill", "mills", "north", "court", "house", "one", "st", "james", "no.", "8"]
+
+
+def _reference_check(developments: list[DiscoveredDevelopment], existing: dict[str, str]) -> None:
+    """check_against_database as it was before the index: a scan of every DB name per discovery."""
+    existing_slugs = set(existing.values())
+    for dev in developments:
+        if dev.slug in existing_slugs:
+            dev.is_new = False
+            dev.notes.append(f"Slug '{dev.slug}' already in database")
+            continue
+        dev_name_normalized = re.sub(r"[^a-z0-9\s]", "", dev.name.lower().strip())
+        matched = False
+        for db_name, db_slug in existing.items():
+            db_name_normalized = re.sub(r"[^a-z0-9\s]", "", db_name)
+            if len(dev_name_normalized) < 5 or len(db_name_normalized) < 5:
+                continue
+            if dev_name_normalized in db_name_normalized or db_name_normalized in dev_name_normalized:
+                dev.is_new = False
+                dev.notes.append(f"Fuzzy match with existing: '{db_name}' ({db_slug})")
+                matched = True
+                break
+        if not matched:
+            dev.is_new = True
+
+
+def _name(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))).title()
+
+
+def test_index_matches_linear_scan():
+    rng = random.Random(14)
+    for _ in range(200):
+        existing = {}
+        for i in range(rng.randint(0, 30)):
+            existing[_name(rng).lower()] = f"slug-{rng.randint(0, 40)}"
+        developments = [
+            DiscoveredDevelopment(name=_name(rng), slug=f"slug-{rng.randint(0, 80)}")
+            for _ in range(rng.randint(1, 30))
+        ]
+        expected = [DiscoveredDevelopment(name=d.name, slug=d.slug) for d in developments]
+
+        check_against_database(developments, existing)
+        _reference_check(expected, existing)
+
+        assert [(d.is_new, d.notes) for d in developments] == [(d.is_new, d.notes) for d in expected]
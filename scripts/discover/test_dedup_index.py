@@ -0,0 +1,51 @@
+import random
+import re
+import sys
+from pathlib import Path
+
+# As in main.py: discover/ first, verify/ appended for the shared modules
+sys.path.append(str(Path(__file__).resolve().parent.parent / "verify"))
+
+from deduplicator import _GroupIndex, generate_slug  # noqa: E402
+
+WORDS = ["the", "park", "parks", "parkside", "quay", "mill", "mills", "north", "court", "one", "a", "b", "st", "no.", "8"]
+
+
+def _reference_match_key(groups: dict[str, list[dict]], candidate_slug: str, candidate_name: str) -> str | None:
+    """_find_match_key as it was before the blocking index: a scan of every group."""
+    if candidate_slug in groups:
+        return candidate_slug
+    normalized = re.sub(r"[^a-z0-9]", "", candidate_name.lower())
+    for key, group in groups.items():
+        existing_name = re.sub(r"[^a-z0-9]", "", group[0].get("name", "").lower())
+        if len(normalized) > 5 and len(existing_name) > 5:
+            if normalized in existing_name or existing_name in normalized:
+                return key
+        if len(candidate_slug) > 5 and len(key) > 5:
+            if candidate_slug.startswith(key) or key.startswith(candidate_slug):
+                if abs(len(candidate_slug) - len(key)) <= 2:
+                    return key
+    return None
+
+
+def _name(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))).title()
+
+
+def test_index_matches_group_scan():
+    rng = random.Random(15)
+    for _ in range(200):
+        groups: dict[str, list[dict]] = {}
+        index = _GroupIndex()
+        for _ in range(rng.randint(1, 60)):
+            name = _name(rng)
+            slug = generate_slug(name)
+            if not slug:
+                continue
+            expected = _reference_match_key(groups, slug, name)
+            assert index.find_match_key(slug, name) == expected, (slug, name, list(groups))
+            if expected:
+                groups[expected].append({"name": name})
+            else:
+                groups[slug] = [{"name": name}]
+                index.add(slug, name)
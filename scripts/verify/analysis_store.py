@@ -0,0 +1,169 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from models import CrawlResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listing_analysis (
+    development_id TEXT PRIMARY KEY,
+    input_key      TEXT NOT NULL,  -- model, prompt version, listing name/area
+    fingerprints   TEXT NOT NULL,  -- JSON {url: content fingerprint}
+    llm_analysis   TEXT NOT NULL,  -- JSON result of the last Claude analysis
+    analyzed_at    REAL NOT NULL
+)
+"""
+
+_MONTHS = (
+    r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*"
+)
+
+_DATE = (
+    rf"(?:\d{{1,4}}[/.-]\d{{1,2}}[/.-]\d{{1,4}}"
+    rf"|\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTHS},?\s+\d{{2,4}}"
+    rf"|{_MONTHS}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{2,4}})"
+)
+
+# Volatile page content that changes between visits without the page
+# saying anything new: "last updated" style dates, timestamps, cache-busting
+# query strings, counters. Other dates (completion, launch) are content.
+_VOLATILE_PATTERNS = [
+    re.compile(
+        rf"(\b(?:last\s+)?(?:updated|modified|posted|published|generated|retrieved|accessed|refreshed)"
+        rf"(?:\s+(?:on|at))?\s*:?\s*){_DATE}\b",
+        re.IGNORECASE,
+    ),
+    re.compile(r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?", re.IGNORECASE),
+    re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?\s*(?:am|pm)?\b", re.IGNORECASE),
+    re.compile(r"\b\d+\s+(?:seconds?|minutes?|hours?|days?|weeks?)\s+ago\b", re.IGNORECASE),
+    re.compile(r"(?:©|\(c\)|copyright)\s*\d{4}(?:\s*[-–]\s*\d{4})?", re.IGNORECASE),
+    re.compile(r"([?&](?:v|ver|version|cb|t|ts|_|sid|session|utm_[a-z]+)=)[^&\s)\]\"']*", re.IGNORECASE),
+]
+
+# Cookie/consent banner lines. Only short lines without digits are dropped,
+# so a line that mentions cookies alongside real facts still counts.
+_BANNER_LINE = re.compile(
+    r"\b(?:cookies?|consent|gdpr|accept all|reject all|manage preferences|privacy settings)\b",
+    re.IGNORECASE,
+)
+_BANNER_MAX_CHARS = 300
+_DIGIT = re.compile(r"\d")
+
+
+def _is_banner_line(line: str) -> bool:
+    return len(line) <= _BANNER_MAX_CHARS and not _DIGIT.search(line) and bool(_BANNER_LINE.search(line))
+
+
+def clean_for_fingerprint(content: str) -> str:
+    """Strip volatile bits (update dates, timestamps, banners, cache busters) and collapse whitespace."""
+    lines = []
+    for line in content.splitlines():
+        if _is_banner_line(line):
+            continue
+        for pattern in _VOLATILE_PATTERNS:
+            line = pattern.sub(lambda m: m.group(1) if m.groups() else "", line)
+        line = " ".join(line.split())
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def fingerprint_content(content: str) -> str:
+    """Stable hash of a page's meaningful content."""
+    return hashlib.sha256(clean_for_fingerprint(content).encode("utf-8")).hexdigest()
+
+
+def crawl_fingerprints(crawl_results: list[CrawlResult]) -> dict[str, str]:
+    """{url: fingerprint} for every successful crawl with content."""
+    return {
+        r.url: fingerprint_content(r.content)
+        for r in crawl_results
+        if r.success and r.content
+    }
+
+
+class AnalysisStore:
+    """
+    Last Claude analysis per listing, with the fingerprints of the pages it
+    was made from (a table in the verify state database).
+
+    If a listing's sources all fingerprint the same as last time, and the
+    model, prompt version and listing name/area are unchanged, the stored
+    analysis is reused and Claude isn't called. Unlike the LLM cache (exact
+    prompt match), fingerprints ignore "last updated" dates, timestamps,
+    short cookie banners and cache-busting parameters, so routine page churn
+    still counts as unchanged; other dates (e.g. completion) are content.
+
+    Modes follow the LLM cache: "use" reuses and stores, "refresh" only
+    stores, "bypass" does neither.
+    """
+
+    def __init__(self, path: Path, mode: str = "use"):
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+        # Counters
+        self.reused = 0
+        self.changed = 0
+        self.stored = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def input_key(model: str, prompt_version: str, name: str, area: str) -> str:
+        return hashlib.sha256(f"{model}\x00{prompt_version}\x00{name}\x00{area}".encode("utf-8")).hexdigest()
+
+    def lookup(self, development_id: str, input_key: str, fingerprints: dict[str, str]) -> Optional[dict]:
+        """The stored analysis if every source is unchanged, else None."""
+        if self.mode != "use" or not development_id or not fingerprints:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT input_key, fingerprints, llm_analysis FROM listing_analysis WHERE development_id = ?",
+                (development_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] == input_key and json.loads(row[1]) == fingerprints:
+                self.reused += 1
+                return json.loads(row[2])
+            self.changed += 1
+        return None
+
+    def store(
+        self,
+        development_id: str,
+        input_key: str,
+        fingerprints: dict[str, str],
+        llm_analysis: Optional[dict],
+    ) -> None:
+        """Record a fresh analysis (failed analyses are not stored)."""
+        if self.mode == "bypass" or not development_id or not fingerprints or llm_analysis is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listing_analysis "
+                "(development_id, input_key, fingerprints, llm_analysis, analyzed_at) VALUES (?, ?, ?, ?, ?)",
+                (development_id, input_key, json.dumps(fingerprints, sort_keys=True),
+                 json.dumps(llm_analysis), time.time()),
+            )
+            self._conn.commit()
+            self.stored += 1
+
+    def stats_line(self) -> str:
+        return (
+            f"Unchanged-page reuse ({self.mode}): {self.reused} analysis(es) reused, "
+            f"{self.changed} listing(s) with changed pages, {self.stored} stored"
+        )
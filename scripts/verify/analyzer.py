@@ -1,3 +1,4 @@
+import asyncio
 import json
 import re
 from typing import Optional
@@ -5,14 +6,26 @@ from typing import Optional
 import anthropic
 
 from config import Config
+from llm_batch import MessageBatchRunner, run_cached_batch
+from llm_cache import LLMCache, LLMCallResult
+from llm_metrics import LLMMetrics, asend_tracked, send_tracked
+from boilerplate import BoilerplateStripper
+
+# Bump whenever the extraction prompt changes so cached results are not reused
+PROMPT_VERSION = "2"
 
 
 class ClaudeAnalyzer:
     """Analyze crawled web content using Claude API to extract structured development info."""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, cache: Optional[LLMCache] = None):
         self.client = anthropic.Anthropic(api_key=config.anthropic_api_key)
         self.model = config.llm_model
+        self.cache = cache
+        self.content_tokens = config.llm_content_tokens
+        # Per-host template stripping, applied by pipeline.listing_llm_input
+        self.boilerplate = BoilerplateStripper()
+        self.metrics = LLMMetrics(self.model)
 
     def extract_development_info(
         self,
@@ -24,11 +37,28 @@ class ClaudeAnalyzer:
         Extract structured development information from crawled page content.
         Returns a dict with extracted fields and per-field confidence.
         """
-        if not content or len(content.strip()) < 50:
+        prepared = self.build_prompt(content, listing_name, listing_area)
+        if prepared is None:
             return None
+        prompt, key = prepared
 
-        # Truncate to manage token costs
-        truncated = content[:8000]
+        if self.cache is None:
+            return self._call_claude(prompt, listing_name)[0]
+        return self.cache.call(key, lambda: self._call_claude(prompt, listing_name))
+
+    def build_prompt(
+        self,
+        content: str,
+        listing_name: str,
+        listing_area: str,
+    ) -> Optional[tuple[str, str]]:
+        """
+        Return (prompt, cache_key) for a listing, or None if there is too little
+        content. `content` is sent as is: pipeline.listing_llm_input has already
+        selected each source's relevant sections within content_tokens.
+        """
+        if not content or len(content.strip()) < 50:
+            return None
 
         prompt = f"""Analyze this webpage content and extract information about the BTR (Build to Rent) development called "{listing_name}" in {listing_area or "the UK"}.
 
@@ -56,21 +86,45 @@ For each field you include, also add a confidence field like "name_confidence":
 Return ONLY valid JSON. No explanation text.
 
 Webpage content:
-{truncated}"""
+{content}"""
+
+        key = LLMCache.make_key(self.model, PROMPT_VERSION, content, listing_name, listing_area)
+        return prompt, key
+
+    def _request(self, prompt: str) -> dict:
+        """Keyword arguments for messages.create()."""
+        return {
+            "model": self.model,
+            "max_tokens": 2000,
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
+    def _call_claude(self, prompt: str, label: str = "") -> LLMCallResult:
+        """Send the prompt and parse the reply. Returns (result, input_tokens, output_tokens)."""
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            return self._parse_response(response.content[0].text)
-        except anthropic.RateLimitError:
-            print("    Claude API rate limited — skipping LLM analysis for this listing")
-            return None
+            response = send_tracked(self.client, self.metrics, label, self._request(prompt))
         except Exception as e:
-            print(f"    Claude API error: {e}")
-            return None
+            return self._api_error(e)
+        return self._handle_response(response)
+
+    def _api_error(self, error: Exception) -> LLMCallResult:
+        if isinstance(error, anthropic.RateLimitError):
+            print("    Claude API rate limited — skipping LLM analysis for this listing")
+        else:
+            print(f"    Claude API error: {error}")
+        return None, 0, 0
+
+    def _handle_response(self, response) -> LLMCallResult:
+        usage = getattr(response, "usage", None)
+        input_tokens = getattr(usage, "input_tokens", 0) or 0
+        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        # An empty or non-text reply (e.g. refusal, tool use) degrades to no analysis
+        content = getattr(response, "content", None) or []
+        text = getattr(content[0], "text", None) if content else None
+        if not isinstance(text, str):
+            print("    Claude returned no text — skipping LLM analysis for this listing")
+            return None, input_tokens, output_tokens
+        return self._parse_response(text), input_tokens, output_tokens
 
     def _parse_response(self, text: str) -> Optional[dict]:
         """Parse the LLM response, handling common JSON formatting issues."""
@@ -99,8 +153,71 @@ Webpage content:
         return None
 
 
-def create_analyzer(config: Config) -> Optional[ClaudeAnalyzer]:
-    """Create an analyzer instance. Returns None if API key is not configured."""
+class AsyncClaudeAnalyzer(ClaudeAnalyzer):
+    """
+    Non-blocking variant built on AsyncAnthropic, for use inside the verify
+    pipeline. At most `max_concurrency` requests are in flight at once, so
+    LLM calls overlap with crawls and postcode lookups instead of freezing
+    the event loop.
+    """
+
+    def __init__(self, config: Config, cache: Optional[LLMCache] = None, max_concurrency: int = 3):
+        super().__init__(config, cache)
+        self.client = anthropic.AsyncAnthropic(api_key=config.anthropic_api_key)
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def extract_development_info(
+        self,
+        content: str,
+        listing_name: str,
+        listing_area: str,
+    ) -> Optional[dict]:
+        """Async version of ClaudeAnalyzer.extract_development_info."""
+        prepared = self.build_prompt(content, listing_name, listing_area)
+        if prepared is None:
+            return None
+        prompt, key = prepared
+
+        if self.cache is None:
+            return (await self._call_claude(prompt, listing_name))[0]
+        return await self.cache.acall(key, lambda: self._call_claude(prompt, listing_name))
+
+    async def extract_batch(
+        self,
+        runner: MessageBatchRunner,
+        items: dict[str, tuple[str, str, str]],
+    ) -> dict[str, Optional[dict]]:
+        """
+        Batch version of extract_development_info for --llm-batch runs.
+        `items` maps custom_id -> (content, listing_name, listing_area);
+        returns custom_id -> extracted dict (None where nothing was extracted).
+        """
+        prepared = {}
+        for custom_id, (content, listing_name, listing_area) in items.items():
+            built = self.build_prompt(content, listing_name, listing_area)
+            if built is not None:
+                prepared[custom_id] = built
+
+        results = await run_cached_batch(
+            runner, self.cache, prepared, self._request, self._handle_response,
+            metrics=self.metrics, labels={custom_id: item[1] for custom_id, item in items.items()},
+        )
+        return {custom_id: results.get(custom_id) for custom_id in items}
+
+    async def _call_claude(self, prompt: str, label: str = "") -> LLMCallResult:
+        async with self._semaphore:
+            try:
+                response = await asend_tracked(self.client, self.metrics, label, self._request(prompt))
+            except Exception as e:
+                return self._api_error(e)
+        return self._handle_response(response)
+
+
+def create_async_analyzer(
+    config: Config,
+    cache: Optional[LLMCache] = None,
+) -> Optional[AsyncClaudeAnalyzer]:
+    """Create a non-blocking analyzer capped at config.llm_workers concurrent calls."""
     if not config.anthropic_api_key:
         return None
-    return ClaudeAnalyzer(config)
+    return AsyncClaudeAnalyzer(config, cache, max_concurrency=config.llm_workers)
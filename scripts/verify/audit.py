@@ -0,0 +1,454 @@
+from typing import Optional
+
+import numpy as np
+
+from comparator import PLACEHOLDER_VALUES, _normalize_status
+from models import (
+    Confidence,
+    FieldComparison,
+    FieldStatus,
+    ListingVerification,
+    VALID_DEVELOPMENT_TYPES,
+    VALID_REGIONS,
+    VALID_STATUSES,
+    VERIFY_FIELDS,
+)
+from postcode import lookup_postcodes, postcode_to_region
+
+AUDIT_SOURCE = "offline audit"
+GEO_SOURCE = "postcodes.io"
+
+# Mean Earth radius (IUGG), for haversine distances
+EARTH_RADIUS_KM = 6371.0088
+
+# Unit mix columns (developments table), summed against number_of_units
+UNIT_MIX_FIELDS = ("studio_units", "one_bed_units", "two_bed_units", "three_bed_plus_units")
+
+# Bounding box of the UK including Northern Ireland, Shetland and the Scillies
+UK_LAT_RANGE = (49.8, 60.95)
+UK_LNG_RANGE = (-8.7, 1.8)
+
+# Free-text fields checked for placeholders ("TBC", "unknown", ...)
+PLACEHOLDER_FIELDS = ("status", "development_type", "region", "postcode", "website_url", "description", "completion_date")
+
+_CONFIDENCE_ORDER = {Confidence.LOW: 0, Confidence.MEDIUM: 1, Confidence.HIGH: 2}
+
+
+def text_column(listings: list[dict], field: str) -> np.ndarray:
+    """A field as a unicode array ("" for NULL), stripped."""
+    return np.char.strip(np.array(["" if row.get(field) is None else str(row.get(field)) for row in listings], dtype=str))
+
+
+def number_column(listings: list[dict], field: str) -> np.ndarray:
+    """A field as float64 (NaN for NULL or non-numeric)."""
+    values = np.full(len(listings), np.nan)
+    for i, row in enumerate(listings):
+        value = row.get(field)
+        if value is None or value == "":
+            continue
+        try:
+            values[i] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return values
+
+
+def postcode_format(raw: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Validate UK postcode structure column-wise. Returns (compact, valid,
+    formatted): uppercase without spaces, whether it is one of A9 9AA,
+    A99 9AA, A9A 9AA, AA9 9AA, AA99 9AA or AA9A 9AA, and the canonical
+    "OUTWARD INWARD" spelling (meaningful where valid).
+    """
+    n = len(raw)
+    compact = np.char.replace(np.char.upper(raw), " ", "")
+    lengths = np.char.str_len(compact)
+    # Fixed-width UCS-4 code points, one row per postcode (longer values are invalid anyway)
+    codes = np.ascontiguousarray(compact.astype("<U8")).view(np.uint32).reshape(n, 8)
+    alpha = (codes >= ord("A")) & (codes <= ord("Z"))
+    digit = (codes >= ord("0")) & (codes <= ord("9"))
+
+    rows = np.arange(n)
+
+    def at(mask: np.ndarray, position: np.ndarray) -> np.ndarray:
+        return mask[rows, np.clip(position, 0, 7)]
+
+    outward_length = lengths - 3
+    inward_ok = at(digit, lengths - 3) & at(alpha, lengths - 2) & at(alpha, lengths - 1)
+    third = alpha[:, 2] | digit[:, 2]
+    fourth = alpha[:, 3] | digit[:, 3]
+    outward_ok = alpha[:, 0] & (
+        (digit[:, 1] & ((outward_length == 2) | ((outward_length == 3) & third)))
+        | (alpha[:, 1] & digit[:, 2] & ((outward_length == 3) | ((outward_length == 4) & fourth)))
+    )
+    valid = (lengths >= 5) & (lengths <= 7) & inward_ok & outward_ok
+
+    # Insert the space before the inward code: shift characters at or after it by one
+    index = np.arange(8)[None, :]
+    split = outward_length[:, None]
+    shifted = np.take_along_axis(codes, np.clip(np.where(index < split, index, index - 1), 0, 7), axis=1)
+    shifted[index == split] = ord(" ")
+    shifted[index > lengths[:, None]] = 0
+    formatted = np.where(valid, shifted.view("<U8").reshape(n), "")
+    return compact, valid, formatted
+
+
+def map_unique(values: np.ndarray, mask: np.ndarray, fn) -> np.ndarray:
+    """fn() applied once per distinct value where mask is set ("" elsewhere)."""
+    if not mask.any():
+        return np.zeros(len(values), dtype="<U1")
+    uniques, inverse = np.unique(values[mask], return_inverse=True)
+    mapped = np.array([fn(str(value)) or "" for value in uniques], dtype=str)
+    result = np.zeros(len(values), dtype=mapped.dtype)
+    result[mask] = mapped[inverse]
+    return result
+
+
+def haversine_km(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+    """Great-circle distances in km between coordinate arrays (NaN where any input is NaN)."""
+    lat1, lng1, lat2, lng2 = (np.radians(a) for a in (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+async def load_postcode_centroids(listings: list[dict]) -> np.ndarray:
+    """
+    (n, 2) latitude/longitude of each listing's postcode, NaN where unknown.
+    Only well-formed postcodes are looked up, through the shared
+    PostcodeService (offline index, postcode cache, then bulk postcodes.io
+    requests); each distinct postcode is resolved once.
+    """
+    _, valid, formatted = postcode_format(text_column(listings, "postcode"))
+    lookups = await lookup_postcodes(np.where(valid, formatted, "").tolist())
+    return np.array([
+        (lookup.latitude, lookup.longitude)
+        if lookup.valid and lookup.latitude is not None and lookup.longitude is not None
+        else (np.nan, np.nan)
+        for lookup in lookups
+    ], dtype=float).reshape(len(listings), 2)
+
+
+def _normalize_type(value: str) -> str:
+    key = "".join(ch for ch in value.lower() if ch.isalpha())
+    for valid in VALID_DEVELOPMENT_TYPES:
+        if key == "".join(ch for ch in valid.lower() if ch.isalpha()):
+            return valid
+    return ""
+
+
+def _display(value) -> str:
+    """Report text for a column value ("" for NULL; whole floats without ".0")."""
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return ""
+        return str(int(value)) if value.is_integer() else str(value)
+    return str(value)
+
+
+class OfflineAudit:
+    """
+    Checks that need no crawling, run column-wise over the whole fetched
+    table: postcode format, postcode-derived region, UK coordinate bounds,
+    placeholder values, invalid status/type values and unit-mix sums.
+    Given postcode centroids (load_postcode_centroids), coordinates are
+    also gap-filled from the centroid and pins further than
+    `geo_outlier_km` from it are reported.
+
+    Results are ListingVerifications, so the usual CSV/SQL/summary writers
+    apply. Unambiguous fixes (postcode spacing, a missing region from the
+    postcode area, coordinates from the postcode, swapped coordinates that
+    then match the postcode, status synonyms, units from a complete unit
+    mix) carry a found value at HIGH or MEDIUM confidence and reach the SQL
+    file. Problems with no offline fix are LOW and only reported.
+    """
+
+    def __init__(self, geo_outlier_km: float = 2.0):
+        self.geo_outlier_km = geo_outlier_km
+        self.listings_checked = 0
+        self.geo_checked = 0
+        self.counts: dict[str, int] = {}
+
+    def run(self, listings: list[dict], centroids: Optional[np.ndarray] = None) -> list[ListingVerification]:
+        """Audit `listings`; `centroids` is an optional (n, 2) lat/lng array aligned with them."""
+        self.listings_checked += len(listings)
+        if not listings:
+            return []
+        self._findings: list[dict[str, FieldComparison]] = [{} for _ in listings]
+        # (check, listing index) already counted: checks spanning latitude and longitude count once
+        self._counted: set[tuple[str, int]] = set()
+        self._matches: list[tuple[str, np.ndarray, np.ndarray]] = []
+
+        # Placeholders first, so later checks can treat them as empty
+        columns = {field: text_column(listings, field) for field in PLACEHOLDER_FIELDS}
+        placeholder = {
+            field: np.isin(np.char.lower(column), list(PLACEHOLDER_VALUES))
+            for field, column in columns.items()
+        }
+        for field in PLACEHOLDER_FIELDS:
+            if field == "region":
+                continue  # region placeholders are gap-filled from the postcode below
+            self._flag(
+                "placeholder", placeholder[field], field, columns[field], None,
+                FieldStatus.DISCREPANCY, Confidence.LOW, "Placeholder value '{stored}'",
+            )
+
+        postcode = np.where(placeholder["postcode"], "", columns["postcode"])
+        self._check_postcode_and_region(postcode, columns["region"], placeholder["region"])
+        self._check_coordinates(number_column(listings, "latitude"), number_column(listings, "longitude"), centroids)
+        self._check_allowed_values(
+            "status", np.where(placeholder["status"], "", columns["status"]), VALID_STATUSES, _normalize_status,
+        )
+        self._check_allowed_values(
+            "development_type", np.where(placeholder["development_type"], "", columns["development_type"]),
+            VALID_DEVELOPMENT_TYPES, _normalize_type,
+        )
+        self._check_units(
+            number_column(listings, "number_of_units"),
+            np.column_stack([number_column(listings, field) for field in UNIT_MIX_FIELDS]),
+        )
+
+        # Plain lists for the per-listing assembly (NumPy scalar indexing is slow)
+        matches = [(field, mask.tolist(), stored.tolist()) for field, mask, stored in self._matches]
+        return [self._verification(i, row, matches) for i, row in enumerate(listings)]
+
+    # --- Checks ---
+
+    def _check_postcode_and_region(self, postcode: np.ndarray, region: np.ndarray, region_placeholder: np.ndarray):
+        present = postcode != ""
+        compact, valid, formatted = postcode_format(postcode)
+        self._flag(
+            "postcode_invalid", present & ~valid, "postcode", postcode, None,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Invalid postcode format '{stored}'",
+        )
+        self._flag(
+            "postcode_format", valid & (formatted != postcode), "postcode", postcode, formatted,
+            FieldStatus.DISCREPANCY, Confidence.HIGH, "Postcode formatting: {stored} -> {found}",
+        )
+        self._match(valid & (formatted == postcode), "postcode", postcode)
+
+        # postcode_to_region only reads the area letters, so map each distinct two-character prefix once.
+        # Areas straddling a border (CH/LL, SY, TD, NP, ...) map to one side, so a stored region that
+        # disagrees is only reported (LOW), never rewritten.
+        derived = map_unique(compact.astype("<U2"), valid, postcode_to_region)
+        has_derived = derived != ""
+        empty = (region == "") | region_placeholder
+        self._flag(
+            "region_gap", has_derived & empty, "region", region, derived,
+            FieldStatus.GAP_FILLED, Confidence.MEDIUM, "Region from postcode area: {found}",
+            source="postcode area",
+        )
+        self._flag(
+            "region_mismatch", has_derived & ~empty & (region != derived), "region", region, derived,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Region '{stored}' but postcode area is in {found}",
+            source="postcode area",
+        )
+        self._match(has_derived & (region == derived), "region", region)
+        self._flag(
+            "region_invalid", ~has_derived & ~empty & ~np.isin(region, VALID_REGIONS), "region", region, None,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Invalid region '{stored}'",
+        )
+        self._flag(
+            "placeholder", ~has_derived & region_placeholder, "region", region, None,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Placeholder value '{stored}'",
+        )
+
+    def _check_coordinates(self, lat: np.ndarray, lng: np.ndarray, centroids: Optional[np.ndarray]):
+        present = ~np.isnan(lat) & ~np.isnan(lng)
+        with np.errstate(invalid="ignore"):
+            lat_ok = (lat >= UK_LAT_RANGE[0]) & (lat <= UK_LAT_RANGE[1])
+            lng_ok = (lng >= UK_LNG_RANGE[0]) & (lng <= UK_LNG_RANGE[1])
+            swapped_ok = (lng >= UK_LAT_RANGE[0]) & (lng <= UK_LAT_RANGE[1]) & (lat >= UK_LNG_RANGE[0]) & (lat <= UK_LNG_RANGE[1])
+        inside = present & lat_ok & lng_ok
+        swapped = present & ~inside & swapped_ok
+        outside = present & ~inside & ~swapped
+
+        # A swap is only fixed when the swapped pin lands on the listing's postcode
+        confirmed = np.zeros(len(lat), dtype=bool)
+        if centroids is not None:
+            centroid_lat, centroid_lng = centroids[:, 0], centroids[:, 1]
+            self._check_against_centroids(lat, lng, centroid_lat, centroid_lng, inside)
+            with np.errstate(invalid="ignore"):
+                confirmed = swapped & (haversine_km(lng, lat, centroid_lat, centroid_lng) <= self.geo_outlier_km)
+
+        for field, stored, other in (("latitude", lat, lng), ("longitude", lng, lat)):
+            self._flag(
+                "coordinates_swapped", confirmed, field, stored, other,
+                FieldStatus.DISCREPANCY, Confidence.MEDIUM,
+                "Latitude/longitude swapped (swapped pin matches the postcode): {stored} -> {found}",
+                source=GEO_SOURCE,
+            )
+            self._flag(
+                "coordinates_swapped", swapped & ~confirmed, field, stored, None,
+                FieldStatus.DISCREPANCY, Confidence.LOW, "Latitude/longitude look swapped ({stored})",
+            )
+            self._flag(
+                "coordinates_outside_uk", outside, field, stored, None,
+                FieldStatus.DISCREPANCY, Confidence.LOW, "Coordinates outside the UK ({stored})",
+            )
+            self._match(inside, field, stored)
+
+    def _check_against_centroids(
+        self, lat: np.ndarray, lng: np.ndarray, centroid_lat: np.ndarray, centroid_lng: np.ndarray, inside: np.ndarray,
+    ):
+        known = ~np.isnan(centroid_lat) & ~np.isnan(centroid_lng)
+        checked = inside & known
+        self.geo_checked += int(checked.sum())
+        distance = np.round(haversine_km(lat, lng, centroid_lat, centroid_lng), 1)
+        with np.errstate(invalid="ignore"):
+            outlier = checked & (distance > self.geo_outlier_km)
+
+        for field, stored, centroid in (("latitude", lat, centroid_lat), ("longitude", lng, centroid_lng)):
+            self._flag(
+                "coordinates_gap", known & np.isnan(stored), field, stored, centroid,
+                FieldStatus.GAP_FILLED, Confidence.HIGH, "Derived from postcode", source=GEO_SOURCE,
+            )
+            # Report-only: the pin may be deliberately placed, or the stored postcode may be the wrong one
+            self._flag(
+                "coordinates_far_from_postcode", outlier, field, stored, None,
+                FieldStatus.DISCREPANCY, Confidence.LOW,
+                "Pin {distance} km from the postcode centroid ({stored})", source=GEO_SOURCE,
+                distance=distance,
+            )
+
+    def _check_allowed_values(self, field: str, values: np.ndarray, allowed: list[str], normalize):
+        present = values != ""
+        valid = np.isin(values, allowed)
+        invalid = present & ~valid
+        suggested = map_unique(values, invalid, normalize)
+        fixable = invalid & np.isin(suggested, allowed)
+        self._flag(
+            f"{field}_invalid", fixable, field, values, suggested,
+            FieldStatus.DISCREPANCY, Confidence.MEDIUM, "Invalid value '{stored}' -> {found}",
+        )
+        self._flag(
+            f"{field}_invalid", invalid & ~fixable, field, values, None,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Invalid value '{stored}'",
+        )
+        self._match(present & valid, field, values)
+
+    def _check_units(self, units: np.ndarray, mix: np.ndarray):
+        missing = np.isnan(mix)
+        complete = ~missing.any(axis=1)
+        partial = missing.any(axis=1) & ~missing.all(axis=1)
+        mix_sum = np.nansum(mix, axis=1)
+        has_units = ~np.isnan(units)
+
+        with np.errstate(invalid="ignore"):
+            not_positive = has_units & (units <= 0)
+            gap = complete & ~has_units & (mix_sum > 0)
+            mismatch = complete & has_units & ~not_positive & (mix_sum > 0) & (mix_sum != units)
+            over = partial & has_units & ~not_positive & (mix_sum > units)
+
+        self._flag(
+            "units_invalid", not_positive, "number_of_units", units, None,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Unit count {stored} is not positive",
+        )
+        self._flag(
+            "units_gap", gap, "number_of_units", units, mix_sum,
+            FieldStatus.GAP_FILLED, Confidence.MEDIUM, "Units from unit mix total: {found}",
+        )
+        self._flag(
+            "units_mix_mismatch", mismatch, "number_of_units", units, mix_sum,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Unit mix sums to {found}, stored {stored}",
+        )
+        self._flag(
+            "units_mix_mismatch", over, "number_of_units", units, None,
+            FieldStatus.DISCREPANCY, Confidence.LOW, "Partial unit mix already exceeds {stored} units",
+        )
+        self._match(has_units & ~not_positive, "number_of_units", units)
+
+    # --- Assembly ---
+
+    def _flag(
+        self,
+        check: str,
+        mask: np.ndarray,
+        field: str,
+        stored: np.ndarray,
+        found: Optional[np.ndarray],
+        status: FieldStatus,
+        confidence: Confidence,
+        notes: str,
+        source: str = AUDIT_SOURCE,
+        **details: np.ndarray,
+    ) -> None:
+        """
+        Record a finding for each listing in `mask` (the first finding per
+        field wins). `notes` may reference {stored}, {found} and any `details`.
+        """
+        for i in np.flatnonzero(mask):
+            findings = self._findings[i]
+            if field in findings:
+                continue
+            stored_value = _display(stored[i].item()) or None
+            found_value = (_display(found[i].item()) or None) if found is not None else None
+            findings[field] = FieldComparison(
+                field_name=field,
+                stored_value=stored_value,
+                found_value=found_value,
+                status=status,
+                confidence=confidence,
+                source_url=source,
+                notes=notes.format(
+                    stored=stored_value,
+                    found=found_value,
+                    **{name: _display(values[i].item()) for name, values in details.items()},
+                ),
+            )
+            if (check, i) not in self._counted:
+                self._counted.add((check, i))
+                self.counts[check] = self.counts.get(check, 0) + 1
+
+    def _match(self, mask: np.ndarray, field: str, stored: np.ndarray) -> None:
+        """Mark `field` as checked and fine where `mask` is set (findings still take precedence)."""
+        self._matches.append((field, mask, stored))
+
+    def _verification(self, i: int, row: dict, matches: list[tuple[str, list, list]]) -> ListingVerification:
+        findings = self._findings[i]
+        for field, mask, stored in matches:
+            if mask[i] and field not in findings:
+                value = _display(stored[i])
+                findings[field] = FieldComparison(
+                    field_name=field,
+                    stored_value=value,
+                    found_value=value,
+                    status=FieldStatus.MATCH,
+                    confidence=Confidence.HIGH,
+                    source_url=AUDIT_SOURCE,
+                )
+        operator = row.get("operator") or {}
+        asset_owner = row.get("asset_owner") or {}
+        comparisons = [findings[field] for field in VERIFY_FIELDS if field in findings]
+        issues = [c for c in comparisons if c.status != FieldStatus.MATCH]
+        return ListingVerification(
+            development_id=row["id"],
+            development_name=row.get("name") or "",
+            development_slug=row.get("slug") or "",
+            area=row.get("area") or "",
+            operator_name=operator.get("name", "") if isinstance(operator, dict) else "",
+            asset_owner_name=asset_owner.get("name", "") if isinstance(asset_owner, dict) else "",
+            website_url=row.get("website_url"),
+            field_comparisons=comparisons,
+            overall_confidence=min(
+                (c.confidence for c in issues), key=_CONFIDENCE_ORDER.get, default=Confidence.HIGH,
+            ),
+            notes=" | ".join(c.notes for c in issues),
+        )
+
+    # --- Reporting ---
+
+    def summary_lines(self) -> list[str]:
+        """Lines for the run summary's OFFLINE AUDIT section (listings flagged per check)."""
+        lines = ["OFFLINE AUDIT:", f"  Listings checked: {self.listings_checked}"]
+        if self.geo_checked:
+            lines.append(f"  Pins checked against postcode centroids: {self.geo_checked} (max {self.geo_outlier_km:g} km)")
+        if not self.counts:
+            lines.append("  No issues found")
+        else:
+            lines.append("  Listings flagged, by check:")
+        for check, count in sorted(self.counts.items(), key=lambda item: -item[1]):
+            lines.append(f"    {check}: {count}")
+        return lines
+
+    def stats_line(self) -> str:
+        return f"Offline audit: {self.listings_checked} listing(s), {sum(self.counts.values())} issue(s)"
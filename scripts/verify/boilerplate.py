@@ -0,0 +1,163 @@
+import re
+import statistics
+from collections import Counter, defaultdict
+from typing import Optional
+from urllib.parse import urlparse
+
+from content_selector import estimate_tokens
+
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_AUTOLINK = re.compile(r"<https?://[^>\s]+>")
+_ALNUM = re.compile(r"[A-Za-z0-9]")
+_POSTCODE = re.compile(r"\b[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}\b")
+
+
+def compact_markdown(markdown: str) -> str:
+    """
+    Collapse link/image markup to its text (`[text](url)` -> `text`,
+    `![alt](src)` -> `alt`), drop bare autolinks, and squeeze blank lines.
+    """
+    text = _IMAGE.sub(lambda m: m.group(1).strip(), markdown)
+    text = _LINK.sub(lambda m: m.group(1).strip(), text)
+    text = _AUTOLINK.sub("", text)
+    lines = [line.rstrip() for line in text.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _host(url: str) -> str:
+    try:
+        return urlparse(url).netloc.lower().replace("www.", "")
+    except Exception:
+        return ""
+
+
+def _line_key(line: str) -> str:
+    return " ".join(line.split()).lower()
+
+
+class BoilerplateStripper:
+    """
+    Learns each host's page template (navigation, cookie notices, footers:
+    lines repeated across that host's pages) and removes it before content
+    goes to Claude. Used by both the verify and discover analyzers.
+
+    A line is template for a host once it has appeared on at least
+    `min_pages` of its pages and on at least `min_share` of them. Headings
+    and lines containing a postcode are always kept, since development
+    sites often repeat the name and address on every page. Repeated lines
+    within a page are kept once.
+
+    By default learning is per run and each clean() uses everything
+    observed so far (discover observes all pages before cleaning any).
+    With use_store(), clean() only uses the templates stored by earlier
+    runs, and observed pages are recorded there for the next run.
+    """
+
+    def __init__(self, min_pages: int = 2, min_share: float = 0.5):
+        self.min_pages = max(2, min_pages)
+        self.min_share = min_share
+        self._pages: dict[str, set[str]] = defaultdict(set)  # host -> URLs observed
+        self._line_pages: dict[str, Counter] = defaultdict(Counter)  # host -> line -> page count
+        self.store = None  # Optional[boilerplate_store.BoilerplateStore]
+        self._templates: Optional[dict[str, set[str]]] = None  # host -> template lines, with a store
+
+        # Per-page token counts: (host, before, after)
+        self.page_stats: list[tuple[str, int, int]] = []
+
+    def use_store(self, store) -> None:
+        """
+        Clean against the templates in `store` as they are now, and record
+        observed pages there. Cleaning is then a pure function of the page
+        and the stored templates, whatever else the run crawls, in any order.
+        """
+        self.store = store
+        self._templates = store.templates(self.min_pages, self.min_share)
+
+    def observe(self, url: str, markdown: str) -> None:
+        """Add a page to its host's template statistics (each URL counts once per run)."""
+        host = _host(url)
+        if not host or not markdown or url in self._pages[host]:
+            return
+        self._pages[host].add(url)
+        lines = {_line_key(line) for line in compact_markdown(markdown).splitlines()}
+        lines = {line for line in lines if _ALNUM.search(line)}
+        if self.store is not None:
+            self.store.observe(host, url, lines)
+        else:
+            self._line_pages[host].update(lines)
+
+    def _is_template(self, host: str, key: str) -> bool:
+        if self._templates is not None:
+            return key in self._templates.get(host, ())
+        pages = len(self._pages.get(host, ()))
+        if pages < self.min_pages:
+            return False
+        seen = self._line_pages[host].get(key, 0)
+        return seen >= self.min_pages and seen >= self.min_share * pages
+
+    def clean(self, url: str, markdown: str) -> str:
+        """Compact the markdown and drop the host's template lines."""
+        host = _host(url)
+        kept: list[str] = []
+        seen_in_page: set[str] = set()
+        for line in compact_markdown(markdown).splitlines():
+            key = _line_key(line)
+            if not key:
+                if kept and kept[-1]:
+                    kept.append("")
+                continue
+            protected = line.lstrip().startswith("#") or _POSTCODE.search(line.upper())
+            if not protected and (key in seen_in_page or self._is_template(host, key)):
+                continue
+            seen_in_page.add(key)
+            kept.append(line)
+        cleaned = "\n".join(kept).strip()
+        self.page_stats.append((host, estimate_tokens(markdown), estimate_tokens(cleaned)))
+        return cleaned
+
+    def summary_lines(self) -> list[str]:
+        """Lines for the run summary's CONTENT COMPACTION section."""
+        lines = ["CONTENT COMPACTION (boilerplate and link markup removed before LLM calls):"]
+        if not self.page_stats:
+            lines.append("  No pages processed")
+            return lines
+
+        before = sum(b for _, b, _ in self.page_stats)
+        after = sum(a for _, _, a in self.page_stats)
+        reductions = [(b - a) / b * 100 for _, b, a in self.page_stats if b]
+        lines.append(f"  Pages processed: {len(self.page_stats)}")
+        lines.append(
+            f"  Tokens: {before} -> {after} "
+            f"({round((before - after) / before * 100) if before else 0}% fewer)"
+        )
+        lines.append(
+            f"  Per page: {round(before / len(self.page_stats))} -> {round(after / len(self.page_stats))} tokens avg, "
+            f"median reduction {round(statistics.median(reductions)) if reductions else 0}%"
+        )
+
+        by_host: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+        for host, b, a in self.page_stats:
+            by_host[host][0] += 1
+            by_host[host][1] += b
+            by_host[host][2] += a
+        top = sorted(by_host.items(), key=lambda item: item[1][2] - item[1][1])[:5]
+        if top:
+            lines.append("  Top hosts by tokens saved:")
+            for host, (pages, b, a) in top:
+                lines.append(f"    {host}: {b - a} tokens over {pages} page(s) ({round((b - a) / b * 100) if b else 0}%)")
+        return lines
+
+    def stats_line(self) -> str:
+        before = sum(b for _, b, _ in self.page_stats)
+        after = sum(a for _, _, a in self.page_stats)
+        line = (
+            f"Content compaction: {len(self.page_stats)} page(s), {before} -> {after} tokens "
+            f"across {len(self._pages)} host(s)"
+        )
+        if self.store is not None:
+            line += (
+                f"; templates from earlier runs for {len(self._templates)} host(s), "
+                f"{self.store.pages_added} new and {self.store.pages_changed} changed page(s) recorded"
+            )
+        return line
@@ -0,0 +1,93 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS template_pages (
+    host  TEXT NOT NULL,
+    url   TEXT NOT NULL,
+    lines TEXT NOT NULL,  -- JSON list of the page's distinct line keys, as last seen
+    PRIMARY KEY (host, url)
+);
+CREATE TABLE IF NOT EXISTS template_lines (
+    host  TEXT NOT NULL,
+    line  TEXT NOT NULL,
+    pages INTEGER NOT NULL,  -- pages of the host currently containing the line
+    PRIMARY KEY (host, line)
+);
+"""
+
+
+class BoilerplateStore:
+    """
+    Persistent per-host line statistics for BoilerplateStripper (default
+    scripts/output/boilerplate.sqlite).
+
+    Each URL counts once, with the lines it had when last observed; a page
+    whose content changed replaces its old lines. verify cleans against the
+    templates stored when the run started and records the run's pages for
+    the next run, so a page's prompt doesn't depend on crawl order or on
+    which listings the run includes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        # Counters
+        self.pages_added = 0
+        self.pages_changed = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def templates(self, min_pages: int, min_share: float) -> dict[str, set[str]]:
+        """Template lines per host: on at least `min_pages` pages and `min_share` of the host's pages."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT l.host, l.line FROM template_lines l "
+                "JOIN (SELECT host, COUNT(*) AS n FROM template_pages GROUP BY host) p ON p.host = l.host "
+                "WHERE p.n >= ? AND l.pages >= ? AND l.pages >= ? * p.n",
+                (min_pages, min_pages, min_share),
+            ).fetchall()
+        templates: dict[str, set[str]] = {}
+        for host, line in rows:
+            templates.setdefault(host, set()).add(line)
+        return templates
+
+    def observe(self, host: str, url: str, lines: set[str]) -> None:
+        """Record a page's distinct line keys, replacing what it had before."""
+        new = sorted(lines)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT lines FROM template_pages WHERE host = ? AND url = ?", (host, url),
+            ).fetchone()
+            old = json.loads(row[0]) if row else []
+            if old == new:
+                return
+            removed, added = set(old) - lines, lines - set(old)
+            self._conn.executemany(
+                "UPDATE template_lines SET pages = pages - 1 WHERE host = ? AND line = ?",
+                [(host, line) for line in removed],
+            )
+            self._conn.executemany(
+                "INSERT INTO template_lines (host, line, pages) VALUES (?, ?, 1) "
+                "ON CONFLICT (host, line) DO UPDATE SET pages = pages + 1",
+                [(host, line) for line in added],
+            )
+            self._conn.execute("DELETE FROM template_lines WHERE host = ? AND pages <= 0", (host,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO template_pages (host, url, lines) VALUES (?, ?, ?)",
+                (host, url, json.dumps(new, ensure_ascii=False)),
+            )
+            self._conn.commit()
+            if row:
+                self.pages_changed += 1
+            else:
+                self.pages_added += 1
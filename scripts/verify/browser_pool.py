@@ -0,0 +1,77 @@
+import asyncio
+import logging
+from typing import Optional
+
+from crawl4ai import AsyncWebCrawler
+
+# Suppress Crawl4AI's noisy [INIT]/[FETCH]/[COMPLETE] logging
+logging.getLogger("crawl4ai").setLevel(logging.WARNING)
+
+
+class BrowserPool:
+    """
+    One long-lived Crawl4AI browser shared by every crawl in a run.
+
+    Callers borrow a tab via `arun()`; at most `max_tabs` pages are open at
+    once. The browser is launched lazily on first use and closed when the
+    pool exits. Shared by verify (crawl_listing) and discover (crawl_urls).
+    """
+
+    def __init__(self, max_tabs: int = 4):
+        self.max_tabs = max(1, max_tabs)
+        self._tabs = asyncio.Semaphore(self.max_tabs)
+        self._start_lock = asyncio.Lock()
+        self._crawler: Optional[AsyncWebCrawler] = None
+
+        # Counters
+        self.launches = 0
+        self.sessions = 0
+        self.pages_crawled = 0
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _ensure_started(self) -> AsyncWebCrawler:
+        async with self._start_lock:
+            if self._crawler is None:
+                crawler = AsyncWebCrawler(verbose=False)
+                await crawler.start()
+                self._crawler = crawler
+                self.launches += 1
+            return self._crawler
+
+    async def close(self) -> None:
+        """Shut down the browser (safe to call more than once)."""
+        async with self._start_lock:
+            if self._crawler is not None:
+                try:
+                    await self._crawler.close()
+                finally:
+                    self._crawler = None
+
+    def open_session(self) -> None:
+        """
+        Record one logical crawl session (a listing, or a discover run) that
+        would previously have launched its own browser.
+        """
+        self.sessions += 1
+
+    async def arun(self, url: str, **kwargs):
+        """Crawl a single URL in a borrowed tab. Returns the raw Crawl4AI result."""
+        crawler = await self._ensure_started()
+        async with self._tabs:
+            self.pages_crawled += 1
+            return await crawler.arun(url=url, **kwargs)
+
+    @property
+    def launches_saved(self) -> int:
+        return max(0, self.sessions - self.launches)
+
+    def stats_line(self) -> str:
+        return (
+            f"Browser pool: {self.launches} launch(es) for {self.sessions} session(s), "
+            f"{self.pages_crawled} page(s) crawled — {self.launches_saved} launch(es) saved"
+        )
@@ -1,10 +1,13 @@
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
+from rate_limiter import parse_domain_delays
+
 
 @dataclass
 class Config:
@@ -13,23 +16,62 @@ class Config:
     anthropic_api_key: str
     output_dir: Path
     crawl_delay_seconds: float = 2.5
+    # Per-domain overrides of crawl_delay_seconds, e.g. {"rightmove.co.uk": 10.0}
+    domain_delays: dict[str, float] = field(default_factory=dict)
     max_pages_per_listing: int = 3
     test_limit: int = 20
+    # Rows per keyset page when streaming listings from Supabase (see db.py)
+    db_page_size: int = 500
     llm_model: str = "claude-sonnet-4-20250514"
+    # Page content per listing prompt, in estimated tokens (see content_selector.py)
+    llm_content_tokens: int = 2000
+    # Pipeline worker pool sizes (see pipeline.py)
+    crawl_workers: int = 3
+    postcode_workers: int = 5
+    llm_workers: int = 3
+    compare_workers: int = 1
+    # Concurrent tabs in the shared Crawl4AI browser (see browser_pool.py)
+    browser_tabs: int = 4
+    # Persistent crawl cache (see crawl_cache.py)
+    cache_mode: str = "use"
+    cache_dir: Optional[Path] = None
+    cache_ttl_hours: float = 24.0
+    cache_max_mb: int = 500
+    # Persistent LLM extraction cache (see llm_cache.py)
+    llm_cache_mode: str = "use"
+    llm_cache_dir: Optional[Path] = None
+    # Per-host page templates learned by earlier runs (see boilerplate_store.py)
+    boilerplate_store_path: Optional[Path] = None
+    # Offline postcode index (see postcode_index.py); used if the file exists
+    postcode_index_path: Optional[Path] = None
+    # Persistent postcodes.io result cache (see postcode_cache.py)
+    postcode_cache_mode: str = "use"
+    postcode_cache_path: Optional[Path] = None
+    postcode_cache_ttl_hours: float = 720.0
+    postcode_cache_negative_ttl_hours: float = 168.0
+    # --geo-check: flag pins further than this from their postcode centroid (see audit.py)
+    geo_outlier_km: float = 2.0
+    # --incremental state store and adaptive re-verification TTL (see verify_state.py)
+    state_path: Optional[Path] = None
+    incremental_initial_ttl_days: float = 7.0
+    incremental_min_ttl_days: float = 2.0
+    incremental_max_ttl_days: float = 60.0
+    # Seconds between Message Batches status polls (--llm-batch)
+    llm_batch_poll_seconds: float = 30.0
 
 
 def load_config() -> Config:
-    """Load configuration from scripts/.env file."""
+    """Load configuration from scripts/.env file (or the file named by BTR_ENV_FILE)."""
     scripts_dir = Path(__file__).resolve().parent.parent
-    env_path = scripts_dir / ".env"
+    env_path = Path(os.getenv("BTR_ENV_FILE") or scripts_dir / ".env")
 
     if env_path.exists():
         load_dotenv(env_path, override=True)
     else:
         print(f"Warning: No .env file found at {env_path}")
 
-    output_dir = scripts_dir / "output"
-    output_dir.mkdir(exist_ok=True)
+    output_dir = Path(os.getenv("OUTPUT_DIR") or scripts_dir / "output")
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     return Config(
         supabase_url=os.getenv("SUPABASE_URL", ""),
@@ -37,8 +79,31 @@ def load_config() -> Config:
         anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
         output_dir=output_dir,
         crawl_delay_seconds=float(os.getenv("CRAWL_DELAY_SECONDS", "2.5")),
+        domain_delays=parse_domain_delays(os.getenv("CRAWL_DOMAIN_DELAYS", "")),
         max_pages_per_listing=int(os.getenv("MAX_CRAWL_PAGES_PER_LISTING", "3")),
         test_limit=int(os.getenv("TEST_LIMIT", "20")),
+        llm_content_tokens=int(os.getenv("LLM_CONTENT_TOKENS", "2000")),
+        db_page_size=int(os.getenv("DB_PAGE_SIZE", "500")),
+        crawl_workers=int(os.getenv("CRAWL_WORKERS", "3")),
+        postcode_workers=int(os.getenv("POSTCODE_WORKERS", "5")),
+        llm_workers=int(os.getenv("LLM_WORKERS", "3")),
+        compare_workers=int(os.getenv("COMPARE_WORKERS", "1")),
+        browser_tabs=int(os.getenv("BROWSER_TABS", "4")),
+        cache_dir=Path(os.getenv("CRAWL_CACHE_DIR") or output_dir / "crawl_cache"),
+        cache_ttl_hours=float(os.getenv("CRAWL_CACHE_TTL_HOURS", "24")),
+        cache_max_mb=int(os.getenv("CRAWL_CACHE_MAX_MB", "500")),
+        llm_cache_dir=Path(os.getenv("LLM_CACHE_DIR") or output_dir / "llm_cache"),
+        boilerplate_store_path=Path(os.getenv("BOILERPLATE_STORE") or output_dir / "boilerplate.sqlite"),
+        postcode_index_path=Path(os.getenv("POSTCODE_INDEX") or output_dir / "postcode_index.bin"),
+        postcode_cache_path=Path(os.getenv("POSTCODE_CACHE") or output_dir / "postcode_cache.sqlite"),
+        postcode_cache_ttl_hours=float(os.getenv("POSTCODE_CACHE_TTL_HOURS", "720")),
+        postcode_cache_negative_ttl_hours=float(os.getenv("POSTCODE_CACHE_NEGATIVE_TTL_HOURS", "168")),
+        geo_outlier_km=float(os.getenv("GEO_OUTLIER_KM", "2")),
+        state_path=Path(os.getenv("VERIFY_STATE") or output_dir / "verify_state.sqlite"),
+        incremental_initial_ttl_days=float(os.getenv("INCREMENTAL_INITIAL_TTL_DAYS", "7")),
+        incremental_min_ttl_days=float(os.getenv("INCREMENTAL_MIN_TTL_DAYS", "2")),
+        incremental_max_ttl_days=float(os.getenv("INCREMENTAL_MAX_TTL_DAYS", "60")),
+        llm_batch_poll_seconds=float(os.getenv("LLM_BATCH_POLL_SECONDS", "30")),
     )
 
 
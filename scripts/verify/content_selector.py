@@ -0,0 +1,139 @@
+import math
+import re
+from collections import Counter
+
+# Rough characters-per-token for English markdown; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+# Sections longer than this are split further
+MAX_SECTION_CHARS = 1200
+
+# Words that tend to appear near the facts both analyzers extract
+# (unit counts, status, operator/owner, location, completion)
+LISTING_VOCABULARY = (
+    "homes apartments flats units residences bedroom bedrooms studio studios storey storeys "
+    "build rent btr private rented scheme development developer operator operated managed "
+    "management owner owned investor investment fund acquired forward funding "
+    "planning permission approved consented submitted application construction "
+    "topped completed completion complete launch launched leasing letting lettings "
+    "operational open opening available move residents phase postcode address located"
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_HEADING = re.compile(r"^#{1,6}\s")
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _hard_split(block: str, max_chars: int) -> list[str]:
+    """Split one oversized block on line boundaries (or raw slices for huge lines)."""
+    chunks, current = [], ""
+    for line in block.splitlines():
+        while len(line) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and len(current) + len(line) + 1 > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_sections(markdown: str, max_chars: int = MAX_SECTION_CHARS) -> list[str]:
+    """
+    Split markdown into sections: a new section starts at each heading, and
+    sections are capped at `max_chars` on paragraph (then line) boundaries.
+    """
+    sections: list[str] = []
+    current: list[str] = []
+    size = 0
+
+    def flush():
+        nonlocal current, size
+        if current:
+            sections.append("\n\n".join(current))
+        current, size = [], 0
+
+    for block in re.split(r"\n\s*\n", markdown):
+        block = block.strip()
+        if not block:
+            continue
+        if _HEADING.match(block) or (current and size + len(block) > max_chars):
+            flush()
+        if len(block) > max_chars:
+            sections.extend(_hard_split(block, max_chars))
+            continue
+        current.append(block)
+        size += len(block) + 2
+    flush()
+    return sections
+
+
+def build_query(*phrases: str, vocabulary: str = LISTING_VOCABULARY, phrase_weight: float = 3.0) -> dict[str, float]:
+    """Query term weights: the given phrases (e.g. listing name, area) outweigh the vocabulary."""
+    query: dict[str, float] = {term: 1.0 for term in _tokens(vocabulary)}
+    for phrase in phrases:
+        for term in _tokens(phrase or ""):
+            query[term] = max(query.get(term, 0.0), phrase_weight)
+    return query
+
+
+def rank_sections(sections: list[str], query: dict[str, float], k1: float = 1.5, b: float = 0.75) -> list[float]:
+    """BM25 score of each section against the weighted query (the page is the corpus)."""
+    docs = [Counter(_tokens(section)) for section in sections]
+    if not docs:
+        return []
+    lengths = [sum(doc.values()) for doc in docs]
+    avg_length = (sum(lengths) / len(lengths)) or 1.0
+    doc_freq = Counter(term for doc in docs for term in doc if term in query)
+
+    scores = []
+    for doc, length in zip(docs, lengths):
+        score = 0.0
+        for term, weight in query.items():
+            tf = doc.get(term)
+            if not tf:
+                continue
+            n = doc_freq[term]
+            idf = math.log(1 + (len(docs) - n + 0.5) / (n + 0.5))
+            score += weight * idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+        scores.append(score)
+    return scores
+
+
+def select_relevant(content: str, query: dict[str, float], budget_tokens: int) -> str:
+    """
+    Return the most relevant parts of `content` that fit in `budget_tokens`.
+
+    Content already within budget is returned unchanged. Otherwise sections
+    are ranked with BM25 and packed best-first (earlier sections win ties);
+    the chosen sections are emitted in their original order.
+    """
+    budget_chars = max(0, budget_tokens) * CHARS_PER_TOKEN
+    if len(content) <= budget_chars:
+        return content
+
+    sections = split_sections(content)
+    scores = rank_sections(sections, query)
+    chosen: list[int] = []
+    used = 0
+    for i in sorted(range(len(sections)), key=lambda i: (-scores[i], i)):
+        cost = len(sections[i]) + 2
+        if used + cost > budget_chars:
+            continue
+        chosen.append(i)
+        used += cost
+    if not chosen:
+        return content[:budget_chars]
+    return "\n\n".join(sections[i] for i in sorted(chosen))
@@ -0,0 +1,314 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+import httpx
+
+from browser_pool import BrowserPool
+from rate_limiter import DomainRateLimiter
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+REVALIDATE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; BTRDirectoryVerifier/1.0)",
+}
+
+
+def normalize_cache_url(url: str) -> str:
+    """
+    Normalize a URL for cache keys: lowercase scheme/host, drop "www." and
+    fragments, strip trailing slashes, sort query parameters.
+    """
+    try:
+        parsed = urlparse(url.strip())
+    except Exception:
+        return url.strip().lower()
+    host = parsed.netloc.lower().replace("www.", "")
+    path = parsed.path.rstrip("/")
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    normalized = f"{(parsed.scheme or 'https').lower()}://{host}{path}"
+    return f"{normalized}?{query}" if query else normalized
+
+
+@dataclass
+class CachedPage:
+    """A cached render. Mirrors the Crawl4AI result attributes the crawlers read."""
+    url: str
+    markdown: str
+    title: str
+    status_code: Optional[int]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    validated_at: float = 0.0
+    success: bool = True
+    error_message: str = ""
+    metadata: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.metadata = {"title": self.title}
+
+
+def _header(headers, name: str) -> Optional[str]:
+    """Case-insensitive header lookup on a plain dict or httpx.Headers."""
+    if not headers:
+        return None
+    for key, value in dict(headers).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CrawlCache:
+    """
+    Persistent on-disk cache of rendered pages, shared by verify and discover.
+
+    Entries are JSON files named by the SHA-256 of the normalized URL and
+    hold the markdown, title, status code and ETag/Last-Modified validators.
+
+      - Fresh entries (validated within the TTL) are served directly.
+      - Stale entries with validators are revalidated with a conditional GET;
+        a 304 refreshes the entry without rendering.
+      - Everything else falls back to a full browser render.
+
+    The directory is bounded by `max_bytes` with least-recently-used eviction.
+    Modes: "use" (default), "refresh" (ignore entries, re-render and store),
+    "bypass" (no reads or writes).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        mode: str = "use",
+        ttl_hours: float = 24.0,
+        max_bytes: int = 500 * 1024 * 1024,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}' (expected one of {', '.join(CACHE_MODES)})")
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = max_bytes
+
+        self._index: Optional[dict[str, tuple[int, float]]] = None  # key -> (size, last access)
+        self._total_bytes = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Counters
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    async def __aenter__(self) -> "CrawlCache":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # --- Storage ---
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(normalize_cache_url(url).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> dict[str, tuple[int, float]]:
+        if self._index is None:
+            self._index = {}
+            self._total_bytes = 0
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob("*/*.json"):
+                    stat = path.stat()
+                    self._index[path.stem] = (stat.st_size, stat.st_mtime)
+                    self._total_bytes += stat.st_size
+        return self._index
+
+    def _read(self, key: str) -> Optional[CachedPage]:
+        index = self._load_index()
+        if key not in index:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            data.pop("metadata", None)
+            page = CachedPage(**data)
+        except (OSError, ValueError, TypeError):
+            self._remove(key)
+            return None
+
+        # Touch for LRU ordering
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        index[key] = (index[key][0], now)
+        return page
+
+    def _write(self, key: str, page: CachedPage) -> None:
+        index = self._load_index()
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(asdict(page), ensure_ascii=False)
+
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+        size = path.stat().st_size
+        if key in index:
+            self._total_bytes -= index[key][0]
+        index[key] = (size, time.time())
+        self._total_bytes += size
+        self.stores += 1
+        self._evict()
+
+    def _remove(self, key: str) -> None:
+        index = self._load_index()
+        entry = index.pop(key, None)
+        if entry:
+            self._total_bytes -= entry[0]
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the cache fits in max_bytes."""
+        index = self._load_index()
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            self.evictions += 1
+
+    # --- Fetching ---
+
+    def _is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.validated_at < self.ttl_seconds
+
+    async def _revalidate(self, page: CachedPage) -> bool:
+        """Conditional GET against the origin. True if the page is unchanged (304)."""
+        headers = dict(REVALIDATE_HEADERS)
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=15.0, follow_redirects=True)
+        try:
+            resp = await self._client.get(page.url, headers=headers)
+        except Exception:
+            return False
+        return resp.status_code == 304
+
+    async def fetch(
+        self,
+        url: str,
+        domain: str,
+        pool: BrowserPool,
+        limiter: DomainRateLimiter,
+    ):
+        """
+        Return a page for `url`: a CachedPage on a hit or successful
+        revalidation, otherwise the raw Crawl4AI result from a fresh render.
+        Concurrent fetches of the same URL share one render.
+        """
+        if self.mode == "bypass":
+            await limiter.acquire(domain)
+            return await pool.arun(url)
+
+        key = self._key(url)
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            page = await self._fetch(url, key, domain, pool, limiter)
+            future.set_result(page)
+            return page
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited failure doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _fetch(
+        self,
+        url: str,
+        key: str,
+        domain: str,
+        pool: BrowserPool,
+        limiter: DomainRateLimiter,
+    ):
+        cached = self._read(key) if self.mode == "use" else None
+        if cached is not None:
+            if self._is_fresh(cached):
+                self.hits += 1
+                return cached
+            if cached.etag or cached.last_modified:
+                await limiter.acquire(domain)
+                if await self._revalidate(cached):
+                    self.revalidated += 1
+                    cached.validated_at = time.time()
+                    self._write(key, cached)
+                    return cached
+
+        self.misses += 1
+        await limiter.acquire(domain)
+        result = await pool.arun(url)
+        self._store_render(key, url, result)
+        return result
+
+    def _store_render(self, key: str, url: str, result) -> None:
+        """Cache a successful render (failures are always re-tried)."""
+        status_code = getattr(result, "status_code", None)
+        content = str(getattr(result, "markdown", "") or "")
+        if not getattr(result, "success", False) or not content:
+            return
+        if status_code is not None and status_code >= 400:
+            return
+
+        metadata = getattr(result, "metadata", None) or {}
+        headers = getattr(result, "response_headers", None) or {}
+        now = time.time()
+        self._write(key, CachedPage(
+            url=url,
+            markdown=content,
+            title=metadata.get("title", "") or "",
+            status_code=status_code,
+            etag=_header(headers, "etag"),
+            last_modified=_header(headers, "last-modified"),
+            fetched_at=now,
+            validated_at=now,
+        ))
+
+    def stats_line(self) -> str:
+        if self.mode == "bypass":
+            return "Crawl cache: bypassed"
+        return (
+            f"Crawl cache ({self.mode}): {self.hits} hit(s), {self.revalidated} revalidated, "
+            f"{self.misses} render(s), {self.stores} stored, {self.evictions} evicted"
+        )
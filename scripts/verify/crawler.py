@@ -1,44 +1,27 @@
 import asyncio
-import logging
 import re
 from typing import Optional
 from urllib.parse import urlparse
 
-from crawl4ai import AsyncWebCrawler
-
+from browser_pool import BrowserPool
 from config import Config
+from crawl_cache import CrawlCache
+from domain_classifier import get_domain_classifier
 from models import CrawlResult
-
-# Suppress Crawl4AI's noisy [INIT]/[FETCH]/[COMPLETE] logging
-logging.getLogger("crawl4ai").setLevel(logging.WARNING)
-
-
-# Source priority classification (mirrors scripts/lib/confidence.ts)
-PROPERTY_PORTALS = [
-    "rightmove.co.uk", "zoopla.co.uk", "onthemarket.com",
-    "openrent.com", "spareroom.co.uk",
-]
-
-NEWS_SITES = [
-    "btrnews.co.uk", "urbanliving.news", "reactnews.com",
-    "egi.co.uk", "estatesgazette.com", "propertyweek.com",
-    "placenorth.co.uk", "insidehousing.co.uk", "costar.com",
-    "buildtorent.org.uk",
-]
+from rate_limiter import DomainRateLimiter
+from timing import StageTimer, span
 
 
 def classify_source(url: str, operator_domain: Optional[str] = None) -> str:
-    """Classify a URL into source type for confidence scoring."""
-    lower = url.lower()
-    if operator_domain and operator_domain in lower:
-        return "operator_website"
-    if any(p in lower for p in PROPERTY_PORTALS):
-        return "property_portal"
-    if any(n in lower for n in NEWS_SITES):
-        return "news"
-    if any(p in lower for p in ["planningpipe.com", "planning.", "planningportal."]):
-        return "planning"
-    return "other"
+    """
+    Classify a URL into source type for confidence scoring, on its host only.
+    Known news/portal/planning domains live in source_domains.json.
+    """
+    if operator_domain:
+        domain = get_domain(url)
+        if domain == operator_domain or domain.endswith(f".{operator_domain}"):
+            return "operator_website"
+    return get_domain_classifier().source_type(url) or "other"
 
 
 def get_domain(url: str) -> str:
@@ -168,58 +151,102 @@ def detect_rebranding(
     return False, ""
 
 
-async def crawl_listing(listing: dict, config: Config) -> list[CrawlResult]:
+def create_rate_limiter(config: Config) -> DomainRateLimiter:
+    """Per-domain limiter using crawl_delay_seconds and CRAWL_DOMAIN_DELAYS overrides."""
+    return DomainRateLimiter(config.crawl_delay_seconds, config.domain_delays)
+
+
+def create_crawl_cache(config: Config) -> CrawlCache:
+    """On-disk crawl cache configured from CRAWL_CACHE_* settings and --cache-mode."""
+    return CrawlCache(
+        cache_dir=config.cache_dir or config.output_dir / "crawl_cache",
+        mode=config.cache_mode,
+        ttl_hours=config.cache_ttl_hours,
+        max_bytes=config.cache_max_mb * 1024 * 1024,
+    )
+
+
+async def crawl_url(
+    url: str,
+    pool: BrowserPool,
+    limiter: DomainRateLimiter,
+    cache: Optional[CrawlCache] = None,
+) -> CrawlResult:
+    """
+    Crawl one URL in a pooled tab, waiting for its domain's rate limit first.
+    With a cache, fresh or revalidated pages are served without rendering.
+    """
+    try:
+        if cache is not None:
+            result = await cache.fetch(url, get_domain(url), pool, limiter)
+        else:
+            await limiter.acquire(get_domain(url))
+            result = await pool.arun(url)
+        status_code = getattr(result, "status_code", None)
+        content = result.markdown if hasattr(result, "markdown") else ""
+        title = ""
+        if hasattr(result, "metadata") and result.metadata:
+            title = result.metadata.get("title", "")
+
+        is_dead = detect_dead_link(status_code, None)
+        if not result.success:
+            is_dead = detect_dead_link(status_code, str(getattr(result, "error_message", "")))
+
+        return CrawlResult(
+            url=url,
+            success=result.success if hasattr(result, "success") else bool(content),
+            status_code=status_code,
+            content=content,
+            title=title,
+            is_dead_link=is_dead,
+        )
+    except Exception as e:
+        is_dead = detect_dead_link(None, str(e))
+        return CrawlResult(
+            url=url,
+            success=False,
+            status_code=None,
+            content="",
+            title="",
+            error=str(e),
+            is_dead_link=is_dead,
+        )
+
+
+async def crawl_listing(
+    listing: dict,
+    config: Config,
+    pool: Optional[BrowserPool] = None,
+    limiter: Optional[DomainRateLimiter] = None,
+    cache: Optional[CrawlCache] = None,
+    timer: Optional[StageTimer] = None,
+) -> list[CrawlResult]:
     """
     Crawl web sources for a single listing using Crawl4AI.
-    Returns list of CrawlResult (one per URL attempted).
+    Returns list of CrawlResult (one per URL attempted, in URL order).
+
+    Pages are borrowed from the run's shared BrowserPool; without one, a
+    short-lived pool is opened just for this listing. URLs on different
+    domains are fetched in parallel, each gated by the per-domain limiter.
+    Pages in `cache` are served without a browser render. Each URL is timed
+    as a "crawl" span for its domain (rate-limit waits included).
     """
     urls = build_crawl_urls(listing)
     if not urls:
         return []
 
+    if pool is None:
+        async with BrowserPool(max_tabs=1) as own_pool:
+            return await crawl_listing(listing, config, own_pool, limiter, cache, timer)
+    if limiter is None:
+        limiter = create_rate_limiter(config)
+
     # Cap at max_pages_per_listing
     urls = urls[: config.max_pages_per_listing]
-    results = []
-
-    async with AsyncWebCrawler(verbose=False) as crawler:
-        for url in urls:
-            try:
-                result = await crawler.arun(url=url)
-                status_code = getattr(result, "status_code", None)
-                content = result.markdown if hasattr(result, "markdown") else ""
-                title = ""
-                if hasattr(result, "metadata") and result.metadata:
-                    title = result.metadata.get("title", "")
-
-                is_dead = detect_dead_link(status_code, None)
-                if not result.success:
-                    is_dead = detect_dead_link(status_code, str(getattr(result, "error_message", "")))
-
-                results.append(
-                    CrawlResult(
-                        url=url,
-                        success=result.success if hasattr(result, "success") else bool(content),
-                        status_code=status_code,
-                        content=content,
-                        title=title,
-                        is_dead_link=is_dead,
-                    )
-                )
-            except Exception as e:
-                is_dead = detect_dead_link(None, str(e))
-                results.append(
-                    CrawlResult(
-                        url=url,
-                        success=False,
-                        status_code=None,
-                        content="",
-                        title="",
-                        error=str(e),
-                        is_dead_link=is_dead,
-                    )
-                )
-
-            # Rate limiting between requests
-            await asyncio.sleep(config.crawl_delay_seconds)
-
-    return results
+    pool.open_session()
+
+    async def timed_crawl(url: str) -> CrawlResult:
+        with span(timer, "crawl", get_domain(url)):
+            return await crawl_url(url, pool, limiter, cache)
+
+    return list(await asyncio.gather(*(timed_crawl(url) for url in urls)))
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Iterator, Optional
 
 from supabase import create_client, Client
 
 from config import Config
+from timing import StageTimer, span
 
 
 def create_supabase_client(config: Config) -> Client:
@@ -10,6 +11,104 @@ def create_supabase_client(config: Config) -> Client:
     return create_client(config.supabase_url, config.supabase_service_key)
 
 
+SELECT_FIELDS = (
+    "id, name, slug, number_of_units, status, development_type, "
+    "region, area, postcode, website_url, description, "
+    "completion_date, year_completed, latitude, longitude, created_at, updated_at, verified_at, "
+    "operator:operators(id, name, slug, website), "
+    "asset_owner:asset_owners(id, name, slug, website)"
+)
+
+# --audit-offline also checks number_of_units against the unit mix
+AUDIT_SELECT_FIELDS = f"{SELECT_FIELDS}, studio_units, one_bed_units, two_bed_units, three_bed_plus_units"
+
+
+def _lookup_operator_ids(client: Client, operator_name: str) -> list[str]:
+    op_result = (
+        client.table("operators")
+        .select("id")
+        .ilike("name", f"%{operator_name}%")
+        .execute()
+    )
+    return [op["id"] for op in op_result.data or []]
+
+
+def iter_listings(
+    config: Config,
+    mode: str = "test",
+    operator_name: Optional[str] = None,
+    listing_name: Optional[str] = None,
+    page_size: Optional[int] = None,
+    timer: Optional[StageTimer] = None,
+    fields: str = SELECT_FIELDS,
+) -> Iterator[dict]:
+    """
+    Yield development listings (newest first) with joined operator/asset_owner
+    data, one page at a time.
+
+    Pages are fetched by keyset on (created_at, id) rather than one big query,
+    so --all isn't truncated by PostgREST's row cap and callers can start
+    work on the first page before later pages arrive. Listings without a
+    created_at come first. Page size defaults
+    to config.db_page_size. Each page query is timed as a "fetch" span.
+    `fields` is the PostgREST select list (SELECT_FIELDS by default).
+
+    Modes are the same as fetch_listings().
+    """
+    client = create_supabase_client(config)
+    page_size = max(1, page_size or config.db_page_size)
+
+    op_ids: list[str] = []
+    if mode == "operator" and operator_name:
+        # Look up operator ID first, then filter
+        op_ids = _lookup_operator_ids(client, operator_name)
+        if not op_ids:
+            print(f"  No operator found matching '{operator_name}'")
+            return
+
+    remaining = config.test_limit if mode == "test" else None
+    last: Optional[dict] = None
+    while remaining is None or remaining > 0:
+        limit = page_size if remaining is None else min(page_size, remaining)
+        query = (
+            client.table("developments")
+            .select(fields)
+            .eq("is_published", True)
+        )
+        if mode == "name" and listing_name:
+            query = query.ilike("name", f"%{listing_name}%")
+        elif op_ids:
+            query = query.in_("operator_id", op_ids)
+        # mode == "all" has no additional filter
+
+        if last is not None:
+            # Rows strictly after the previous page's last row in (created_at desc nulls first, id desc)
+            # order. created_at is nullable, so rows without one come first and need their own branch.
+            created_at = last["created_at"]
+            if created_at is None:
+                query = query.or_(f'created_at.not.is.null,and(created_at.is.null,id.lt.{last["id"]})')
+            else:
+                query = query.or_(
+                    f'created_at.lt."{created_at}",'
+                    f'and(created_at.eq."{created_at}",id.lt.{last["id"]})'
+                )
+
+        with span(timer, "fetch"):
+            page = (
+                query.order("created_at", desc=True, nullsfirst=True)
+                .order("id", desc=True)
+                .limit(limit)
+                .execute()
+            ).data or []
+
+        yield from page
+        if remaining is not None:
+            remaining -= len(page)
+        if len(page) < limit:
+            return
+        last = page[-1]
+
+
 def fetch_listings(
     config: Config,
     mode: str = "test",
@@ -25,44 +124,7 @@ def fetch_listings(
       - "operator": Filter by operator name
       - "name": Filter by development name (partial match)
     """
-    client = create_supabase_client(config)
-
-    select_fields = (
-        "id, name, slug, number_of_units, status, development_type, "
-        "region, area, postcode, website_url, description, "
-        "completion_date, year_completed, latitude, longitude, "
-        "operator:operators(id, name, slug, website), "
-        "asset_owner:asset_owners(id, name, slug, website)"
-    )
-
-    query = (
-        client.table("developments")
-        .select(select_fields)
-        .eq("is_published", True)
-        .order("created_at", desc=True)
-    )
-
-    if mode == "name" and listing_name:
-        query = query.ilike("name", f"%{listing_name}%")
-    elif mode == "operator" and operator_name:
-        # Look up operator ID first, then filter
-        op_result = (
-            client.table("operators")
-            .select("id")
-            .ilike("name", f"%{operator_name}%")
-            .execute()
-        )
-        if not op_result.data:
-            print(f"  No operator found matching '{operator_name}'")
-            return []
-        op_ids = [op["id"] for op in op_result.data]
-        query = query.in_("operator_id", op_ids)
-    elif mode == "test":
-        query = query.limit(config.test_limit)
-    # mode == "all" has no additional filter
-
-    result = query.execute()
-    return result.data or []
+    return list(iter_listings(config, mode, operator_name, listing_name))
 
 
 def get_null_fields(listing: dict) -> list[str]:
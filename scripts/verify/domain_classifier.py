@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+SOURCE_DOMAINS_FILE = Path(__file__).resolve().parent / "source_domains.json"
+
+# Categories in source_domains.json, in precedence order for equal-length matches
+SOURCE_TYPES = ("property_portal", "news", "planning")
+EXCLUDED = "excluded"
+
+
+def host_of(url_or_host: str) -> str:
+    """Lowercase host of a URL (or bare host), without port, "www." or trailing dot."""
+    text = (url_or_host or "").strip()
+    if "://" not in text:
+        text = f"//{text}"
+    try:
+        host = urlparse(text).hostname or ""
+    except ValueError:
+        return ""
+    host = host.rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+class DomainTrie:
+    """
+    Domains stored as reversed labels ("co.uk.rightmove"), so a lookup walks
+    the host's labels from the right and stops at the first missing one:
+    O(label count) whatever the number of domains. A domain matches itself
+    and its subdomains on whole labels, so "x.com" matches "x.com" and
+    "api.x.com" but not "netflix.com".
+    """
+
+    def __init__(self):
+        self._root: dict = {}
+
+    def add(self, domain: str, value: str) -> None:
+        node = self._root
+        for label in reversed(domain.lower().strip(".").split(".")):
+            node = node.setdefault(label, {})
+        node.setdefault("", value)  # "" never occurs as a label
+
+    def match(self, host: str) -> Optional[str]:
+        """Value of the longest stored domain that `host` is, or is a subdomain of."""
+        node, found = self._root, None
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get("", found)
+        return found
+
+    def __len__(self) -> int:
+        def count(node: dict) -> int:
+            return sum(1 if key == "" else count(child) for key, child in node.items())
+        return count(self._root)
+
+
+class DomainClassifier:
+    """
+    Source type and search exclusion for URLs, from one domain list shared
+    by verify (comparator confidence) and discover (search filtering and
+    deduplicator confidence). Built once; classification looks only at the
+    parsed host, never the path or query.
+    """
+
+    def __init__(self, domains: dict[str, list[str]]):
+        self.sources = DomainTrie()
+        self.excluded = DomainTrie()
+        # First-label wildcards ("planning.*" -> planning.leeds.gov.uk)
+        self.first_labels: dict[str, str] = {}
+
+        for source_type in SOURCE_TYPES:
+            for entry in domains.get(source_type, []):
+                if entry.endswith(".*"):
+                    self.first_labels.setdefault(entry[:-2].lower(), source_type)
+                else:
+                    self.sources.add(entry, source_type)
+        for entry in domains.get(EXCLUDED, []):
+            self.excluded.add(entry, EXCLUDED)
+
+    @classmethod
+    def from_file(cls, path: Path = SOURCE_DOMAINS_FILE) -> "DomainClassifier":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def source_type(self, url: str) -> Optional[str]:
+        """"news", "property_portal" or "planning" for a URL or host, else None."""
+        host = host_of(url)
+        if not host:
+            return None
+        found = self.sources.match(host)
+        if found is None:
+            found = self.first_labels.get(host.partition(".")[0])
+        return found
+
+    def is_excluded(self, url: str) -> bool:
+        """Whether search results from this URL or host should be skipped."""
+        host = host_of(url)
+        return bool(host) and self.excluded.match(host) is not None
+
+
+_classifier: Optional[DomainClassifier] = None
+
+
+def get_domain_classifier() -> DomainClassifier:
+    """The shared classifier, built from source_domains.json on first use."""
+    global _classifier
+    if _classifier is None:
+        _classifier = DomainClassifier.from_file()
+    return _classifier
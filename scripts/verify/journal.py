@@ -0,0 +1,99 @@
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+from models import Confidence, FieldComparison, FieldStatus, ListingVerification
+
+
+def journal_path(output_dir: Path, run_id: str) -> Path:
+    return output_dir / f"verification_journal_{run_id}.jsonl"
+
+
+def verification_to_dict(v: ListingVerification) -> dict:
+    data = asdict(v)
+    data["overall_confidence"] = v.overall_confidence.value
+    for comparison, raw in zip(v.field_comparisons, data["field_comparisons"]):
+        raw["status"] = comparison.status.value
+        raw["confidence"] = comparison.confidence.value
+    return data
+
+
+def verification_from_dict(data: dict) -> ListingVerification:
+    data = dict(data)
+    data["field_comparisons"] = [
+        FieldComparison(**{
+            **c,
+            "status": FieldStatus(c["status"]),
+            "confidence": Confidence(c["confidence"]),
+        })
+        for c in data.get("field_comparisons", [])
+    ]
+    data["overall_confidence"] = Confidence(data.get("overall_confidence", Confidence.LOW.value))
+    return ListingVerification(**data)
+
+
+class VerificationJournal:
+    """
+    Append-only JSONL record of finished listings for one verify run
+    (output/verification_journal_{run_id}.jsonl).
+
+    Each line is written and fsynced as its listing completes, so a crashed
+    run loses at most the listing in progress. `--resume <run_id>` skips
+    listings already journaled; ones that failed outright are retried, and
+    the latest entry for a development wins. The journal holds everything the
+    CSV/summary/SQL writers need, so reports can be rebuilt from it alone.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = None
+        self.appended = 0
+
+    def load(self) -> dict[str, tuple[ListingVerification, bool]]:
+        """Return {development_id: (verification, failed)} in first-completed order."""
+        entries: dict[str, tuple[ListingVerification, bool]] = {}
+        if not self.path.exists():
+            return entries
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    verification = verification_from_dict(entry["verification"])
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from a crash mid-write; everything before it is intact
+                    continue
+                entries[verification.development_id] = (verification, bool(entry.get("failed")))
+        return entries
+
+    def completed(self) -> list[ListingVerification]:
+        """Journaled results that don't need re-running (failed listings excluded)."""
+        return [v for v, failed in self.load().values() if not failed]
+
+    def results(self) -> list[ListingVerification]:
+        """Every journaled result (latest per development), for rebuilding reports."""
+        return [v for v, _ in self.load().values()]
+
+    def append(self, verification: ListingVerification, failed: bool = False) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            torn = self.path.exists() and self.path.stat().st_size > 0 and not self._ends_with_newline()
+            self._file = open(self.path, "a", encoding="utf-8")
+            if torn:
+                self._file.write("\n")
+        entry = {"failed": failed, "verification": verification_to_dict(verification)}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.appended += 1
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
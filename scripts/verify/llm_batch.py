@@ -0,0 +1,140 @@
+import asyncio
+from typing import Any, Callable, Optional
+
+from llm_cache import LLMCache, LLMCallResult
+from llm_metrics import LLMMetrics
+
+# Anthropic allows up to 100,000 requests per batch; smaller batches start
+# returning results sooner and keep each submission well under the size cap.
+MAX_REQUESTS_PER_BATCH = 10_000
+
+
+class MessageBatchRunner:
+    """
+    Submit prompts through the Anthropic Message Batches API and wait for them.
+
+    Used by --llm-batch runs of verify and discover, where per-listing latency
+    doesn't matter but cost and rate limits do. Works against any
+    AsyncAnthropic client, including one pointed at stub_anthropic_server.py
+    via ANTHROPIC_BASE_URL.
+    """
+
+    def __init__(
+        self,
+        client,
+        poll_interval: float = 30.0,
+        max_requests_per_batch: int = MAX_REQUESTS_PER_BATCH,
+    ):
+        self.client = client
+        self.poll_interval = poll_interval
+        self.max_requests_per_batch = max(1, max_requests_per_batch)
+
+        # Counters
+        self.batches_submitted = 0
+        self.requests_submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    async def run(self, requests: dict[str, dict]) -> dict[str, Any]:
+        """
+        Submit {custom_id: messages.create params} and return
+        {custom_id: Message} for every request that succeeded.
+        """
+        ids = list(requests)
+        chunks = [
+            ids[i : i + self.max_requests_per_batch]
+            for i in range(0, len(ids), self.max_requests_per_batch)
+        ]
+        messages: dict[str, Any] = {}
+        for chunk_result in await asyncio.gather(
+            *(self._run_batch({cid: requests[cid] for cid in chunk}) for chunk in chunks)
+        ):
+            messages.update(chunk_result)
+        return messages
+
+    async def _run_batch(self, requests: dict[str, dict]) -> dict[str, Any]:
+        batch = await self.client.messages.batches.create(
+            requests=[{"custom_id": cid, "params": params} for cid, params in requests.items()],
+        )
+        self.batches_submitted += 1
+        self.requests_submitted += len(requests)
+        print(f"    Submitted batch {batch.id} ({len(requests)} request(s))")
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(self.poll_interval)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            print(
+                f"    Batch {batch.id}: {batch.processing_status} "
+                f"({counts.succeeded} succeeded, {counts.processing} processing, {counts.errored} errored)"
+            )
+
+        messages: dict[str, Any] = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                messages[entry.custom_id] = entry.result.message
+                self.succeeded += 1
+            else:
+                self.failed += 1
+        return messages
+
+    def stats_line(self) -> str:
+        return (
+            f"Message batches: {self.batches_submitted} batch(es), {self.requests_submitted} request(s), "
+            f"{self.succeeded} succeeded, {self.failed} failed"
+        )
+
+
+async def run_cached_batch(
+    runner: MessageBatchRunner,
+    cache: Optional[LLMCache],
+    prepared: dict[str, tuple[str, str]],
+    request_params: Callable[[str], dict],
+    handle_response: Callable[[Any], LLMCallResult],
+    metrics: Optional[LLMMetrics] = None,
+    labels: Optional[dict[str, str]] = None,
+) -> dict[str, Any]:
+    """
+    Resolve {custom_id: (prompt, cache_key)} through the LLM cache first, send
+    the misses as one Message Batches submission (identical prompts are sent
+    once), and store the new results. Returns {custom_id: parsed result}.
+    Each request sent is recorded in `metrics` under labels[custom_id].
+    """
+    results: dict[str, Any] = {}
+    pending: dict[str, list[str]] = {}  # cache key -> custom_ids waiting on it
+    requests: dict[str, dict] = {}
+
+    for custom_id, (prompt, key) in prepared.items():
+        if cache is not None:
+            hit, result = cache.lookup(key)
+            if hit:
+                results[custom_id] = result
+                continue
+        if key not in pending:
+            pending[key] = []
+            requests[custom_id] = request_params(prompt)
+        pending[key].append(custom_id)
+
+    if not requests:
+        return results
+
+    print(f"    Sending {len(requests)} prompt(s) via Message Batches ({len(results)} served from cache)")
+    messages = await runner.run(requests)
+
+    for key, custom_ids in pending.items():
+        message = messages.get(custom_ids[0])
+        if metrics is not None:
+            label = (labels or {}).get(custom_ids[0], custom_ids[0])
+            if message is not None:
+                metrics.record_response(label, message, batch=True)
+            else:
+                metrics.record_failure(label, batch=True)
+        outcome: LLMCallResult = handle_response(message) if message is not None else (None, 0, 0)
+        if cache is not None:
+            cache.misses += 1
+            cache.shared_inflight += len(custom_ids) - 1
+            cache.store(key, outcome)
+        for custom_id in custom_ids:
+            results[custom_id] = outcome[0]
+
+    return results
@@ -0,0 +1,188 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from crawl_cache import CACHE_MODES
+
+# What a cached LLM call computes: (parsed result, input tokens, output tokens).
+# A result of None (API error, unparseable reply) is returned but never stored.
+LLMCallResult = tuple[Any, int, int]
+
+
+class LLMCache:
+    """
+    Persistent cache of parsed Claude extraction results, shared by the
+    verify (ClaudeAnalyzer) and discover (DiscoveryAnalyzer) analyzers.
+
+    Keys hash the model, the analyzer's prompt template version and the
+    exact prompt inputs (truncated content, listing name/area or source URL),
+    so any change to what would be sent to Claude is a miss. Identical
+    requests in flight at the same time share one API call.
+
+    Modes match the crawl cache: "use", "refresh" (always call, store
+    results) and "bypass" (no reads or writes; in-flight sharing still applies).
+    """
+
+    def __init__(self, cache_dir: Path, mode: str = "use"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}' (expected one of {', '.join(CACHE_MODES)})")
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._async_inflight: dict[str, asyncio.Future] = {}
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.shared_inflight = 0
+        self.saved_input_tokens = 0
+        self.saved_output_tokens = 0
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, *parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in (model, prompt_version, *parts):
+            digest.update((part or "").encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, result: Any, input_tokens: int, output_tokens: int) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "result": result,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "created_at": time.time(),
+        }
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def lookup(self, key: str) -> tuple[bool, Any]:
+        """Return (hit, result) from disk, counting saved tokens on a hit."""
+        if self.mode != "use":
+            return False, None
+        entry = self._read(key)
+        if entry is None:
+            return False, None
+        with self._lock:
+            self.hits += 1
+            self.saved_input_tokens += entry.get("input_tokens", 0)
+            self.saved_output_tokens += entry.get("output_tokens", 0)
+        return True, entry.get("result")
+
+    def store(self, key: str, outcome: LLMCallResult) -> None:
+        """Persist a computed outcome (skipped for None results and in bypass mode)."""
+        result, input_tokens, output_tokens = outcome
+        if result is not None and self.mode != "bypass":
+            self._write(key, result, input_tokens, output_tokens)
+
+    def call(self, key: str, compute: Callable[[], LLMCallResult]) -> Any:
+        """
+        Return the cached result for `key`, or run `compute` once and cache it.
+        Thread-safe: concurrent callers with the same key wait for one call.
+        """
+        hit, result = self.lookup(key)
+        if hit:
+            return result
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: Future = Future()
+                self._inflight[key] = future
+                self.misses += 1
+            else:
+                self.shared_inflight += 1
+
+        if pending is not None:
+            result, input_tokens, output_tokens = pending.result()
+            with self._lock:
+                self.saved_input_tokens += input_tokens
+                self.saved_output_tokens += output_tokens
+            return result
+
+        try:
+            outcome = compute()
+            self.store(key, outcome)
+            future.set_result(outcome)
+            return outcome[0]
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    async def acall(self, key: str, compute: Callable[[], Awaitable[LLMCallResult]]) -> Any:
+        """Async version of call(): concurrent tasks with the same key share one call."""
+        hit, result = self.lookup(key)
+        if hit:
+            return result
+
+        pending = self._async_inflight.get(key)
+        if pending is not None:
+            with self._lock:
+                self.shared_inflight += 1
+            result, input_tokens, output_tokens = await asyncio.shield(pending)
+            with self._lock:
+                self.saved_input_tokens += input_tokens
+                self.saved_output_tokens += output_tokens
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_inflight[key] = future
+        with self._lock:
+            self.misses += 1
+        try:
+            outcome = await compute()
+            self.store(key, outcome)
+            future.set_result(outcome)
+            return outcome[0]
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited failure doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            del self._async_inflight[key]
+
+    def summary_lines(self) -> list[str]:
+        """Lines for the run summary's LLM CACHE section."""
+        lines = ["LLM CACHE:", f"  Mode: {self.mode}"]
+        if self.mode != "bypass":
+            total = self.hits + self.misses
+            rate = round(self.hits / total * 100) if total else 0
+            lines.append(f"  Hits:   {self.hits} ({rate}%)")
+            lines.append(f"  Misses: {self.misses}")
+        lines.append(f"  Shared in-flight calls: {self.shared_inflight}")
+        lines.append(
+            f"  Tokens saved: {self.saved_input_tokens} input, {self.saved_output_tokens} output"
+        )
+        return lines
+
+    def stats_line(self) -> str:
+        return (
+            f"LLM cache ({self.mode}): {self.hits} hit(s), {self.misses} miss(es), "
+            f"{self.shared_inflight} shared, "
+            f"{self.saved_input_tokens + self.saved_output_tokens} token(s) saved"
+        )
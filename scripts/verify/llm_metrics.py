@@ -0,0 +1,262 @@
+import inspect
+import json
+import statistics
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import anthropic
+
+# USD per million tokens: (input, output, cache write, cache read).
+# Longest matching model-name prefix wins; unknown models report no cost.
+MODEL_PRICES: dict[str, tuple[float, float, float, float]] = {
+    "claude-opus-4-5": (5.00, 25.00, 6.25, 0.50),
+    "claude-opus-4": (15.00, 75.00, 18.75, 1.50),
+    "claude-sonnet-4": (3.00, 15.00, 3.75, 0.30),
+    "claude-3-7-sonnet": (3.00, 15.00, 3.75, 0.30),
+    "claude-3-5-sonnet": (3.00, 15.00, 3.75, 0.30),
+    "claude-haiku-4": (1.00, 5.00, 1.25, 0.10),
+    "claude-3-5-haiku": (0.80, 4.00, 1.00, 0.08),
+}
+
+# Message Batches are billed at half the standard rate
+BATCH_DISCOUNT = 0.5
+
+
+def model_prices(model: str) -> Optional[tuple[float, float, float, float]]:
+    matches = [prefix for prefix in MODEL_PRICES if model.startswith(prefix)]
+    return MODEL_PRICES[max(matches, key=len)] if matches else None
+
+
+def retries_for_error(client, error: Exception) -> int:
+    """
+    Retries the SDK spent before raising `error`: connection errors and
+    408/409/429/5xx responses are retried up to the client's max_retries,
+    anything else fails on the first attempt.
+    """
+    retryable = isinstance(error, anthropic.APIConnectionError) or (
+        isinstance(error, anthropic.APIStatusError)
+        and (error.status_code in (408, 409, 429) or error.status_code >= 500)
+    )
+    return getattr(client, "max_retries", 0) if retryable else 0
+
+
+@dataclass
+class LLMCallRecord:
+    """One Claude request: what it cost and how long it took."""
+    label: str  # listing name (verify) or page URL (discover)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
+    latency_seconds: Optional[float] = None  # None for Message Batches requests
+    retries: int = 0
+    success: bool = True
+    batch: bool = False
+    cost_usd: Optional[float] = None
+
+
+class LLMMetrics:
+    """
+    Token, cost and latency accounting for every Claude request an analyzer
+    sends (LLM cache hits and reused analyses send nothing, so aren't here).
+
+    Records come from response.usage: input/output tokens, prompt-cache
+    write/read tokens, wall-clock latency and SDK retries. Costs use
+    MODEL_PRICES and are estimates. Each run writes them to a JSON metrics
+    file next to its summary, which gets an LLM USAGE section.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self.prices = model_prices(model)
+        self._lock = threading.Lock()
+        self.records: list[LLMCallRecord] = []
+
+    def _cost(self, record: LLMCallRecord) -> Optional[float]:
+        if self.prices is None:
+            return None
+        input_price, output_price, write_price, read_price = self.prices
+        cost = (
+            record.input_tokens * input_price
+            + record.output_tokens * output_price
+            + record.cache_creation_tokens * write_price
+            + record.cache_read_tokens * read_price
+        ) / 1_000_000
+        return cost * BATCH_DISCOUNT if record.batch else cost
+
+    def record_response(
+        self,
+        label: str,
+        response: Any,
+        latency_seconds: Optional[float] = None,
+        retries: int = 0,
+        batch: bool = False,
+    ) -> None:
+        """Record a completed request from its response.usage."""
+        usage = getattr(response, "usage", None)
+        record = LLMCallRecord(
+            label=label,
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            output_tokens=getattr(usage, "output_tokens", 0) or 0,
+            cache_creation_tokens=getattr(usage, "cache_creation_input_tokens", 0) or 0,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", 0) or 0,
+            latency_seconds=latency_seconds,
+            retries=retries,
+            batch=batch,
+        )
+        record.cost_usd = self._cost(record)
+        with self._lock:
+            self.records.append(record)
+
+    def record_failure(
+        self,
+        label: str,
+        latency_seconds: Optional[float] = None,
+        retries: int = 0,
+        batch: bool = False,
+    ) -> None:
+        """Record a request that errored (no tokens billed)."""
+        with self._lock:
+            self.records.append(LLMCallRecord(
+                label=label, latency_seconds=latency_seconds, retries=retries,
+                success=False, batch=batch, cost_usd=0.0 if self.prices else None,
+            ))
+
+    def totals(self) -> dict:
+        records = list(self.records)
+        latencies = sorted(r.latency_seconds for r in records if r.latency_seconds is not None)
+        costs = [r.cost_usd for r in records if r.cost_usd is not None]
+        return {
+            "requests": len(records),
+            "failed": sum(1 for r in records if not r.success),
+            "batch_requests": sum(1 for r in records if r.batch),
+            "retries": sum(r.retries for r in records),
+            "input_tokens": sum(r.input_tokens for r in records),
+            "output_tokens": sum(r.output_tokens for r in records),
+            "cache_creation_tokens": sum(r.cache_creation_tokens for r in records),
+            "cache_read_tokens": sum(r.cache_read_tokens for r in records),
+            "cost_usd": round(sum(costs), 6) if self.prices else None,
+            "latency_seconds": {
+                "total": round(sum(latencies), 3),
+                "median": round(statistics.median(latencies), 3) if latencies else None,
+                "max": round(latencies[-1], 3) if latencies else None,
+            },
+        }
+
+    def by_label(self) -> list[dict]:
+        """Per listing/URL totals, most expensive first (by cost, else tokens)."""
+        grouped: dict[str, dict] = {}
+        for r in list(self.records):
+            entry = grouped.setdefault(r.label, {
+                "label": r.label, "requests": 0, "retries": 0, "input_tokens": 0,
+                "output_tokens": 0, "cache_creation_tokens": 0, "cache_read_tokens": 0,
+                "latency_seconds": 0.0, "cost_usd": 0.0 if self.prices else None,
+            })
+            entry["requests"] += 1
+            entry["retries"] += r.retries
+            entry["input_tokens"] += r.input_tokens
+            entry["output_tokens"] += r.output_tokens
+            entry["cache_creation_tokens"] += r.cache_creation_tokens
+            entry["cache_read_tokens"] += r.cache_read_tokens
+            entry["latency_seconds"] = round(entry["latency_seconds"] + (r.latency_seconds or 0.0), 3)
+            if r.cost_usd is not None:
+                entry["cost_usd"] = round(entry["cost_usd"] + r.cost_usd, 6)
+        return sorted(
+            grouped.values(),
+            key=lambda e: (-(e["cost_usd"] or 0.0), -(e["input_tokens"] + e["output_tokens"]), e["label"]),
+        )
+
+    def write_json(self, filepath: Path, top_n: int = 20) -> Path:
+        """Write the metrics file: totals, the top-N listings/URLs and every request."""
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "model": self.model,
+            "prices_usd_per_million": dict(zip(
+                ("input", "output", "cache_write", "cache_read"), self.prices,
+            )) if self.prices else None,
+            "totals": self.totals(),
+            "most_expensive": self.by_label()[:top_n],
+            "requests": [asdict(r) for r in self.records],
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        return filepath
+
+    def summary_lines(self, top_n: int = 10) -> list[str]:
+        """Lines for the run summary's LLM USAGE section."""
+        totals = self.totals()
+        lines = [f"LLM USAGE ({self.model}):"]
+        if not totals["requests"]:
+            lines.append("  No Claude requests sent")
+            return lines
+
+        lines.append(
+            f"  Requests: {totals['requests']} ({totals['failed']} failed, "
+            f"{totals['batch_requests']} via batches, {totals['retries']} retries)"
+        )
+        lines.append(f"  Tokens: {totals['input_tokens']} input, {totals['output_tokens']} output")
+        if totals["cache_creation_tokens"] or totals["cache_read_tokens"]:
+            lines.append(
+                f"  Prompt cache: {totals['cache_creation_tokens']} written, "
+                f"{totals['cache_read_tokens']} read"
+            )
+        latency = totals["latency_seconds"]
+        if latency["median"] is not None:
+            lines.append(f"  Latency: median {latency['median']}s, max {latency['max']}s")
+        if totals["cost_usd"] is not None:
+            lines.append(f"  Estimated cost: ${totals['cost_usd']:.4f}")
+        else:
+            lines.append("  Estimated cost: unknown (no prices for this model)")
+
+        lines.append(f"  Most expensive (top {top_n}):")
+        for entry in self.by_label()[:top_n]:
+            cost = f"${entry['cost_usd']:.4f}, " if entry["cost_usd"] is not None else ""
+            retries = f", {entry['retries']} retries" if entry["retries"] else ""
+            lines.append(
+                f"    {entry['label']}: {cost}{entry['input_tokens']} in / {entry['output_tokens']} out{retries}"
+            )
+        return lines
+
+    def stats_line(self) -> str:
+        totals = self.totals()
+        cost = f", ~${totals['cost_usd']:.4f}" if totals["cost_usd"] is not None else ""
+        return (
+            f"LLM usage: {totals['requests']} request(s), {totals['input_tokens']} input + "
+            f"{totals['output_tokens']} output token(s){cost}"
+        )
+
+
+def send_tracked(client, metrics: Optional[LLMMetrics], label: str, params: dict) -> Any:
+    """client.messages.create(**params), recording usage, latency and retries in `metrics`."""
+    started = time.perf_counter()
+    try:
+        raw = client.messages.with_raw_response.create(**params)
+        response = raw.parse()
+    except Exception as e:
+        if metrics is not None:
+            metrics.record_failure(label, time.perf_counter() - started, retries_for_error(client, e))
+        raise
+    if metrics is not None:
+        metrics.record_response(label, response, time.perf_counter() - started, getattr(raw, "retries_taken", 0))
+    return response
+
+
+async def asend_tracked(client, metrics: Optional[LLMMetrics], label: str, params: dict) -> Any:
+    """Async version of send_tracked() for AsyncAnthropic clients."""
+    started = time.perf_counter()
+    try:
+        raw = await client.messages.with_raw_response.create(**params)
+        response = raw.parse()
+        if inspect.isawaitable(response):  # async raw responses parse asynchronously in newer SDKs
+            response = await response
+    except Exception as e:
+        if metrics is not None:
+            metrics.record_failure(label, time.perf_counter() - started, retries_for_error(client, e))
+        raise
+    if metrics is not None:
+        metrics.record_response(label, response, time.perf_counter() - started, getattr(raw, "retries_taken", 0))
+    return response
@@ -11,6 +11,14 @@ Usage:
   python scripts/verify/main.py --all
   python scripts/verify/main.py --test --generate-sql
   python scripts/verify/main.py --test --no-llm
+  python scripts/verify/main.py --all --crawl-workers 6 --llm-workers 4
+  python scripts/verify/main.py --test --cache-mode refresh
+  python scripts/verify/main.py --all --llm-batch
+  python scripts/verify/main.py --all --incremental
+  python scripts/verify/main.py --all --resume 20260314_021500
+  python scripts/verify/main.py --resume 20260314_021500 --reports-only --generate-sql
+  python scripts/verify/main.py --audit-offline --generate-sql
+  python scripts/verify/main.py --geo-check --geo-outlier-km 1.5
 """
 
 import argparse
@@ -18,6 +26,7 @@ import asyncio
 import sys
 import os
 from datetime import datetime
+from typing import Optional
 
 # Force UTF-8 output on Windows (cp1252 can't handle em-dashes/arrows)
 if sys.platform == "win32":
@@ -29,12 +38,20 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import Config, load_config, validate_config
 from models import ListingVerification, FieldStatus
-from db import fetch_listings, get_null_fields
-from crawler import crawl_listing
-from analyzer import create_analyzer
-from postcode import lookup_postcode
-from comparator import compare_listing
-from enrichment import suggest_enrichments
+from db import AUDIT_SELECT_FIELDS, get_null_fields, iter_listings
+from browser_pool import BrowserPool
+from crawler import create_crawl_cache, create_rate_limiter
+from crawl_cache import CACHE_MODES
+from analyzer import create_async_analyzer
+from llm_batch import MessageBatchRunner
+from llm_cache import LLMCache
+from analysis_store import AnalysisStore
+from boilerplate_store import BoilerplateStore
+from journal import VerificationJournal, journal_path
+from verify_state import VerificationState
+from postcode import close_postcode_service, configure_postcode_service, get_postcode_service
+from timing import StageTimer, span
+from pipeline import ListingJob, run_pipeline
 from output_csv import generate_csv_report
 from output_summary import generate_summary
 from output_sql import generate_sql_updates
@@ -54,7 +71,42 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--generate-sql", action="store_true", help="Generate SQL update file")
     parser.add_argument("--no-llm", action="store_true", help="Skip LLM analysis (faster, less accurate)")
 
-    return parser.parse_args()
+    # Pipeline concurrency (defaults come from config / scripts/.env)
+    parser.add_argument("--crawl-workers", type=int, help="Concurrent listing crawls")
+    parser.add_argument("--postcode-workers", type=int, help="Concurrent postcodes.io lookups")
+    parser.add_argument("--llm-workers", type=int, help="Concurrent Claude analysis calls")
+    parser.add_argument("--compare-workers", type=int, help="Compare/enrichment workers")
+    parser.add_argument("--browser-tabs", type=int, help="Concurrent tabs in the shared browser")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default="use",
+                        help="Crawl cache: use (default), refresh (re-crawl and store), bypass")
+    parser.add_argument("--llm-batch", action="store_true",
+                        help="Send all LLM prompts via Message Batches (cheaper, results after the crawl)")
+    parser.add_argument("--llm-cache-mode", choices=CACHE_MODES, default="use",
+                        help="LLM result cache: use (default), refresh (re-analyze and store), bypass")
+    parser.add_argument("--postcode-cache-mode", choices=CACHE_MODES, default="use",
+                        help="Postcode result cache: use (default), refresh (re-query and store), bypass")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only verify listings edited since, or due after, their last verification")
+    parser.add_argument("--resume", metavar="RUN_ID",
+                        help="Continue an interrupted run (RUN_ID is its timestamp, e.g. 20260314_021500)")
+    parser.add_argument("--reports-only", action="store_true",
+                        help="With --resume: rebuild that run's reports from its journal, no crawling")
+    parser.add_argument("--audit-offline", action="store_true",
+                        help="Only run checks that need no crawling (postcode, region, coordinates, "
+                             "placeholders, status/type, unit mix) over every listing, or --operator/--name")
+    parser.add_argument("--geo-check", action="store_true",
+                        help="Also check coordinates against postcode centroids (implies --audit-offline)")
+    parser.add_argument("--geo-outlier-km", type=float,
+                        help="--geo-check distance above which a pin is flagged (default: GEO_OUTLIER_KM or 2)")
+
+    args = parser.parse_args()
+    if args.reports_only and not args.resume:
+        parser.error("--reports-only requires --resume RUN_ID")
+    if args.geo_check:
+        args.audit_offline = True
+    if args.audit_offline and (args.resume or args.incremental):
+        parser.error("--audit-offline can't be combined with --resume or --incremental")
+    return args
 
 
 def determine_mode(args: argparse.Namespace) -> tuple[str, str]:
@@ -68,202 +120,384 @@ def determine_mode(args: argparse.Namespace) -> tuple[str, str]:
     return "test", "TEST"
 
 
-async def verify_listing(
-    listing: dict,
+def apply_worker_overrides(config: Config, args: argparse.Namespace) -> None:
+    """Apply --*-workers / --browser-tabs CLI flags on top of the configured sizes."""
+    for stage in ("crawl", "postcode", "llm", "compare"):
+        value = getattr(args, f"{stage}_workers")
+        if value is not None:
+            setattr(config, f"{stage}_workers", max(1, value))
+    if args.browser_tabs is not None:
+        config.browser_tabs = max(1, args.browser_tabs)
+
+
+def print_listing_status(job: ListingJob, done: int, total: Optional[int]) -> None:
+    """Print the one-line progress entry for a finished listing (total may be unknown)."""
+    name = job.listing.get("name", "Unknown")
+    area = job.listing.get("area", "")
+    label = f"{name} ({area})" if area else name
+    progress = f"{done}/{total}" if total is not None else str(done)
+    print(f"  [{progress}] {label}...")
+
+    if job.error is not None:
+        print(f"           ERROR: {job.error}")
+        return
+
+    verification = job.verification
+    statuses = [c.status.value for c in verification.field_comparisons
+                if c.status not in (FieldStatus.MATCH, FieldStatus.NOT_FOUND)]
+    if statuses:
+        print(f"           Issues: {', '.join(statuses)}")
+    else:
+        print(f"           OK")
+
+    if verification.dead_links:
+        print(f"           Dead links: {', '.join(verification.dead_links)}")
+    if verification.rebranding_detected:
+        print(f"           Possible rebrand: {verification.rebranding_notes}")
+
+
+def write_reports(
+    results: list[ListingVerification],
+    date_str: str,
     config: Config,
-    analyzer,
-    use_llm: bool,
-) -> ListingVerification:
-    """Run the full verification pipeline for a single listing."""
-    name = listing.get("name", "Unknown")
-    area = listing.get("area", "")
-
-    # Step 1: Crawl web sources
-    crawl_results = await crawl_listing(listing, config)
-    successful_crawls = [r for r in crawl_results if r.success and r.content]
-
-    # Step 2: Postcode lookup (if listing has a postcode)
-    postcode_data = None
-    postcode = listing.get("postcode")
-    if postcode:
-        postcode_data = await lookup_postcode(postcode)
-
-    # Step 3: LLM analysis of crawled content
-    llm_analysis = None
-    if use_llm and analyzer and successful_crawls:
-        # Combine content from all successful crawls (truncated)
-        combined_content = "\n\n---\n\n".join(
-            f"Source: {r.url}\n{r.content[:4000]}" for r in successful_crawls
-        )
-        llm_analysis = analyzer.extract_development_info(
-            combined_content, name, area
-        )
+    mode_label: str,
+    generate_sql: bool,
+    extra_sections: Optional[list[list[str]]] = None,
+    timer: Optional[StageTimer] = None,
+) -> None:
+    """
+    Write the CSV/summary/SQL outputs and print the console summary.
+    With a `timer`, the CSV/SQL writers are timed as the "output" stage and
+    the run's stage timings go into the summary and a timings JSON file.
+    """
+    print()
+    print("Step 3: Generating reports...")
 
-    # Step 4: Compare stored vs found
-    verification = compare_listing(listing, crawl_results, llm_analysis, postcode_data)
+    with span(timer, "output"):
+        csv_path = generate_csv_report(results, date_str, config.output_dir)
+        print(f"  CSV report:  {csv_path}")
 
-    # Step 5: Suggest enrichments for empty fields
-    enrichments = suggest_enrichments(listing, llm_analysis, postcode_data)
+        if generate_sql:
+            sql_path = generate_sql_updates(results, date_str, config.output_dir)
+            print(f"  SQL updates: {sql_path}")
 
-    # Merge enrichment suggestions into verification
-    # Only add if the field doesn't already have a GAP_FILLED comparison
-    existing_gap_fills = {
-        c.field_name for c in verification.field_comparisons
-        if c.status == FieldStatus.GAP_FILLED
-    }
-    for enrichment in enrichments:
-        if enrichment.field_name not in existing_gap_fills:
-            verification.field_comparisons.append(enrichment)
+    if timer is not None:
+        extra_sections = [*(extra_sections or []), timer.summary_lines()]
+    summary_path = generate_summary(
+        results, date_str, config.output_dir, mode=mode_label, extra_sections=extra_sections,
+    )
+    print(f"  Summary:     {summary_path}")
 
-    return verification
+    if timer is not None:
+        timings_path = timer.write_json(config.output_dir / f"verification_timings_{date_str}.json")
+        print(f"  Timings:     {timings_path}")
 
+    # Print summary to console
+    print()
+    print("=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
 
-async def main():
-    args = parse_args()
-    config = load_config()
-    use_llm = not args.no_llm
-    validate_config(config, use_llm=use_llm)
+    total = len(results)
+    matches = sum(1 for r in results if all(
+        c.status in (FieldStatus.MATCH, FieldStatus.NOT_FOUND) for c in r.field_comparisons
+    ) and any(c.status == FieldStatus.MATCH for c in r.field_comparisons))
+    discrepancies = sum(1 for r in results if any(
+        c.status == FieldStatus.DISCREPANCY for c in r.field_comparisons
+    ))
+    gap_fills = sum(1 for r in results if any(
+        c.status == FieldStatus.GAP_FILLED for c in r.field_comparisons
+    ))
+    status_changes = sum(1 for r in results if any(
+        c.status == FieldStatus.STATUS_CHANGE for c in r.field_comparisons
+    ))
 
-    mode, mode_label = determine_mode(args)
-    date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    print(f"  Listings checked:    {total}")
+    print(f"  Fully verified:      {matches}")
+    print(f"  Discrepancies:       {discrepancies}")
+    print(f"  Status changes:      {status_changes}")
+    print(f"  Gaps filled:         {gap_fills}")
+    print(f"  Dead links:          {sum(len(r.dead_links) for r in results)}")
+    print(f"  Possible rebrandings: {sum(1 for r in results if r.rebranding_detected)}")
+    print()
+
+    if not generate_sql and (discrepancies > 0 or gap_fills > 0 or status_changes > 0):
+        print("  To generate SQL update statements, re-run with --generate-sql")
+        print()
+
+    print("Done.")
+
+
+async def run_offline_audit(args: argparse.Namespace, config: Config, mode: str, date_str: str) -> None:
+    """
+    --audit-offline: fetch the listings and run the column-wise checks in
+    audit.py, writing the usual CSV/summary (and SQL) reports. No crawling
+    or LLM calls, so the whole directory takes seconds. --geo-check adds
+    postcode centroid lookups, served from the offline index and postcode
+    cache where possible and otherwise by bulk postcodes.io requests.
+    """
+    # NumPy is only needed here
+    from audit import OfflineAudit, load_postcode_centroids
+
+    if args.geo_outlier_km is not None:
+        config.geo_outlier_km = args.geo_outlier_km
+
+    # Audits default to every listing; --operator/--name narrow it as usual
+    if mode == "test":
+        mode = "all"
+    mode_label = f"OFFLINE AUDIT ({mode.upper()})"
 
     print()
     print("=" * 60)
-    print("BTR Directory Listing Verification Tool")
+    print("BTR Directory Offline Audit")
     print("=" * 60)
     print(f"  Mode: {mode_label}")
-    print(f"  LLM Analysis: {'Enabled (Claude)' if use_llm else 'Disabled (--no-llm)'}")
     print(f"  Generate SQL: {'Yes' if args.generate_sql else 'No'}")
+    if args.geo_check:
+        print(f"  Geo check: pins over {config.geo_outlier_km:g} km from the postcode centroid")
+    print(f"  Run ID: {date_str}")
     print()
 
-    # Step 1: Fetch listings from Supabase
-    print("Step 1: Fetching listings from Supabase...")
-    listings = fetch_listings(
+    print(f"Step 1: Fetching listings from Supabase ({config.db_page_size} per page)...")
+    timer = StageTimer()
+    listings = list(iter_listings(
         config,
         mode=mode,
         operator_name=args.operator,
         listing_name=args.name,
-    )
-
+        timer=timer,
+        fields=AUDIT_SELECT_FIELDS,
+    ))
+    print(f"  Fetched {len(listings)} listing(s)")
     if not listings:
         print("  No listings found matching your criteria.")
         sys.exit(0)
 
-    print(f"  Found {len(listings)} listing(s) to verify.")
+    centroids = None
+    if args.geo_check:
+        print()
+        print("Step 2: Looking up postcode centroids...")
+        configure_postcode_service(
+            config.postcode_index_path,
+            cache_path=config.postcode_cache_path,
+            cache_mode=args.postcode_cache_mode,
+            cache_ttl_hours=config.postcode_cache_ttl_hours,
+            cache_negative_ttl_hours=config.postcode_cache_negative_ttl_hours,
+        )
+        with span(timer, "postcode"):
+            centroids = await load_postcode_centroids(listings)
+        postcode_service = get_postcode_service()
+        print(f"  {postcode_service.stats_line()}")
+        if postcode_service.cache:
+            print(f"  {postcode_service.cache.stats_line()}")
+        await close_postcode_service()
+
+    print()
+    print(f"Step {3 if args.geo_check else 2}: Auditing listings...")
+    audit = OfflineAudit(geo_outlier_km=config.geo_outlier_km)
+    with span(timer, "audit"):
+        results = audit.run(listings, centroids)
+    print(f"  {audit.stats_line()}")
+    print(f"  {timer.stats_line()}")
+
+    write_reports(results, date_str, config, mode_label, args.generate_sql, [audit.summary_lines()], timer)
+
+
+async def main():
+    args = parse_args()
+    config = load_config()
+    use_llm = not args.no_llm
+    mode, mode_label = determine_mode(args)
+
+    if args.audit_offline:
+        validate_config(config, use_llm=False)
+        await run_offline_audit(args, config, mode, datetime.now().strftime("%Y%m%d_%H%M%S"))
+        return
+
+    # The run ID names the journal and every output file; --resume reuses it
+    date_str = args.resume or datetime.now().strftime("%Y%m%d_%H%M%S")
+    journal = VerificationJournal(journal_path(config.output_dir, date_str))
+    if args.resume and not journal.path.exists():
+        print(f"Error: No journal for run '{args.resume}' ({journal.path})")
+        sys.exit(1)
 
+    if args.reports_only:
+        results = journal.results()
+        print(f"Rebuilding reports for run {date_str} from {len(results)} journaled listing(s)")
+        write_reports(results, date_str, config, mode_label, args.generate_sql)
+        return
+
+    validate_config(config, use_llm=use_llm)
+    apply_worker_overrides(config, args)
+    config.cache_mode = args.cache_mode
+    config.llm_cache_mode = args.llm_cache_mode
+    config.postcode_cache_mode = args.postcode_cache_mode
+
+    print()
+    print("=" * 60)
+    print("BTR Directory Listing Verification Tool")
+    print("=" * 60)
+    print(f"  Mode: {mode_label}")
+    print(f"  LLM Analysis: {'Enabled (Claude)' if use_llm else 'Disabled (--no-llm)'}")
+    if use_llm and args.llm_batch:
+        print("  LLM Mode: Message Batches (--llm-batch)")
+    print(f"  Generate SQL: {'Yes' if args.generate_sql else 'No'}")
+    print(f"  Crawl cache: {config.cache_mode}")
+    print(f"  LLM cache: {config.llm_cache_mode}")
+    print(f"  Postcode cache: {config.postcode_cache_mode}")
+    print(f"  Incremental: {'Yes' if args.incremental else 'No'}")
+    print(f"  Run ID: {date_str}{' (resumed)' if args.resume else ''}")
+    print()
+
+    previous = journal.completed() if args.resume else []
+    completed_ids = {v.development_id for v in previous}
+    if previous:
+        print(f"  Resuming: {len(previous)} listing(s) already verified in {journal.path.name}")
+        print()
+
+    # Step 1: Stream listings from Supabase (pages load while earlier ones are verified)
+    print(f"Step 1: Fetching listings from Supabase ({config.db_page_size} per page)...")
+    fetched = 0
+    skipped = 0
+    state = None
+    if args.incremental:
+        state = VerificationState(
+            config.state_path,
+            initial_ttl_hours=config.incremental_initial_ttl_days * 24,
+            min_ttl_hours=config.incremental_min_ttl_days * 24,
+            max_ttl_hours=config.incremental_max_ttl_days * 24,
+        )
+    timer = StageTimer()
     # Track null fields across all listings
     all_null_fields: dict[str, int] = {}
-    for listing in listings:
-        for field in get_null_fields(listing):
-            all_null_fields[field] = all_null_fields.get(field, 0) + 1
-
-    if all_null_fields:
-        print(f"  Fields with missing data: {', '.join(f'{k}({v})' for k, v in sorted(all_null_fields.items(), key=lambda x: -x[1]))}")
+    # Fetch position of every listing, resumed ones included, to order the reports
+    fetch_order: dict[str, int] = {}
+
+    def tracked_listings():
+        nonlocal fetched, skipped
+        for listing in iter_listings(
+            config,
+            mode=mode,
+            operator_name=args.operator,
+            listing_name=args.name,
+            timer=timer,
+        ):
+            fetch_order.setdefault(listing.get("id"), fetched)
+            fetched += 1
+            if listing.get("id") in completed_ids:
+                skipped += 1
+                continue
+            if state is not None and not state.is_due(listing):
+                skipped += 1
+                continue
+            for field in get_null_fields(listing):
+                all_null_fields[field] = all_null_fields.get(field, 0) + 1
+            yield listing
 
     print()
 
     # Step 2: Create analyzer
     analyzer = None
+    llm_cache = None
     if use_llm:
-        analyzer = create_analyzer(config)
+        llm_cache = LLMCache(config.llm_cache_dir or config.output_dir / "llm_cache", config.llm_cache_mode)
+        analyzer = create_async_analyzer(config, llm_cache)
         if analyzer:
-            print(f"  LLM: Claude ({config.llm_model})")
+            print(f"  LLM: Claude ({config.llm_model}, up to {config.llm_workers} concurrent calls)")
+            # Templates from earlier runs only, so prompts don't depend on this run's crawl order
+            analyzer.boilerplate.use_store(BoilerplateStore(config.boilerplate_store_path))
         else:
             print("  Warning: Could not create LLM analyzer. Running without LLM.")
             use_llm = False
 
-    # Step 3: Verify each listing
-    print()
-    print("Step 2: Verifying listings...")
-    results: list[ListingVerification] = []
-
-    for i, listing in enumerate(listings, 1):
-        name = listing.get("name", "Unknown")
-        area = listing.get("area", "")
-        label = f"{name} ({area})" if area else name
-        print(f"  [{i}/{len(listings)}] {label}...")
-
-        try:
-            verification = await verify_listing(listing, config, analyzer, use_llm)
-            results.append(verification)
-
-            # Print quick status
-            statuses = [c.status.value for c in verification.field_comparisons
-                        if c.status not in (FieldStatus.MATCH, FieldStatus.NOT_FOUND)]
-            if statuses:
-                print(f"           Issues: {', '.join(statuses)}")
-            else:
-                print(f"           OK")
-
-            if verification.dead_links:
-                print(f"           Dead links: {', '.join(verification.dead_links)}")
-            if verification.rebranding_detected:
-                print(f"           Possible rebrand: {verification.rebranding_notes}")
-
-        except Exception as e:
-            print(f"           ERROR: {e}")
-            # Create a minimal error result
-            results.append(ListingVerification(
-                development_id=listing.get("id", ""),
-                development_name=name,
-                development_slug=listing.get("slug", ""),
-                area=area,
-                operator_name="",
-                asset_owner_name="",
-                website_url=listing.get("website_url"),
-                crawl_errors=[str(e)],
-                notes=f"Verification failed: {e}",
-            ))
-
-    # Step 4: Generate output files
-    print()
-    print("Step 3: Generating reports...")
-
-    csv_path = generate_csv_report(results, date_str, config.output_dir)
-    print(f"  CSV report:  {csv_path}")
-
-    summary_path = generate_summary(results, date_str, config.output_dir, mode=mode_label)
-    print(f"  Summary:     {summary_path}")
-
-    if args.generate_sql:
-        sql_path = generate_sql_updates(results, date_str, config.output_dir)
-        print(f"  SQL updates: {sql_path}")
-
-    # Print summary to console
-    print()
-    print("=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
+    # Previous analyses, reused for listings whose pages haven't changed
+    store = AnalysisStore(config.state_path, config.llm_cache_mode) if use_llm else None
 
-    total = len(results)
-    matches = sum(1 for r in results if all(
-        c.status in (FieldStatus.MATCH, FieldStatus.NOT_FOUND) for c in r.field_comparisons
-    ) and any(c.status == FieldStatus.MATCH for c in r.field_comparisons))
-    discrepancies = sum(1 for r in results if any(
-        c.status == FieldStatus.DISCREPANCY for c in r.field_comparisons
-    ))
-    gap_fills = sum(1 for r in results if any(
-        c.status == FieldStatus.GAP_FILLED for c in r.field_comparisons
-    ))
-    status_changes = sum(1 for r in results if any(
-        c.status == FieldStatus.STATUS_CHANGE for c in r.field_comparisons
-    ))
+    batch_runner = None
+    if use_llm and args.llm_batch:
+        batch_runner = MessageBatchRunner(analyzer.client, poll_interval=config.llm_batch_poll_seconds)
 
-    print(f"  Listings checked:    {total}")
-    print(f"  Fully verified:      {matches}")
-    print(f"  Discrepancies:       {discrepancies}")
-    print(f"  Status changes:      {status_changes}")
-    print(f"  Gaps filled:         {gap_fills}")
-    print(f"  Dead links:          {sum(len(r.dead_links) for r in results)}")
-    print(f"  Possible rebrandings: {sum(1 for r in results if r.rebranding_detected)}")
+    # Step 3: Verify listings through the staged pipeline
     print()
+    print("Step 2: Verifying listings...")
+    print(
+        f"  Workers: crawl={config.crawl_workers} postcode={config.postcode_workers} "
+        f"llm={config.llm_workers} compare={config.compare_workers} "
+        f"browser tabs={config.browser_tabs}"
+    )
+    done = 0
+
+    def on_result(job: ListingJob) -> None:
+        nonlocal done
+        done += 1
+        journal.append(job.verification, failed=job.error is not None)
+        if state is not None and job.error is None:
+            state.record(job.verification)
+        print_listing_status(job, done, None)
+
+    limiter = create_rate_limiter(config)
+    configure_postcode_service(
+        config.postcode_index_path,
+        cache_path=config.postcode_cache_path,
+        cache_mode=config.postcode_cache_mode,
+        cache_ttl_hours=config.postcode_cache_ttl_hours,
+        cache_negative_ttl_hours=config.postcode_cache_negative_ttl_hours,
+    )
+    async with BrowserPool(max_tabs=config.browser_tabs) as pool, create_crawl_cache(config) as cache:
+        results: list[ListingVerification] = await run_pipeline(
+            tracked_listings(), config, analyzer, use_llm,
+            pool=pool, limiter=limiter, cache=cache,
+            batch_runner=batch_runner, on_result=on_result, store=store, timer=timer,
+        )
+    postcode_service = get_postcode_service()
+    print(f"  {pool.stats_line()}")
+    print(f"  {limiter.stats_line()}")
+    print(f"  {postcode_service.stats_line()}")
+    if postcode_service.cache:
+        print(f"  {postcode_service.cache.stats_line()}")
+    await close_postcode_service()
+    print(f"  {cache.stats_line()}")
+    if llm_cache:
+        print(f"  {llm_cache.stats_line()}")
+    if analyzer:
+        print(f"  {analyzer.boilerplate.stats_line()}")
+        print(f"  {analyzer.metrics.stats_line()}")
+        analyzer.boilerplate.store.close()
+    if store:
+        print(f"  {store.stats_line()}")
+        store.close()
+    if batch_runner:
+        print(f"  {batch_runner.stats_line()}")
+    print(f"  {timer.stats_line()}")
+
+    journal.close()
+    if state is not None:
+        print(f"  {state.stats_line()}")
+        state.close()
+
+    # Journaled listings come back in completion order; report everything in fetch order
+    results = sorted(previous + results, key=lambda v: fetch_order.get(v.development_id, len(fetch_order)))
+
+    if not results:
+        print("  No listings due for verification." if skipped else "  No listings found matching your criteria.")
+        sys.exit(0)
 
-    if not args.generate_sql and (discrepancies > 0 or gap_fills > 0 or status_changes > 0):
-        print("  To generate SQL update statements, re-run with --generate-sql")
-        print()
-
-    print("Done.")
+    print(f"  Verified {fetched - skipped} listing(s){f' ({skipped} skipped)' if skipped else ''}.")
+    print(f"  Journal:     {journal.path}")
+    if analyzer:
+        metrics_path = analyzer.metrics.write_json(config.output_dir / f"verification_llm_metrics_{date_str}.json")
+        print(f"  LLM metrics: {metrics_path}")
+    if all_null_fields:
+        print(f"  Fields with missing data: {', '.join(f'{k}({v})' for k, v in sorted(all_null_fields.items(), key=lambda x: -x[1]))}")
 
+    # Step 4: Generate output files
+    extra_sections = []
+    if llm_cache:
+        extra_sections.append(llm_cache.summary_lines())
+    if analyzer:
+        extra_sections.append(analyzer.metrics.summary_lines())
+        extra_sections.append(analyzer.boilerplate.summary_lines())
+    write_reports(results, date_str, config, mode_label, args.generate_sql, extra_sections, timer)
 
 if __name__ == "__main__":
     asyncio.run(main())
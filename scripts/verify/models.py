@@ -2,6 +2,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
+# PostcodeLookup lives with the lookup code so discover (which has its own
+# models.py) can import it; re-exported here for the verify modules.
+from postcode import PostcodeLookup  # noqa: F401
+
 
 class FieldStatus(Enum):
     MATCH = "MATCH"
@@ -59,16 +63,6 @@ class ListingVerification:
     notes: str = ""
 
 
-@dataclass
-class PostcodeLookup:
-    postcode: str
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
-    region: Optional[str] = None
-    admin_district: Optional[str] = None
-    valid: bool = False
-
-
 # Fields to verify for each listing
 VERIFY_FIELDS = [
     "operator",
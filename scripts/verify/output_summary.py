@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from models import Confidence, FieldStatus, ListingVerification, VERIFY_FIELDS
 
@@ -8,8 +9,13 @@ def generate_summary(
     date_str: str,
     output_dir: Path,
     mode: str = "TEST",
+    extra_sections: Optional[list[list[str]]] = None,
 ) -> Path:
-    """Generate verification_summary_{date}.txt with human-readable overview."""
+    """
+    Generate verification_summary_{date}.txt with human-readable overview.
+    `extra_sections` are pre-formatted run statistics blocks (LLM cache etc.)
+    written after the confidence breakdown.
+    """
     filepath = output_dir / f"verification_summary_{date_str}.txt"
 
     total = len(results)
@@ -141,6 +147,10 @@ def generate_summary(
     lines.append(f"  LOW:    {low}")
     lines.append("")
 
+    for section in extra_sections or []:
+        lines.extend(section)
+        lines.append("")
+
     # Per-listing details
     lines.append("-" * 60)
     lines.append("LISTING DETAILS:")
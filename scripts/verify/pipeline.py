@@ -0,0 +1,373 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable, Optional
+
+from analysis_store import AnalysisStore, crawl_fingerprints
+from analyzer import PROMPT_VERSION
+from boilerplate import BoilerplateStripper
+from browser_pool import BrowserPool
+from content_selector import build_query, estimate_tokens, select_relevant
+from config import Config
+from crawl_cache import CrawlCache
+from models import CrawlResult, FieldStatus, ListingVerification, PostcodeLookup
+from crawler import crawl_listing, create_rate_limiter
+from postcode import lookup_postcode
+from rate_limiter import DomainRateLimiter
+from comparator import compare_listing
+from enrichment import suggest_enrichments
+from llm_batch import MessageBatchRunner
+from timing import StageTimer, span
+
+
+# Marks the end of a stage's input queue (one per downstream worker)
+_STOP = object()
+
+
+@dataclass
+class ListingJob:
+    """A listing moving through the pipeline, accumulating each stage's output."""
+    index: int
+    listing: dict
+    crawl_results: list[CrawlResult] = field(default_factory=list)
+    postcode_data: Optional[PostcodeLookup] = None
+    llm_analysis: Optional[dict] = None
+    # (content, name, area) awaiting a Message Batches submission (--llm-batch)
+    llm_input: Optional[tuple[str, str, str]] = None
+    verification: Optional[ListingVerification] = None
+    error: Optional[Exception] = None
+
+
+# --- Stage functions (one per pipeline stage, see run_pipeline) ---
+
+async def lookup_listing_postcode(listing: dict) -> Optional[PostcodeLookup]:
+    """Look up the listing's postcode, if it has one."""
+    postcode = listing.get("postcode")
+    if not postcode:
+        return None
+    return await lookup_postcode(postcode)
+
+
+# Default listing prompt budget when no analyzer sets one (Config.llm_content_tokens)
+DEFAULT_CONTENT_TOKENS = 2000
+
+
+def listing_llm_input(
+    listing: dict,
+    crawl_results: list[CrawlResult],
+    budget_tokens: int = DEFAULT_CONTENT_TOKENS,
+    stripper: Optional[BoilerplateStripper] = None,
+) -> Optional[tuple[str, str, str]]:
+    """
+    (combined content, name, area) to analyze, or None if nothing was crawled.
+    Pages are first cleaned of their site's template by `stripper`; each
+    source then contributes its most relevant sections within an equal share
+    of `budget_tokens`. With a store-backed stripper (main.py) the result
+    only depends on the inputs and the templates stored before the run.
+    """
+    successful_crawls = [r for r in crawl_results if r.success and r.content]
+    if not successful_crawls:
+        return None
+
+    contents = [r.content for r in successful_crawls]
+    if stripper is not None:
+        for r in successful_crawls:
+            stripper.observe(r.url, r.content)
+        contents = [stripper.clean(r.url, r.content) for r in successful_crawls]
+
+    name, area = listing.get("name", "Unknown"), listing.get("area", "")
+    query = build_query(name, area)
+    headers = sum(estimate_tokens(f"Source: {r.url}\n\n\n---\n\n") for r in successful_crawls)
+    per_source = max(0, budget_tokens - headers) // len(successful_crawls)
+    combined_content = "\n\n---\n\n".join(
+        f"Source: {r.url}\n{select_relevant(content, query, per_source)}"
+        for r, content in zip(successful_crawls, contents)
+    )
+    return combined_content, name, area
+
+
+def _content_budget(analyzer) -> int:
+    return getattr(analyzer, "content_tokens", DEFAULT_CONTENT_TOKENS)
+
+
+def analyzer_llm_input(listing: dict, crawl_results: list[CrawlResult], analyzer) -> Optional[tuple[str, str, str]]:
+    """listing_llm_input() with the analyzer's token budget and boilerplate stripper."""
+    return listing_llm_input(
+        listing, crawl_results, _content_budget(analyzer), getattr(analyzer, "boilerplate", None),
+    )
+
+
+def _store_inputs(listing: dict, crawl_results: list[CrawlResult], analyzer) -> tuple[str, dict[str, str]]:
+    """(input key, source fingerprints) identifying what an analysis was made from."""
+    input_key = AnalysisStore.input_key(
+        analyzer.model, PROMPT_VERSION, listing.get("name", "Unknown"), listing.get("area", ""),
+    )
+    return input_key, crawl_fingerprints(crawl_results)
+
+
+def reuse_stored_analysis(
+    listing: dict,
+    crawl_results: list[CrawlResult],
+    analyzer,
+    store: Optional[AnalysisStore],
+) -> Optional[dict]:
+    """The listing's previous analysis if none of its sources changed, else None."""
+    if store is None:
+        return None
+    return store.lookup(listing.get("id", ""), *_store_inputs(listing, crawl_results, analyzer))
+
+
+def store_analysis(
+    listing: dict,
+    crawl_results: list[CrawlResult],
+    analyzer,
+    store: Optional[AnalysisStore],
+    llm_analysis: Optional[dict],
+) -> None:
+    if store is not None:
+        store.store(listing.get("id", ""), *_store_inputs(listing, crawl_results, analyzer), llm_analysis)
+
+
+async def analyze_listing(
+    listing: dict,
+    crawl_results: list[CrawlResult],
+    analyzer,
+    use_llm: bool,
+    store: Optional[AnalysisStore] = None,
+) -> Optional[dict]:
+    """
+    Run LLM analysis over the combined content of all successful crawls,
+    reusing the stored analysis when every source page is unchanged.
+    """
+    if not (use_llm and analyzer):
+        return None
+    llm_input = analyzer_llm_input(listing, crawl_results, analyzer)
+    if not llm_input:
+        return None
+
+    previous = reuse_stored_analysis(listing, crawl_results, analyzer, store)
+    if previous is not None:
+        return previous
+
+    combined_content, name, area = llm_input
+    if asyncio.iscoroutinefunction(analyzer.extract_development_info):
+        llm_analysis = await analyzer.extract_development_info(combined_content, name, area)
+    else:
+        # A blocking (sync Anthropic client) analyzer — keep it off the event loop
+        llm_analysis = await asyncio.to_thread(analyzer.extract_development_info, combined_content, name, area)
+    store_analysis(listing, crawl_results, analyzer, store, llm_analysis)
+    return llm_analysis
+
+
+def build_verification(
+    listing: dict,
+    crawl_results: list[CrawlResult],
+    llm_analysis: Optional[dict],
+    postcode_data: Optional[PostcodeLookup],
+    timer: Optional[StageTimer] = None,
+) -> ListingVerification:
+    """Compare stored vs found values and merge in enrichment suggestions."""
+    with span(timer, "compare"):
+        verification = compare_listing(listing, crawl_results, llm_analysis, postcode_data)
+    with span(timer, "enrichment"):
+        enrichments = suggest_enrichments(listing, llm_analysis, postcode_data)
+
+    # Only add if the field doesn't already have a GAP_FILLED comparison
+    existing_gap_fills = {
+        c.field_name for c in verification.field_comparisons
+        if c.status == FieldStatus.GAP_FILLED
+    }
+    for enrichment in enrichments:
+        if enrichment.field_name not in existing_gap_fills:
+            verification.field_comparisons.append(enrichment)
+
+    return verification
+
+
+def error_verification(listing: dict, error: Exception) -> ListingVerification:
+    """Minimal result recorded for a listing whose verification failed."""
+    return ListingVerification(
+        development_id=listing.get("id", ""),
+        development_name=listing.get("name", "Unknown"),
+        development_slug=listing.get("slug", ""),
+        area=listing.get("area", ""),
+        operator_name="",
+        asset_owner_name="",
+        website_url=listing.get("website_url"),
+        crawl_errors=[str(error)],
+        notes=f"Verification failed: {error}",
+    )
+
+
+# --- Concurrent pipeline ---
+
+async def _run_stage(
+    workers: int,
+    inbox: asyncio.Queue,
+    outbox: asyncio.Queue,
+    outbox_workers: int,
+    handler: Callable[[ListingJob], Awaitable[None]],
+) -> None:
+    """
+    Run `workers` consumers over `inbox`, forwarding every job to `outbox`.
+    Jobs that already failed upstream pass straight through. Once all workers
+    have stopped, one stop marker per downstream worker is sent on.
+    """
+    async def worker() -> None:
+        while True:
+            job = await inbox.get()
+            if job is _STOP:
+                return
+            if job.error is None:
+                try:
+                    await handler(job)
+                except Exception as e:
+                    job.error = e
+            await outbox.put(job)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    for _ in range(outbox_workers):
+        await outbox.put(_STOP)
+
+
+async def run_pipeline(
+    listings: Iterable[dict],
+    config: Config,
+    analyzer,
+    use_llm: bool,
+    pool: Optional[BrowserPool] = None,
+    limiter: Optional[DomainRateLimiter] = None,
+    cache: Optional[CrawlCache] = None,
+    batch_runner: Optional[MessageBatchRunner] = None,
+    on_result: Optional[Callable[[ListingJob], None]] = None,
+    store: Optional[AnalysisStore] = None,
+    timer: Optional[StageTimer] = None,
+) -> list[ListingVerification]:
+    """
+    Verify listings through a staged pipeline:
+
+      crawl -> postcode -> LLM analysis -> compare/enrich
+
+    Each stage is its own pool of asyncio workers (sized from config) joined
+    by bounded queues, so slow crawls no longer serialize postcode and LLM
+    latency behind them. Results are returned in input order, so reports are
+    identical to a sequential run. `listings` may be a lazy iterable such as
+    db.iter_listings(): it is drained on a worker thread as the crawl queue
+    has room, so verification starts on the first page while later pages
+    are still loading. Crawls borrow tabs from `pool` (one
+    shared browser for the run) and share one per-domain `limiter`, so
+    politeness holds across listings; pages in `cache` skip the browser.
+
+    With a `batch_runner` (--llm-batch), the LLM stage only collects prompts:
+    once every listing is crawled, all prompts go out as Message Batches and
+    the compare stage runs on the results. `on_result` is called as each listing
+    finishes (in completion order). Listings whose pages all fingerprint the
+    same as when `store` last saw them reuse that analysis instead of Claude.
+    Each stage's work per listing is timed in `timer` (a batch submission is
+    one "llm" span).
+    """
+    crawl_workers = max(1, config.crawl_workers)
+    postcode_workers = max(1, config.postcode_workers)
+    llm_workers = max(1, config.llm_workers)
+    compare_workers = max(1, config.compare_workers)
+
+    crawl_q: asyncio.Queue = asyncio.Queue(maxsize=crawl_workers * 2)
+    postcode_q: asyncio.Queue = asyncio.Queue(maxsize=postcode_workers * 2)
+    llm_q: asyncio.Queue = asyncio.Queue(maxsize=llm_workers * 2)
+    compare_q: asyncio.Queue = asyncio.Queue(maxsize=compare_workers * 2)
+
+    if limiter is None:
+        limiter = create_rate_limiter(config)
+
+    results: dict[int, ListingVerification] = {}
+
+    async def crawl(job: ListingJob) -> None:
+        job.crawl_results = await crawl_listing(job.listing, config, pool, limiter, cache, timer)
+
+    async def postcode(job: ListingJob) -> None:
+        with span(timer, "postcode"):
+            job.postcode_data = await lookup_listing_postcode(job.listing)
+
+    async def analyze(job: ListingJob) -> None:
+        if batch_runner is not None:
+            if use_llm and analyzer:
+                job.llm_input = analyzer_llm_input(job.listing, job.crawl_results, analyzer)
+                if job.llm_input is not None:
+                    job.llm_analysis = reuse_stored_analysis(job.listing, job.crawl_results, analyzer, store)
+                    if job.llm_analysis is not None:
+                        job.llm_input = None
+            return
+        with span(timer, "llm"):
+            job.llm_analysis = await analyze_listing(job.listing, job.crawl_results, analyzer, use_llm, store)
+
+    async def compare(job: ListingJob) -> None:
+        job.verification = build_verification(
+            job.listing, job.crawl_results, job.llm_analysis, job.postcode_data, timer,
+        )
+
+    async def finish(job: ListingJob) -> None:
+        # Final stage never raises: failures become minimal error results
+        if job.error is None:
+            try:
+                await compare(job)
+            except Exception as e:
+                job.error = e
+        if job.error is not None:
+            job.verification = error_verification(job.listing, job.error)
+        results[job.index] = job.verification
+        if on_result:
+            on_result(job)
+
+    async def feed() -> None:
+        try:
+            if isinstance(listings, (list, tuple)):
+                for i, listing in enumerate(listings):
+                    await crawl_q.put(ListingJob(index=i, listing=listing))
+            else:
+                # Lazy source (e.g. paged DB reads): fetch off the event loop
+                iterator = iter(listings)
+                i = 0
+                while (listing := await asyncio.to_thread(next, iterator, _STOP)) is not _STOP:
+                    await crawl_q.put(ListingJob(index=i, listing=listing))
+                    i += 1
+        finally:
+            for _ in range(crawl_workers):
+                await crawl_q.put(_STOP)
+
+    held: list[ListingJob] = []
+
+    async def compare_worker() -> None:
+        while True:
+            job = await compare_q.get()
+            if job is _STOP:
+                return
+            if batch_runner is not None and job.llm_input is not None and job.error is None:
+                held.append(job)
+                continue
+            await finish(job)
+
+    await asyncio.gather(
+        feed(),
+        _run_stage(crawl_workers, crawl_q, postcode_q, postcode_workers, crawl),
+        _run_stage(postcode_workers, postcode_q, llm_q, llm_workers, postcode),
+        _run_stage(llm_workers, llm_q, compare_q, compare_workers, analyze),
+        *(compare_worker() for _ in range(compare_workers)),
+    )
+
+    if held:
+        held.sort(key=lambda job: job.index)
+        try:
+            with span(timer, "llm"):
+                analyses = await analyzer.extract_batch(
+                    batch_runner, {f"listing-{job.index}": job.llm_input for job in held},
+                )
+        except Exception as e:
+            # Same as a failed single call: carry on without LLM analysis
+            print(f"    Message Batches error: {e} — continuing without LLM analysis")
+        else:
+            for job in held:
+                job.llm_analysis = analyses.get(f"listing-{job.index}")
+                store_analysis(job.listing, job.crawl_results, analyzer, store, job.llm_analysis)
+        for job in held:
+            await finish(job)
+
+    return [results[i] for i in sorted(results)]
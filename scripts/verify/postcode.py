@@ -1,12 +1,32 @@
+import asyncio
+import os
 import re
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 import httpx
 
-from models import PostcodeLookup
-
 POSTCODES_IO_BASE = "https://api.postcodes.io"
 
+
+def postcodes_io_base() -> str:
+    """postcodes.io base URL (POSTCODES_IO_URL overrides it, e.g. for a local stand-in)."""
+    return (os.getenv("POSTCODES_IO_URL") or POSTCODES_IO_BASE).rstrip("/")
+
+# postcodes.io accepts at most 100 postcodes per bulk lookup
+BULK_LOOKUP_LIMIT = 100
+
+
+@dataclass
+class PostcodeLookup:
+    postcode: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    region: Optional[str] = None
+    admin_district: Optional[str] = None
+    valid: bool = False
+
 # UK postcode area prefix -> BTR region mapping
 # Ported verbatim from scripts/lib/postcode-regions.ts
 POSTCODE_REGION_MAP: dict[str, str] = {
@@ -167,29 +187,254 @@ def map_ons_to_btr_region(ons_region: Optional[str], country: Optional[str]) ->
     return None
 
 
-async def lookup_postcode(postcode: str) -> PostcodeLookup:
-    """Look up a UK postcode via postcodes.io API. Returns coordinates and region."""
-    cleaned = postcode.strip().upper().replace(" ", "")
-    async with httpx.AsyncClient(timeout=10.0) as client:
+def _lookup_from_result(postcode: str, data: Optional[dict]) -> PostcodeLookup:
+    """Build a PostcodeLookup from a postcodes.io result object (None = invalid)."""
+    if not data:
+        return PostcodeLookup(postcode=postcode, valid=False)
+    region = map_ons_to_btr_region(
+        data.get("region"),
+        data.get("country"),
+    )
+    return PostcodeLookup(
+        postcode=data["postcode"],
+        latitude=data["latitude"],
+        longitude=data["longitude"],
+        region=region,
+        admin_district=data.get("admin_district"),
+        valid=True,
+    )
+
+
+class PostcodeService:
+    """
+    Shared postcodes.io client for verify and discover.
+
+    Concurrent lookups are coalesced: requests arriving within `batch_window`
+    seconds of each other are sent as one bulk POST /postcodes call (up to
+    100 postcodes), over a single pooled connection. Each distinct postcode
+    is looked up at most once per run; repeats share the first result.
+    Failed requests aren't remembered, so a later lookup retries.
+
+    Lookups are answered, in order, from the offline PostcodeIndex, the
+    persistent PostcodeCache (including cached "not found" results), and
+    only then postcodes.io. New postcodes.io answers are written back to
+    the cache.
+    """
+
+    def __init__(
+        self,
+        batch_window: float = 0.05,
+        batch_size: int = BULK_LOOKUP_LIMIT,
+        index=None,
+        cache=None,
+    ):
+        self.batch_window = batch_window
+        self.batch_size = max(1, min(batch_size, BULK_LOOKUP_LIMIT))
+        self._client: Optional[httpx.AsyncClient] = None
+        self._results: dict[str, asyncio.Future] = {}  # cleaned postcode -> result data
+        self._pending: list[str] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self.index = index  # Optional[postcode_index.PostcodeIndex]
+        self.cache = cache  # Optional[postcode_cache.PostcodeCache]
+
+        # Counters
+        self.lookups = 0
+        self.index_hits = 0
+        self.deduped = 0
+        self.requests = 0
+        self.failed_requests = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending:
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def lookup(self, postcode: str) -> PostcodeLookup:
+        """Look up one postcode (batched with any concurrent lookups)."""
+        return (await self.lookup_many([postcode]))[0]
+
+    async def lookup_many(self, postcodes: list[str]) -> list[PostcodeLookup]:
+        """Look up postcodes in bulk. Results are returned in input order."""
+        entries = []
+        for postcode in postcodes:
+            cleaned = postcode.strip().upper().replace(" ", "")
+            indexed = self.index.get(cleaned) if self.index is not None and cleaned else None
+            if indexed is not None:
+                self.lookups += 1
+                self.index_hits += 1
+                entries.append(indexed)
+            else:
+                entries.append(self._submit(cleaned))
+
+        results = []
+        for postcode, entry in zip(postcodes, entries):
+            if isinstance(entry, PostcodeLookup):
+                results.append(entry)
+            else:
+                results.append(_lookup_from_result(postcode, await asyncio.shield(entry)))
+        return results
+
+    def _submit(self, cleaned: str) -> asyncio.Future:
+        self.lookups += 1
+        future = self._results.get(cleaned)
+        if future is not None:
+            self.deduped += 1
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._results[cleaned] = future
+        if not cleaned:
+            future.set_result(None)
+            return future
+        if self.cache is not None:
+            hit, data = self.cache.get(cleaned)
+            if hit:
+                future.set_result(data)
+                return future
+
+        self._pending.append(cleaned)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Send everything queued so far as bulk requests."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        for i in range(0, len(pending), self.batch_size):
+            task = asyncio.ensure_future(self._send(pending[i : i + self.batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[str]) -> None:
+        self.requests += 1
+        found: dict[str, Optional[dict]] = {}
         try:
-            resp = await client.get(f"{POSTCODES_IO_BASE}/postcodes/{cleaned}")
-            if resp.status_code == 200:
-                data = resp.json()["result"]
-                region = map_ons_to_btr_region(
-                    data.get("region"),
-                    data.get("country"),
-                )
-                return PostcodeLookup(
-                    postcode=data["postcode"],
-                    latitude=data["latitude"],
-                    longitude=data["longitude"],
-                    region=region,
-                    admin_district=data.get("admin_district"),
-                    valid=True,
-                )
-            return PostcodeLookup(postcode=postcode, valid=False)
+            resp = await self._get_client().post(
+                f"{postcodes_io_base()}/postcodes",
+                json={"postcodes": batch},
+            )
+            resp.raise_for_status()
+            for item in resp.json().get("result") or []:
+                query = (item.get("query") or "").strip().upper().replace(" ", "")
+                found[query] = item.get("result")
         except Exception:
-            return PostcodeLookup(postcode=postcode, valid=False)
+            self.failed_requests += 1
+            for cleaned in batch:
+                future = self._results.pop(cleaned)
+                if not future.done():
+                    future.set_result(None)
+            return
+
+        if self.cache is not None:
+            self.cache.put_many({cleaned: found.get(cleaned) for cleaned in batch})
+        for cleaned in batch:
+            future = self._results[cleaned]
+            if not future.done():
+                future.set_result(found.get(cleaned))
+
+    def stats_line(self) -> str:
+        index = f"{self.index_hits} from offline index, " if self.index is not None else ""
+        return (
+            f"Postcode lookups: {self.lookups} lookup(s), {index}{self.deduped} deduplicated, "
+            f"{self.requests} bulk request(s), {self.failed_requests} failed"
+        )
+
+
+_service: Optional[PostcodeService] = None
+_service_loop: Optional[asyncio.AbstractEventLoop] = None
+_index_path: Optional[Path] = None
+_index = None
+_cache = None
+
+
+def configure_postcode_service(
+    index_path: Optional[Path] = None,
+    cache_path: Optional[Path] = None,
+    cache_mode: str = "use",
+    cache_ttl_hours: float = 24.0 * 30,
+    cache_negative_ttl_hours: float = 24.0 * 7,
+) -> None:
+    """
+    Set options for the shared service before the first lookup. `index_path`
+    enables the offline index (postcode_index.py) if the file exists;
+    `cache_path` enables the persistent result cache (postcode_cache.py).
+    """
+    global _index_path, _index, _cache
+    _index_path = Path(index_path) if index_path else None
+    _index = None
+    if _cache is not None:
+        _cache.close()
+    _cache = None
+    if cache_path:
+        from postcode_cache import PostcodeCache
+
+        _cache = PostcodeCache(cache_path, cache_mode, cache_ttl_hours, cache_negative_ttl_hours)
+
+
+def _load_index():
+    global _index, _index_path
+    if _index is None and _index_path is not None and _index_path.exists():
+        from postcode_index import PostcodeIndex
+
+        try:
+            _index = PostcodeIndex(_index_path)
+        except (OSError, ValueError) as e:
+            print(f"  Warning: Could not open postcode index {_index_path}: {e}")
+            _index_path = None
+    return _index
+
+
+def get_postcode_service() -> PostcodeService:
+    """Return the shared service for the running event loop."""
+    global _service, _service_loop
+    loop = asyncio.get_running_loop()
+    if _service is None or _service_loop is not loop:
+        _service = PostcodeService(index=_load_index(), cache=_cache)
+        _service_loop = loop
+    return _service
+
+
+async def close_postcode_service() -> None:
+    """Close the shared service's connection pool (call once at the end of a run)."""
+    global _service, _service_loop
+    if _service is not None:
+        await _service.close()
+    if _cache is not None:
+        _cache.close()
+    _service = None
+    _service_loop = None
+
+
+async def lookup_postcode(postcode: str) -> PostcodeLookup:
+    """Look up a UK postcode via postcodes.io API. Returns coordinates and region."""
+    return await get_postcode_service().lookup(postcode)
+
+
+async def lookup_postcodes(postcodes: list[str]) -> list[PostcodeLookup]:
+    """Look up many UK postcodes via postcodes.io bulk API, in input order."""
+    return await get_postcode_service().lookup_many(postcodes)
 
 
 def normalize_postcode(postcode: Optional[str]) -> str:
@@ -0,0 +1,116 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from crawl_cache import CACHE_MODES
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS postcodes (
+    postcode   TEXT PRIMARY KEY,  -- uppercase, no spaces
+    result     TEXT,              -- postcodes.io result JSON, NULL if invalid
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class PostcodeCache:
+    """
+    Persistent SQLite cache of postcodes.io results, shared by verify and
+    discover (default scripts/output/postcode_cache.sqlite).
+
+    Valid results are kept for `ttl_hours`. Postcodes that postcodes.io
+    reported as not found are cached as negative entries for
+    `negative_ttl_hours`, so the same typos aren't re-queried every run.
+    Request failures (network errors, 5xx) are never cached.
+
+    Modes match the crawl cache: "use", "refresh" (ignore entries, store new
+    results) and "bypass" (no reads or writes).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        mode: str = "use",
+        ttl_hours: float = 24.0 * 30,
+        negative_ttl_hours: float = 24.0 * 7,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}' (expected one of {', '.join(CACHE_MODES)})")
+        self.path = Path(path)
+        self.mode = mode
+        self.ttl_seconds = ttl_hours * 3600
+        self.negative_ttl_seconds = negative_ttl_hours * 3600
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Counters
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, postcode: str) -> tuple[bool, Optional[dict]]:
+        """
+        Return (hit, result) for a cleaned postcode. A hit with a None result
+        is a cached "not found".
+        """
+        if self.mode != "use":
+            return False, None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT result, fetched_at FROM postcodes WHERE postcode = ?", (postcode,),
+            ).fetchone()
+            if row is not None:
+                result, fetched_at = row
+                ttl = self.ttl_seconds if result is not None else self.negative_ttl_seconds
+                if time.time() - fetched_at < ttl:
+                    if result is None:
+                        self.negative_hits += 1
+                        return True, None
+                    self.hits += 1
+                    return True, json.loads(result)
+            self.misses += 1
+        return False, None
+
+    def put_many(self, results: dict[str, Optional[dict]]) -> None:
+        """Store {cleaned postcode: postcodes.io result or None (not found)}."""
+        if self.mode == "bypass" or not results:
+            return
+        now = time.time()
+        rows = [
+            (postcode, json.dumps(result) if result is not None else None, now)
+            for postcode, result in results.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO postcodes (postcode, result, fetched_at) VALUES (?, ?, ?)", rows,
+            )
+            conn.commit()
+            self.stores += len(rows)
+
+    def stats_line(self) -> str:
+        if self.mode == "bypass":
+            return "Postcode cache: bypassed"
+        return (
+            f"Postcode cache ({self.mode}): {self.hits} hit(s), {self.negative_hits} negative hit(s), "
+            f"{self.misses} miss(es), {self.stores} stored"
+        )
@@ -0,0 +1,226 @@
+"""
+Offline postcode index built from an ONS Postcode Directory (ONSPD) style CSV.
+
+The index is a single file of fixed-width records sorted by normalized
+postcode, memory-mapped and binary-searched, so a lookup costs a few page
+reads and no network. lookup_postcode() consults it before postcodes.io
+when one is configured (POSTCODE_INDEX, default scripts/output/postcode_index.bin).
+
+Build it once per ONSPD release (quarterly):
+
+  python scripts/verify/postcode_index.py ONSPD_FEB_2026_UK.csv
+  python scripts/verify/postcode_index.py ONSPD.csv --output /data/postcode_index.bin
+
+File layout (little-endian):
+  header   magic "BTRPCIX1", record count (u32), string table offset (u64)
+  records  postcode (8 bytes, uppercase, no spaces, space-padded),
+           latitude and longitude (i32 microdegrees),
+           region index (u8), admin district index (u16)
+  strings  JSON {"regions": [...], "admin_districts": [...]}
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from postcode import PostcodeLookup, map_ons_to_btr_region
+
+MAGIC = b"BTRPCIX1"
+HEADER = struct.Struct("<8sIQ")
+RECORD = struct.Struct("<8siiBH")
+KEY_SIZE = 8
+NO_VALUE = 0  # index 0 in each string table is the empty string
+
+# ONS region/country codes (ONSPD "rgn"/"ctry" columns) -> BTR region names
+ONS_REGION_CODES: dict[str, str] = {
+    "E12000001": "North East",
+    "E12000002": "North West",
+    "E12000003": "Yorkshire and The Humber",
+    "E12000004": "East Midlands",
+    "E12000005": "West Midlands",
+    "E12000006": "East of England",
+    "E12000007": "London",
+    "E12000008": "South East",
+    "E12000009": "South West",
+    "S92000003": "Scotland",
+    "W92000004": "Wales",
+    "N92000002": "Northern Ireland",
+}
+
+# Accepted column names, in order of preference (ONSPD first, then postcodes.io-style)
+COLUMNS: dict[str, tuple[str, ...]] = {
+    "postcode": ("pcds", "pcd", "pcd2", "postcode"),
+    "latitude": ("lat", "latitude"),
+    "longitude": ("long", "lng", "longitude"),
+    "region": ("rgn", "region"),
+    "country": ("ctry", "country"),
+    "admin_district": ("oslaua", "lad", "laua", "admin_district"),
+    "terminated": ("doterm",),
+}
+
+
+def _index_key(postcode: str) -> bytes:
+    return postcode.strip().upper().replace(" ", "").encode("ascii", "replace")[:KEY_SIZE].ljust(KEY_SIZE)
+
+
+def _format_postcode(cleaned: str) -> str:
+    """"M11AA" -> "M1 1AA" (the inward code is always the last three characters)."""
+    return f"{cleaned[:-3]} {cleaned[-3:]}" if len(cleaned) > 3 else cleaned
+
+
+def _resolve_columns(fieldnames: list[str]) -> dict[str, Optional[str]]:
+    lowered = {name.strip().lower(): name for name in fieldnames}
+    return {
+        column: next((lowered[c] for c in candidates if c in lowered), None)
+        for column, candidates in COLUMNS.items()
+    }
+
+
+def _region_name(region: str, country: str) -> Optional[str]:
+    return (
+        ONS_REGION_CODES.get(region)
+        or ONS_REGION_CODES.get(country)
+        or map_ons_to_btr_region(region or None, country or None)
+    )
+
+
+def build_postcode_index(csv_path: Path, output_path: Path) -> int:
+    """
+    Build an index file from an ONSPD-style CSV. Terminated postcodes and rows
+    without coordinates are skipped. Returns the number of postcodes indexed.
+    """
+    regions: dict[str, int] = {"": NO_VALUE}
+    districts: dict[str, int] = {"": NO_VALUE}
+    rows: dict[bytes, tuple[int, int, int, int]] = {}
+
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        columns = _resolve_columns(reader.fieldnames or [])
+        missing = [c for c in ("postcode", "latitude", "longitude") if not columns[c]]
+        if missing:
+            raise ValueError(f"{csv_path}: missing column(s) for {', '.join(missing)}")
+
+        def value(row: dict, column: str) -> str:
+            name = columns[column]
+            return (row.get(name) or "").strip() if name else ""
+
+        for row in reader:
+            if value(row, "terminated"):
+                continue
+            try:
+                lat = float(value(row, "latitude"))
+                lng = float(value(row, "longitude"))
+            except ValueError:
+                continue
+            # ONSPD marks postcodes with no grid reference as 99.999999/0.000000
+            if not -90 <= lat <= 90 or (lat == 0 and lng == 0):
+                continue
+            key = _index_key(value(row, "postcode"))
+            if not key.strip():
+                continue
+
+            region = _region_name(value(row, "region"), value(row, "country")) or ""
+            district = value(row, "admin_district")
+            region_idx = regions.setdefault(region, len(regions))
+            district_idx = districts.setdefault(district, len(districts))
+            rows[key] = (round(lat * 1_000_000), round(lng * 1_000_000), region_idx, district_idx)
+
+    if len(regions) > 0xFF or len(districts) > 0xFFFF:
+        raise ValueError(f"{csv_path}: too many distinct regions/districts for the index format")
+
+    strings = json.dumps({"regions": list(regions), "admin_districts": list(districts)}).encode("utf-8")
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(rows), HEADER.size + len(rows) * RECORD.size))
+        for key in sorted(rows):
+            f.write(RECORD.pack(key, *rows[key]))
+        f.write(strings)
+    os.replace(tmp_path, output_path)
+    return len(rows)
+
+
+class PostcodeIndex:
+    """Read-only, memory-mapped view of an index built by build_postcode_index()."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self.count, strings_offset = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a postcode index")
+            strings = json.loads(self._mm[strings_offset:].decode("utf-8"))
+        except Exception:
+            self.close()
+            raise
+        self._regions: list[str] = strings["regions"]
+        self._districts: list[str] = strings["admin_districts"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def _key_at(self, i: int) -> bytes:
+        offset = HEADER.size + i * RECORD.size
+        return self._mm[offset : offset + KEY_SIZE]
+
+    def get(self, postcode: str) -> Optional[PostcodeLookup]:
+        """
+        Return the indexed postcode, or None if it isn't in the index (which
+        may just mean it is newer than the ONSPD release the index was built from).
+        """
+        key = _index_key(postcode)
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo >= self.count or self._key_at(lo) != key:
+            return None
+
+        _, lat, lng, region_idx, district_idx = RECORD.unpack_from(self._mm, HEADER.size + lo * RECORD.size)
+        return PostcodeLookup(
+            postcode=_format_postcode(key.decode("ascii").strip()),
+            latitude=lat / 1_000_000,
+            longitude=lng / 1_000_000,
+            region=self._regions[region_idx] or None,
+            admin_district=self._districts[district_idx] or None,
+            valid=True,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the offline postcode index from an ONSPD CSV")
+    parser.add_argument("csv", type=Path, help="ONS Postcode Directory CSV (or any CSV with postcode/lat/long columns)")
+    parser.add_argument(
+        "--output", type=Path,
+        default=Path(__file__).resolve().parent.parent / "output" / "postcode_index.bin",
+        help="Index file to write (default: scripts/output/postcode_index.bin)",
+    )
+    args = parser.parse_args()
+
+    count = build_postcode_index(args.csv, args.output)
+    size_mb = args.output.stat().st_size / (1024 * 1024)
+    print(f"Indexed {count} postcode(s) -> {args.output} ({size_mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
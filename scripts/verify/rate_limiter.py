@@ -0,0 +1,84 @@
+import asyncio
+from typing import Optional
+
+
+def parse_domain_delays(spec: str) -> dict[str, float]:
+    """
+    Parse per-domain delay overrides, e.g. "rightmove.co.uk=10, btrnews.co.uk=4".
+    Malformed entries are ignored.
+    """
+    delays: dict[str, float] = {}
+    for entry in spec.split(","):
+        domain, sep, value = entry.partition("=")
+        domain = domain.strip().lower().replace("www.", "")
+        if not sep or not domain:
+            continue
+        try:
+            delays[domain] = max(0.0, float(value))
+        except ValueError:
+            continue
+    return delays
+
+
+class DomainRateLimiter:
+    """
+    Per-host token bucket for crawl politeness.
+
+    Each domain gets its own bucket refilled at one token per `delay` seconds
+    (capacity `burst`), so requests to unrelated hosts proceed in parallel
+    while any single host still sees the configured spacing. Buckets are
+    keyed on the caller's get_domain() result; an override for a domain
+    also applies to its subdomains.
+    """
+
+    def __init__(
+        self,
+        default_delay: float,
+        overrides: Optional[dict[str, float]] = None,
+        burst: int = 1,
+    ):
+        self.default_delay = max(0.0, default_delay)
+        self.overrides = overrides or {}
+        self.burst = max(1, burst)
+        # Theoretical arrival time per domain (GCRA form of a token bucket)
+        self._tat: dict[str, float] = {}
+
+        # Counters
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def delay_for(self, domain: str) -> float:
+        """Return the configured delay for a domain (most specific override wins)."""
+        labels = domain.split(".")
+        for i in range(len(labels) - 1):
+            override = self.overrides.get(".".join(labels[i:]))
+            if override is not None:
+                return override
+        return self.default_delay
+
+    async def acquire(self, domain: str) -> None:
+        """Wait until `domain` has a token available, then consume it."""
+        self.requests += 1
+        interval = self.delay_for(domain)
+        if interval <= 0:
+            return
+
+        # Reserve the slot before sleeping so concurrent callers queue up
+        # behind each other rather than all waking at once.
+        now = asyncio.get_running_loop().time()
+        tat = max(self._tat.get(domain, now), now)
+        start = max(now, tat - (self.burst - 1) * interval)
+        self._tat[domain] = tat + interval
+
+        wait = start - now
+        if wait > 0:
+            self.throttled += 1
+            self.total_wait += wait
+            await asyncio.sleep(wait)
+
+    def stats_line(self) -> str:
+        return (
+            f"Rate limiter: {self.requests} request(s) across {len(self._tat)} domain(s), "
+            f"{self.throttled} throttled ({self.total_wait:.1f}s total wait)"
+        )
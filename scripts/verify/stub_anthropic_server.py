@@ -0,0 +1,279 @@
+"""
+Local stand-in for the Anthropic Messages and Message Batches APIs.
+
+Lets the --llm-batch path (and plain Messages calls) run fully offline:
+
+  python scripts/verify/stub_anthropic_server.py --port 8765 --batch-seconds 3
+  ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=stub \\
+      python scripts/verify/main.py --test --llm-batch
+
+Replies are canned: discover prompts get {"developments": []}, verify prompts
+get the listing name back. Pass --reply-file to serve a fixed JSON reply.
+
+For load tests, --latency/--latency-jitter delay each Messages reply and
+--rate-limit-rate answers that fraction of Messages calls with a 429
+(with a retry-after header), so the SDK's retry path is exercised.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def default_reply(prompt: str) -> str:
+    """A minimal valid extraction for either tool's prompt."""
+    if '"developments"' in prompt:
+        return json.dumps({"developments": []})
+    match = re.search(r'development called "(.+?)"', prompt)
+    if match:
+        return json.dumps({"name": match.group(1), "name_confidence": "HIGH"})
+    return "{}"
+
+
+class StubState:
+    """Shared state for the stub server (batches in memory)."""
+
+    def __init__(
+        self,
+        batch_seconds: float = 2.0,
+        reply: Optional[str] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        reply_fn: Optional[Callable[[str], str]] = None,
+        seed: Optional[int] = None,
+    ):
+        self.batch_seconds = batch_seconds
+        self.reply = reply
+        self.latency = max(0.0, latency)
+        self.latency_jitter = max(0.0, latency_jitter)
+        self.rate_limit_rate = min(max(0.0, rate_limit_rate), 1.0)
+        self.retry_after = max(0.0, retry_after)
+        self.reply_fn = reply_fn or default_reply
+        self.lock = threading.Lock()
+        self.batches: dict[str, dict] = {}
+        self._random = random.Random(seed)
+
+        # Counters
+        self.messages_served = 0
+        self.rate_limited = 0
+        self.batch_requests = 0
+
+    def reply_for(self, prompt: str) -> str:
+        return self.reply if self.reply is not None else self.reply_fn(prompt)
+
+    def should_rate_limit(self) -> bool:
+        """Whether to answer this Messages call with a 429 (counted)."""
+        with self.lock:
+            limited = self._random.random() < self.rate_limit_rate
+            if limited:
+                self.rate_limited += 1
+            return limited
+
+    def reply_delay(self) -> float:
+        with self.lock:
+            return self.latency + self._random.uniform(0.0, self.latency_jitter)
+
+    def message(self, params: dict) -> dict:
+        prompt = "".join(
+            m.get("content", "") if isinstance(m.get("content"), str) else ""
+            for m in params.get("messages", [])
+        )
+        text = self.reply_for(prompt)
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": params.get("model", "stub"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {
+                "input_tokens": max(1, len(prompt) // 4),
+                "output_tokens": max(1, len(text) // 4),
+            },
+        }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state: StubState  # set on the server class by create_stub_server
+
+    def log_message(self, format, *args):  # noqa: A002 - silence default access log
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _batch_payload(self, batch: dict) -> dict:
+        ended = time.time() >= batch["ends_at"]
+        count = len(batch["requests"])
+        host = self.headers.get("Host", "127.0.0.1")
+        return {
+            "id": batch["id"],
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": _iso(batch["created_at"]),
+            "expires_at": _iso(batch["created_at"] + timedelta(days=1).total_seconds()),
+            "ended_at": _iso(batch["ends_at"]) if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"http://{host}/v1/messages/batches/{batch['id']}/results" if ended else None,
+        }
+
+    def do_POST(self):
+        state = self.state
+        if self.path.rstrip("/") == "/v1/messages":
+            params = self._read_json()
+            if state.should_rate_limit():
+                self._send_json(
+                    429,
+                    {"type": "error", "error": {"type": "rate_limit_error", "message": "Stub rate limit"}},
+                    headers={"retry-after": f"{state.retry_after:g}"},
+                )
+                return
+            delay = state.reply_delay()
+            if delay:
+                time.sleep(delay)
+            with state.lock:
+                state.messages_served += 1
+            self._send_json(200, state.message(params))
+            return
+
+        if self.path.rstrip("/") == "/v1/messages/batches":
+            body = self._read_json()
+            now = time.time()
+            batch = {
+                "id": f"msgbatch_{uuid.uuid4().hex[:24]}",
+                "requests": body.get("requests", []),
+                "created_at": now,
+                "ends_at": now + state.batch_seconds,
+            }
+            with state.lock:
+                state.batches[batch["id"]] = batch
+                state.batch_requests += len(batch["requests"])
+            self._send_json(200, self._batch_payload(batch))
+            return
+
+        self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+
+    def do_GET(self):
+        state = self.state
+        match = re.fullmatch(r"/v1/messages/batches/([\w-]+)(/results)?/?", self.path.split("?")[0])
+        batch = state.batches.get(match.group(1)) if match else None
+        if batch is None:
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+            return
+
+        if not match.group(2):
+            self._send_json(200, self._batch_payload(batch))
+            return
+
+        lines = []
+        for request in batch["requests"]:
+            lines.append(json.dumps({
+                "custom_id": request.get("custom_id"),
+                "result": {"type": "succeeded", "message": state.message(request.get("params", {}))},
+            }))
+        body = ("\n".join(lines) + "\n").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-jsonl")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    batch_seconds: float = 2.0,
+    reply: Optional[str] = None,
+    **options,
+) -> ThreadingHTTPServer:
+    """
+    Create (but don't start) a stub server. Port 0 picks a free port.
+    `options` are passed to StubState (latency, rate_limit_rate, reply_fn, ...).
+    """
+    handler = type("BoundStubHandler", (StubHandler,), {"state": StubState(batch_seconds, reply, **options)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_stub_server(**kwargs) -> tuple[ThreadingHTTPServer, str]:
+    """Start a stub server on a background thread. Returns (server, base_url)."""
+    server = create_stub_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stub of the Anthropic Messages/Batches API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--batch-seconds", type=float, default=2.0,
+                        help="Seconds before a submitted batch reports 'ended' (default: 2)")
+    parser.add_argument("--reply-file", type=str, help="Serve this file's contents as every reply")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds to wait before each Messages reply (default: 0)")
+    parser.add_argument("--latency-jitter", type=float, default=0.0,
+                        help="Extra random delay of up to this many seconds per reply")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of Messages calls answered with 429 (default: 0)")
+    parser.add_argument("--retry-after", type=float, default=1.0,
+                        help="retry-after seconds sent with 429 responses (default: 1)")
+    args = parser.parse_args()
+
+    reply = None
+    if args.reply_file:
+        with open(args.reply_file, encoding="utf-8") as f:
+            reply = f.read()
+
+    server = create_stub_server(
+        args.host, args.port, args.batch_seconds, reply,
+        latency=args.latency, latency_jitter=args.latency_jitter,
+        rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after,
+    )
+    print(f"Stub Anthropic API listening on http://{args.host}:{server.server_address[1]}")
+    print(f"  export ANTHROPIC_BASE_URL=http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from analysis_store import AnalysisStore, crawl_fingerprints, fingerprint_content
+from models import CrawlResult
+
+PAGE = """# Riverside Quarter
+Completion expected {completion}
+350 apartments to rent in Leeds
+We use cookies to improve your experience. Accept all
+Last updated {updated} at {time}
+"""
+
+
+def _page(completion="12 March 2025", updated="1 May 2025", time="09:15") -> str:
+    return PAGE.format(completion=completion, updated=updated, time=time)
+
+
+def _crawls(content: str) -> list[CrawlResult]:
+    return [CrawlResult(url="https://riverside.example/", success=True, status_code=200, content=content, title="Riverside Quarter")]
+
+
+def test_volatile_bits_keep_the_fingerprint():
+    assert fingerprint_content(_page()) == fingerprint_content(_page(updated="14 June 2025", time="17:40"))
+    assert fingerprint_content(_page()) == fingerprint_content(
+        _page().replace("We use cookies to improve your experience.", "This site uses cookies.")
+    )
+
+
+def test_content_changes_change_the_fingerprint():
+    assert fingerprint_content(_page()) != fingerprint_content(_page(completion="30 June 2026"))
+    assert fingerprint_content(_page()) != fingerprint_content(_page(completion="12/03/2025"))
+    with_cookie_units = "Accept cookies to see all 350 apartments"
+    assert fingerprint_content(with_cookie_units) != fingerprint_content(with_cookie_units.replace("350", "420"))
+
+
+def test_changed_completion_date_invalidates_stored_analysis(tmp_path):
+    store = AnalysisStore(tmp_path / "verify_state.sqlite")
+    key = AnalysisStore.input_key("model", "2", "Riverside Quarter", "Leeds")
+    analysis = {"name": "Riverside Quarter", "completion_date": "2025-03-12"}
+    store.store("dev-1", key, crawl_fingerprints(_crawls(_page())), analysis)
+
+    assert store.lookup("dev-1", key, crawl_fingerprints(_crawls(_page(updated="2 May 2025")))) == analysis
+    assert store.lookup("dev-1", key, crawl_fingerprints(_crawls(_page(completion="30 June 2026")))) is None
+    assert (store.reused, store.changed) == (1, 1)
+    store.close()
@@ -0,0 +1,64 @@
+import re
+
+import numpy as np
+
+from audit import OfflineAudit
+from output_sql import generate_sql_updates
+
+# LS1 4AP (Leeds) and a pin in central London
+LEEDS = (53.7965, -1.5478)
+LONDON = (51.5074, -0.1278)
+YORKSHIRE = "Yorkshire and The Humber"
+
+
+def _listing(i: int, postcode: str = "LS1 4AP", region: str = YORKSHIRE, pin=LEEDS) -> dict:
+    return {
+        "id": f"dev-{i}", "name": f"Development {i}", "area": "Leeds",
+        "postcode": postcode, "region": region, "latitude": pin[0], "longitude": pin[1],
+    }
+
+
+LISTINGS = [
+    _listing(1, postcode="ls14ap", region=""),      # postcode spacing (HIGH), region gap (MEDIUM)
+    _listing(2, region="London"),                   # region mismatch (LOW)
+    _listing(3, pin=(LEEDS[1], LEEDS[0])),          # swapped, and the swap lands on the postcode (MEDIUM)
+    _listing(4, pin=(LONDON[1], LONDON[0])),        # swapped, but not onto the postcode (LOW)
+    _listing(5, pin=LONDON),                        # far from the postcode centroid (LOW)
+    _listing(6, pin=(None, None)),                  # coordinates gap (HIGH)
+]
+
+
+def _sql_updates(tmp_path) -> dict[str, list[str]]:
+    """{development_id: SET clauses} from the generated SQL file."""
+    audit = OfflineAudit(geo_outlier_km=2.0)
+    results = audit.run(LISTINGS, centroids=np.array([LEEDS] * len(LISTINGS)))
+    sql = generate_sql_updates(results, "test", tmp_path).read_text(encoding="utf-8")
+    updates = {}
+    for block in re.findall(r"UPDATE developments SET\n(.*?)\nWHERE id = '([^']+)';", sql, re.S):
+        clauses, development_id = block
+        updates[development_id] = [c.strip().rstrip(",") for c in clauses.splitlines() if "updated_at" not in c]
+    return updates
+
+
+def test_only_unambiguous_fixes_reach_the_sql_file(tmp_path):
+    assert _sql_updates(tmp_path) == {
+        "dev-1": [f"region = '{YORKSHIRE}'", "postcode = 'LS1 4AP'"],
+        "dev-3": [f"latitude = {LEEDS[0]}", f"longitude = {LEEDS[1]}"],
+        "dev-6": [f"latitude = {LEEDS[0]}", f"longitude = {LEEDS[1]}"],
+    }
+
+
+def test_report_only_findings_are_low_without_a_value():
+    audit = OfflineAudit(geo_outlier_km=2.0)
+    results = audit.run(LISTINGS, centroids=np.array([LEEDS] * len(LISTINGS)))
+    findings = {
+        (v.development_id, c.field_name): c
+        for v in results for c in v.field_comparisons if c.status.value != "MATCH"
+    }
+
+    for key in (("dev-2", "region"), ("dev-4", "latitude"), ("dev-5", "latitude"), ("dev-5", "longitude")):
+        assert findings[key].confidence.value == "LOW", key
+    assert findings[("dev-4", "latitude")].found_value is None
+    assert findings[("dev-5", "latitude")].found_value is None
+    assert audit.counts["coordinates_far_from_postcode"] == 1
+    assert audit.counts["coordinates_swapped"] == 2
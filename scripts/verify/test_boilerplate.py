@@ -0,0 +1,60 @@
+import random
+
+from boilerplate import BoilerplateStripper
+from boilerplate_store import BoilerplateStore
+
+TEMPLATE = "[Home](https://op.example/)\nAccept cookies to continue\nFollow us on social media\n"
+
+
+def _page(i: int) -> tuple[str, str]:
+    return f"https://op.example/dev-{i}", f"{TEMPLATE}# Development {i}\n{100 + i} apartments to rent\n"
+
+
+def _run(store: BoilerplateStore, pages: list[tuple[str, str]]) -> dict[str, str]:
+    """Clean pages the way verify does: each listing observes and cleans its own pages."""
+    stripper = BoilerplateStripper()
+    stripper.use_store(store)
+    cleaned = {}
+    for url, markdown in pages:
+        stripper.observe(url, markdown)
+        cleaned[url] = stripper.clean(url, markdown)
+    return cleaned
+
+
+def test_first_run_learns_for_the_next(tmp_path):
+    store = BoilerplateStore(tmp_path / "boilerplate.sqlite")
+    pages = [_page(i) for i in range(4)]
+    first = _run(store, pages)
+    second = _run(store, pages)
+    store.close()
+
+    # Nothing is stripped until an earlier run has recorded the host's pages
+    assert "Accept cookies to continue" in first["https://op.example/dev-0"]
+    assert second["https://op.example/dev-0"] == "# Development 0\n100 apartments to rent"
+
+
+def test_cleaning_ignores_crawl_order_and_run_scope(tmp_path):
+    store = BoilerplateStore(tmp_path / "boilerplate.sqlite")
+    _run(store, [_page(i) for i in range(6)])
+
+    pages = [_page(i) for i in range(6, 12)]
+    in_order = _run(store, pages)
+    shuffled = pages[:]
+    random.Random(0).shuffle(shuffled)
+    assert _run(store, shuffled) == in_order
+    # A --name style run over one listing gets the same prompt content
+    assert _run(store, [pages[3]]) == {pages[3][0]: in_order[pages[3][0]]}
+    store.close()
+
+
+def test_changed_page_replaces_its_lines(tmp_path):
+    store = BoilerplateStore(tmp_path / "boilerplate.sqlite")
+    store.observe("op.example", "https://op.example/a", {"nav", "old footer"})
+    store.observe("op.example", "https://op.example/b", {"nav", "old footer"})
+    assert store.templates(2, 0.5) == {"op.example": {"nav", "old footer"}}
+
+    store.observe("op.example", "https://op.example/a", {"nav", "new footer"})
+    store.observe("op.example", "https://op.example/b", {"nav", "new footer"})
+    assert store.templates(2, 0.5) == {"op.example": {"nav", "new footer"}}
+    assert (store.pages_added, store.pages_changed) == (2, 2)
+    store.close()
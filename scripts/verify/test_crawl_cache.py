@@ -0,0 +1,89 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+
+from crawl_cache import CrawlCache
+
+
+class _Pool:
+    """BrowserPool stand-in: renders every URL as a fixed page and counts renders."""
+
+    def __init__(self):
+        self.rendered: list[str] = []
+
+    async def arun(self, url: str):
+        self.rendered.append(url)
+        return SimpleNamespace(
+            success=True, status_code=200, markdown=f"# Page {url}\n" + "x" * 1000,
+            metadata={"title": url}, response_headers={"ETag": '"v1"'},
+        )
+
+
+class _Limiter:
+    async def acquire(self, domain: str) -> None:
+        pass
+
+
+def _fetch(cache: CrawlCache, pool: _Pool, url: str):
+    return asyncio.run(cache.fetch(url, "example.com", pool, _Limiter()))
+
+
+def test_fresh_entries_are_served_without_rendering(tmp_path):
+    cache, pool = CrawlCache(tmp_path), _Pool()
+    _fetch(cache, pool, "https://www.example.com/a/")
+    page = _fetch(cache, pool, "https://example.com/a")
+
+    assert pool.rendered == ["https://www.example.com/a/"]
+    assert page.markdown.startswith("# Page https://www.example.com/a/")
+    assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+
+
+def _stale_cache(tmp_path, status_code: int, requests: list) -> tuple[CrawlCache, _Pool]:
+    cache, pool = CrawlCache(tmp_path, ttl_hours=0), _Pool()
+    _fetch(cache, pool, "https://example.com/a")
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code)
+
+    cache._client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    return cache, pool
+
+
+def test_stale_entry_revalidated_by_etag(tmp_path):
+    requests = []
+    cache, pool = _stale_cache(tmp_path, 304, requests)
+    before = time.time()
+    page = _fetch(cache, pool, "https://example.com/a")
+
+    assert [r.headers.get("If-None-Match") for r in requests] == ['"v1"']
+    assert pool.rendered == ["https://example.com/a"]
+    assert cache.revalidated == 1
+    assert page.validated_at >= before
+
+
+def test_changed_page_is_rendered_again(tmp_path):
+    requests = []
+    cache, pool = _stale_cache(tmp_path, 200, requests)
+    _fetch(cache, pool, "https://example.com/a")
+
+    assert len(requests) == 1
+    assert pool.rendered == ["https://example.com/a"] * 2
+    assert (cache.revalidated, cache.misses) == (0, 2)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache, pool = CrawlCache(tmp_path), _Pool()
+    _fetch(cache, pool, "https://example.com/a")
+    cache.max_bytes = int(cache._total_bytes * 2.5)
+    _fetch(cache, pool, "https://example.com/b")
+    _fetch(cache, pool, "https://example.com/a")  # hit: /a is now more recent than /b
+    _fetch(cache, pool, "https://example.com/c")
+
+    assert cache.evictions == 1
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+    _fetch(cache, pool, "https://example.com/a")
+    _fetch(cache, pool, "https://example.com/b")
+    assert pool.rendered == [f"https://example.com/{p}" for p in "abcb"]
@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import db
+from config import Config
+
+# The benchmark's SQLite PostgREST stand-in evaluates the same filter strings PostgREST does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmark"))
+from stub_postgrest_server import PostgrestStandIn  # noqa: E402
+from synthetic import generate_dataset  # noqa: E402
+
+
+class _Query:
+    """The slice of postgrest-py's request builder that iter_listings uses, sent to the stand-in."""
+
+    def __init__(self, standin: PostgrestStandIn, table: str):
+        self.standin, self.table, self.params = standin, table, []
+
+    def _add(self, key: str, value: str) -> "_Query":
+        self.params.append((key, value))
+        return self
+
+    def select(self, fields: str) -> "_Query":
+        return self._add("select", "".join(fields.split()))
+
+    def eq(self, column: str, value) -> "_Query":
+        return self._add(column, f"eq.{str(value).lower() if isinstance(value, bool) else value}")
+
+    def in_(self, column: str, values: list) -> "_Query":
+        return self._add(column, f"in.({','.join(values)})")
+
+    def or_(self, filters: str) -> "_Query":
+        return self._add("or", f"({filters})")
+
+    def order(self, column: str, desc: bool = False, nullsfirst: bool = False) -> "_Query":
+        return self._add("order", f"{column}{'.desc' if desc else ''}{'.nullsfirst' if nullsfirst else ''}")
+
+    def limit(self, count: int) -> "_Query":
+        return self._add("limit", str(count))
+
+    def execute(self) -> SimpleNamespace:
+        return SimpleNamespace(data=self.standin.select(self.table, self.params))
+
+
+def _listing_ids(monkeypatch, tmp_path, rows_per_page: int, mode: str = "all", test_limit: int = 20):
+    dataset = generate_dataset(23, seed=3)
+    # Nullable created_at: some rows have none, others share a timestamp
+    for i, row in enumerate(dataset.developments):
+        if i % 5 == 0:
+            row["created_at"] = None
+        elif i % 3 == 0:
+            row["created_at"] = "2025-01-01T00:00:00+00:00"
+    standin = PostgrestStandIn()
+    standin.seed(dataset)
+    client = SimpleNamespace(table=lambda name: _Query(standin, name))
+    monkeypatch.setattr(db, "create_supabase_client", lambda config: client)
+
+    config = Config(supabase_url="", supabase_service_key="", anthropic_api_key="", output_dir=tmp_path,
+                    test_limit=test_limit)
+    ids = [row["id"] for row in db.iter_listings(config, mode=mode, page_size=rows_per_page)]
+    published = [row for row in dataset.developments if row.get("is_published", True)]
+    # (created_at desc nulls first, id desc)
+    undated = sorted((row["id"] for row in published if row["created_at"] is None), reverse=True)
+    dated = [row["id"] for row in sorted(
+        (row for row in published if row["created_at"] is not None),
+        key=lambda row: (row["created_at"], row["id"]), reverse=True,
+    )]
+    return ids, undated + dated, standin
+
+
+def test_keyset_pages_cover_every_row_once(monkeypatch, tmp_path):
+    for rows_per_page in (1, 2, 4, 50):
+        ids, expected, standin = _listing_ids(monkeypatch, tmp_path, rows_per_page)
+        assert ids == expected
+        assert standin.requests == len(expected) // rows_per_page + 1
+
+
+def test_test_mode_stops_at_the_limit(monkeypatch, tmp_path):
+    ids, expected, _ = _listing_ids(monkeypatch, tmp_path, 4, mode="test", test_limit=7)
+    assert ids == expected[:7]
@@ -0,0 +1,52 @@
+from journal import VerificationJournal
+from models import Confidence, FieldComparison, FieldStatus, ListingVerification
+
+
+def _verification(i: int, units: str = "250") -> ListingVerification:
+    return ListingVerification(
+        f"dev-{i}", f"Development {i}", f"development-{i}", "Leeds", "Operator", "Owner", "https://example.com",
+        field_comparisons=[
+            FieldComparison("number_of_units", "200", units, FieldStatus.DISCREPANCY, Confidence.HIGH, "https://example.com"),
+            FieldComparison("postcode", "LS1 4AP", None, FieldStatus.NOT_FOUND, Confidence.LOW),
+        ],
+        dead_links=["https://example.com/old"],
+        sources_checked=2,
+        overall_confidence=Confidence.MEDIUM,
+    )
+
+
+def test_round_trip_keeps_every_field(tmp_path):
+    journal = VerificationJournal(tmp_path / "journal.jsonl")
+    journal.append(_verification(1))
+    journal.close()
+
+    assert VerificationJournal(journal.path).results() == [_verification(1)]
+
+
+def test_resume_retries_failures_and_keeps_latest_entry(tmp_path):
+    journal = VerificationJournal(tmp_path / "journal.jsonl")
+    journal.append(_verification(1))
+    journal.append(_verification(2), failed=True)
+    journal.append(_verification(3))
+    journal.append(_verification(1, units="260"))
+    journal.close()
+
+    resumed = VerificationJournal(journal.path)
+    assert [v.development_id for v in resumed.completed()] == ["dev-1", "dev-3"]
+    assert resumed.completed()[0].field_comparisons[0].found_value == "260"
+    assert [v.development_id for v in resumed.results()] == ["dev-1", "dev-2", "dev-3"]
+
+
+def test_torn_final_line_is_skipped_and_appends_continue(tmp_path):
+    journal = VerificationJournal(tmp_path / "journal.jsonl")
+    journal.append(_verification(1))
+    journal.close()
+    # A crash mid-write leaves a partial line without a newline
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"failed": false, "verification": {"development_id": "dev-')
+
+    resumed = VerificationJournal(journal.path)
+    assert [v.development_id for v in resumed.completed()] == ["dev-1"]
+    resumed.append(_verification(2))
+    resumed.close()
+    assert [v.development_id for v in VerificationJournal(journal.path).completed()] == ["dev-1", "dev-2"]
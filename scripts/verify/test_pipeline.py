@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+from config import Config
+from models import ListingVerification
+from pipeline import run_pipeline
+from verify_state import VerificationState
+
+
+def _listing(i: int, **fields) -> dict:
+    # No website_url or operator: crawl_listing returns no URLs, so no browser is needed
+    return {"id": f"dev-{i}", "name": f"Development {i}", "slug": f"development-{i}", "area": "Leeds", **fields}
+
+
+def test_incremental_state_with_lazy_listings(tmp_path):
+    """
+    main.py filters listings with VerificationState.is_due() inside a lazy
+    generator, which run_pipeline drains on a worker thread, while results
+    are recorded on the event loop thread.
+    """
+    config = Config(supabase_url="", supabase_service_key="", anthropic_api_key="", output_dir=tmp_path)
+    state = VerificationState(tmp_path / "verify_state.sqlite")
+    # dev-0 was verified moments ago, so only dev-1..dev-4 are due
+    state.record(ListingVerification("dev-0", "Development 0", "development-0", "Leeds", "", "", None), now=time.time())
+
+    def due_listings():
+        for i in range(5):
+            listing = _listing(i)
+            if state.is_due(listing):
+                yield listing
+
+    recorded, errors = [], []
+
+    def on_result(job) -> None:
+        if job.error is not None:
+            errors.append(job.error)
+        state.record(job.verification)
+        recorded.append(job.verification.development_id)
+
+    try:
+        results = asyncio.run(run_pipeline(due_listings(), config, None, use_llm=False, on_result=on_result))
+    finally:
+        state.close()
+
+    assert [r.development_id for r in results] == ["dev-1", "dev-2", "dev-3", "dev-4"]
+    assert sorted(recorded) == ["dev-1", "dev-2", "dev-3", "dev-4"]
+    assert errors == []
+    assert (state.due_new, state.skipped_fresh) == (4, 1)
@@ -0,0 +1,54 @@
+from models import Confidence, FieldComparison, FieldStatus, ListingVerification
+from verify_state import VerificationState
+
+HOUR = 3600.0
+
+
+def _verification(units: str) -> ListingVerification:
+    return ListingVerification(
+        "dev-1", "Development 1", "development-1", "Leeds", "", "", None,
+        field_comparisons=[FieldComparison("number_of_units", "200", units, FieldStatus.DISCREPANCY, Confidence.HIGH)],
+    )
+
+
+def _ttl(state: VerificationState) -> float:
+    with state._lock:
+        return state._row("dev-1")[1]
+
+
+def test_ttl_grows_when_unchanged_and_halves_on_change(tmp_path):
+    state = VerificationState(tmp_path / "state.sqlite", initial_ttl_hours=40, min_ttl_hours=10, max_ttl_hours=100)
+    try:
+        state.record(_verification("250"), now=1000.0)
+        assert _ttl(state) == 40
+        state.record(_verification("250"), now=2000.0)
+        assert _ttl(state) == 60
+        state.record(_verification("250"), now=3000.0)
+        assert _ttl(state) == 90
+        state.record(_verification("250"), now=4000.0)
+        assert _ttl(state) == 100  # clamped to max
+        state.record(_verification("260"), now=5000.0)
+        assert _ttl(state) == 50
+        for units in ("270", "280", "290"):
+            state.record(_verification(units), now=6000.0)
+        assert _ttl(state) == 10  # clamped to min
+        assert (state.unchanged, state.changed) == (3, 4)
+    finally:
+        state.close()
+
+
+def test_due_reasons(tmp_path):
+    state = VerificationState(tmp_path / "state.sqlite", initial_ttl_hours=48, min_ttl_hours=24, max_ttl_hours=96)
+    try:
+        now = 1_700_000_000.0
+        assert state.is_due({"id": "dev-1"}, now=now)  # never verified
+        state.record(_verification("250"), now=now)
+
+        assert not state.is_due({"id": "dev-1"}, now=now + 47 * HOUR)
+        assert state.is_due({"id": "dev-1"}, now=now + 48 * HOUR)  # TTL expired
+        assert state.is_due({"id": "dev-1", "updated_at": "2023-11-15T00:00:00Z"}, now=now + HOUR)  # edited since
+        # An admin verification later than ours restarts the TTL
+        assert not state.is_due({"id": "dev-1", "verified_at": "2023-11-16T00:00:00+00:00"}, now=now + 48 * HOUR)
+        assert (state.due_new, state.due_updated, state.due_expired, state.skipped_fresh) == (1, 1, 1, 2)
+    finally:
+        state.close()
@@ -0,0 +1,131 @@
+import json
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Optional
+
+# Histogram bucket upper bounds in seconds (the last bucket is open-ended)
+BUCKET_BOUNDS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def percentile(sorted_samples: list[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0-100) of already sorted samples."""
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def histogram(samples: list[float]) -> dict:
+    """Count, total, p50/p95/p99/max and bucket counts for one set of durations."""
+    ordered = sorted(samples)
+    buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+    for seconds in ordered:
+        buckets[next((i for i, bound in enumerate(BUCKET_BOUNDS) if seconds <= bound), len(BUCKET_BOUNDS))] += 1
+    labels = [f"<={bound}s" for bound in BUCKET_BOUNDS] + [f">{BUCKET_BOUNDS[-1]}s"]
+    return {
+        "count": len(ordered),
+        "total": round(sum(ordered), 3),
+        "p50": _round(percentile(ordered, 50)),
+        "p95": _round(percentile(ordered, 95)),
+        "p99": _round(percentile(ordered, 99)),
+        "max": _round(ordered[-1] if ordered else None),
+        "buckets": {label: count for label, count in zip(labels, buckets) if count},
+    }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+class StageTimer:
+    """
+    Wall-clock timing spans per pipeline stage (and per domain where a
+    stage talks to one), aggregated at run end into p50/p95/p99 histograms.
+
+    Used by verify (fetch, crawl, postcode, llm, compare, enrichment,
+    output; audit for --audit-offline) and discover (search, crawl, llm, dedupe, postcode, db_check,
+    output), so a slow run shows whether Chromium, Claude or postcodes.io
+    was the cause. Spans in concurrent tasks overlap, so stage totals can
+    exceed the run's elapsed time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: dict[str, list[float]] = defaultdict(list)
+        self._domains: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+        self.started = time.time()
+
+    def record(self, stage: str, seconds: float, domain: Optional[str] = None) -> None:
+        with self._lock:
+            self._stages[stage].append(seconds)
+            if domain:
+                self._domains[stage][domain].append(seconds)
+
+    @contextmanager
+    def span(self, stage: str, domain: Optional[str] = None):
+        """Time the enclosed block (sync or async code) as one sample of `stage`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started, domain)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            stages = {stage: list(samples) for stage, samples in self._stages.items()}
+            domains = {
+                stage: {domain: list(samples) for domain, samples in by_domain.items()}
+                for stage, by_domain in self._domains.items()
+            }
+        return {
+            "started_at": self.started,
+            "elapsed_seconds": round(time.time() - self.started, 3),
+            "stages": {stage: histogram(samples) for stage, samples in stages.items()},
+            "domains": {
+                stage: {domain: histogram(samples) for domain, samples in sorted(by_domain.items())}
+                for stage, by_domain in domains.items()
+            },
+        }
+
+    def write_json(self, filepath: Path) -> Path:
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return filepath
+
+    def summary_lines(self, top_domains: int = 5) -> list[str]:
+        """Lines for the run summary's STAGE TIMINGS table."""
+        data = self.to_dict()
+        lines = ["STAGE TIMINGS (seconds):"]
+        if not data["stages"]:
+            lines.append("  No stages timed")
+            return lines
+
+        lines.append(f"  {'Stage':<12} {'Count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'Max':>8} {'Total':>9}")
+        for stage, h in data["stages"].items():
+            lines.append(
+                f"  {stage:<12} {h['count']:>6} {h['p50']:>8.3f} {h['p95']:>8.3f} "
+                f"{h['p99']:>8.3f} {h['max']:>8.3f} {h['total']:>9.1f}"
+            )
+
+        for stage, by_domain in data["domains"].items():
+            slowest = sorted(by_domain.items(), key=lambda item: -item[1]["p95"])[:top_domains]
+            lines.append(f"  Slowest {stage} domains by p95:")
+            for domain, h in slowest:
+                lines.append(f"    {domain}: p50 {h['p50']:.3f}, p95 {h['p95']:.3f} ({h['count']} sample(s))")
+        return lines
+
+    def stats_line(self) -> str:
+        data = self.to_dict()["stages"]
+        parts = [f"{stage} p95 {h['p95']:.2f}s" for stage, h in data.items()]
+        return f"Stage timings: {', '.join(parts) if parts else 'none'}"
+
+
+def span(timer: Optional[StageTimer], stage: str, domain: Optional[str] = None):
+    """timer.span(), or a no-op when timing is off."""
+    return timer.span(stage, domain) if timer is not None else nullcontext()
@@ -0,0 +1,159 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from models import FieldStatus, ListingVerification
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listing_state (
+    development_id   TEXT PRIMARY KEY,
+    last_verified_at REAL NOT NULL,  -- unix time of the last automated verification
+    ttl_hours        REAL NOT NULL,  -- current re-verification interval
+    signature        TEXT NOT NULL,  -- hash of what the last visit found
+    unchanged_runs   INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Parse a PostgREST timestamptz string to unix time."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def verification_signature(verification: ListingVerification) -> str:
+    """
+    Hash of what a visit found on the listing's pages: each field's found
+    value and status, dead links and rebranding. Two visits with the same
+    signature saw the same facts, whatever changed in the page chrome.
+    """
+    parts = sorted(
+        f"{c.field_name}\x1f{c.found_value or ''}\x1f{c.status.value}"
+        for c in verification.field_comparisons
+        if c.status != FieldStatus.NOT_FOUND
+    )
+    parts += sorted(verification.dead_links)
+    parts.append(f"rebrand:{verification.rebranding_detected}")
+    return hashlib.sha256("\x1e".join(parts).encode("utf-8")).hexdigest()
+
+
+class VerificationState:
+    """
+    Local record of automated verifications, driving --incremental runs
+    (default scripts/output/verify_state.sqlite).
+
+    A listing is due when it has never been verified, was edited
+    (developments.updated_at) after its last verification, or its last
+    verification is older than its TTL. "Last verification" is the later of
+    our own record and the admin's developments.verified_at.
+
+    TTLs adapt per listing: halved when a visit finds different facts than
+    the previous one, grown by half when nothing changed, and clamped to
+    [min_ttl_hours, max_ttl_hours].
+
+    Safe to share between threads: main.py filters listings with is_due()
+    inside the listing generator, which the pipeline drains on a worker
+    thread, while record() runs on the event loop thread.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        initial_ttl_hours: float = 24.0 * 7,
+        min_ttl_hours: float = 24.0 * 2,
+        max_ttl_hours: float = 24.0 * 60,
+    ):
+        self.path = Path(path)
+        self.min_ttl_hours = min_ttl_hours
+        self.max_ttl_hours = max(min_ttl_hours, max_ttl_hours)
+        self.initial_ttl_hours = min(max(initial_ttl_hours, self.min_ttl_hours), self.max_ttl_hours)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+        # Counters
+        self.due_new = 0
+        self.due_updated = 0
+        self.due_expired = 0
+        self.skipped_fresh = 0
+        self.changed = 0
+        self.unchanged = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _row(self, development_id: str) -> Optional[tuple[float, float, str, int]]:
+        """The listing's stored state (call with the lock held)."""
+        return self._conn.execute(
+            "SELECT last_verified_at, ttl_hours, signature, unchanged_runs "
+            "FROM listing_state WHERE development_id = ?",
+            (development_id,),
+        ).fetchone()
+
+    def is_due(self, listing: dict, now: Optional[float] = None) -> bool:
+        """Whether an --incremental run should verify this listing."""
+        now = now or time.time()
+        with self._lock:
+            return self._is_due(listing, now)
+
+    def _is_due(self, listing: dict, now: float) -> bool:
+        row = self._row(listing.get("id", ""))
+        admin_verified = _parse_timestamp(listing.get("verified_at"))
+        last_verified = max(filter(None, (row[0] if row else None, admin_verified)), default=None)
+
+        if last_verified is None:
+            self.due_new += 1
+            return True
+        updated = _parse_timestamp(listing.get("updated_at"))
+        if updated is not None and updated > last_verified:
+            self.due_updated += 1
+            return True
+        ttl_hours = row[1] if row else self.initial_ttl_hours
+        if now - last_verified >= ttl_hours * 3600:
+            self.due_expired += 1
+            return True
+        self.skipped_fresh += 1
+        return False
+
+    def record(self, verification: ListingVerification, now: Optional[float] = None) -> None:
+        """Record a completed verification and adapt the listing's TTL."""
+        now = now or time.time()
+        signature = verification_signature(verification)
+        with self._lock:
+            row = self._row(verification.development_id)
+            if row is None:
+                ttl_hours, unchanged_runs = self.initial_ttl_hours, 0
+            elif row[2] == signature:
+                ttl_hours, unchanged_runs = row[1] * 1.5, row[3] + 1
+                self.unchanged += 1
+            else:
+                ttl_hours, unchanged_runs = row[1] / 2, 0
+                self.changed += 1
+            ttl_hours = min(max(ttl_hours, self.min_ttl_hours), self.max_ttl_hours)
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listing_state "
+                "(development_id, last_verified_at, ttl_hours, signature, unchanged_runs) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (verification.development_id, now, ttl_hours, signature, unchanged_runs),
+            )
+            self._conn.commit()
+
+    def stats_line(self) -> str:
+        due = self.due_new + self.due_updated + self.due_expired
+        return (
+            f"Incremental: {due} due ({self.due_new} new, {self.due_updated} edited, "
+            f"{self.due_expired} TTL expired), {self.skipped_fresh} skipped as fresh; "
+            f"{self.changed} changed, {self.unchanged} unchanged since last visit"
+        )